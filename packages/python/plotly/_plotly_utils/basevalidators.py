@@ -1,7 +1,10 @@
 import base64
 import numbers
+import os
 import textwrap
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 from importlib import import_module
 import copy
 import io
@@ -51,6 +54,27 @@ def to_scalar_or_list(v):
         return v
 
 
+# When False, copy_to_readonly_numpy_array adopts numpy input arrays as
+# read-only views instead of copying them. See `adopt_arrays`.
+_copy_arrays = ContextVar("_copy_arrays", default=True)
+
+
+@contextmanager
+def adopt_arrays():
+    """
+    Context manager inside of which numpy arrays passed to validators are
+    adopted as read-only views rather than copied.
+
+    The resulting objects share memory with the input arrays, so the caller
+    must not modify those arrays in place after handing them over.
+    """
+    token = _copy_arrays.set(False)
+    try:
+        yield
+    finally:
+        _copy_arrays.reset(token)
+
+
 def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
     """
     Convert an array-like value into a read-only numpy array
@@ -137,10 +161,13 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
             new_v = np.ascontiguousarray(v.astype(dtype))
         else:
             # Either no kind was requested or requested kind is satisfied
-            new_v = np.ascontiguousarray(v.copy())
+            if _copy_arrays.get():
+                new_v = np.ascontiguousarray(v.copy())
+            else:
+                new_v = np.ascontiguousarray(v).view()
     else:
         # v is a non-numeric homogenous array
-        new_v = v.copy()
+        new_v = v.copy() if _copy_arrays.get() else v.view()
 
     # Handle force numeric param
     # --------------------------
@@ -1375,9 +1402,7 @@ class ColorValidator(BaseValidator):
                 # All good
                 pass
             else:
-                validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
-
-                invalid_els = self.find_invalid_els(v, validated_v)
+                validated_v, invalid_els = self.vc_array(v)
 
                 if invalid_els and should_raise:
                     self.raise_invalid_elements(invalid_els)
@@ -1432,6 +1457,60 @@ class ColorValidator(BaseValidator):
             v, allow_number=self.numbers_allowed()
         )
 
+    def vc_array(self, v):
+        """
+        Helper to validate/coerce the elements of a numpy array of colors.
+
+        Each unique color string is validated once and the results are
+        broadcast back to the shape of the input, so that the cost scales
+        with the number of distinct colors rather than the array length.
+
+        Returns
+        -------
+        (validated, invalid_els)
+            The validated elements, with None in place of invalid elements,
+            and the list of invalid input elements
+        """
+        np = get_module("numpy")
+
+        # Factorize the flattened array into unique values and integer
+        # codes. A hash table is used rather than np.unique, which would need
+        # to sort the (typically object dtype) array.
+        flat_v = v.ravel().tolist()
+        index = {}
+        try:
+            inverse = np.fromiter(
+                (index.setdefault(e, len(index)) for e in flat_v),
+                dtype=np.intp,
+                count=len(flat_v),
+            )
+        except TypeError:
+            # Unhashable elements (e.g. nested lists)
+            index = None
+
+        if index is None or not all(isinstance(u, str) for u in index):
+            validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
+            return validated_v, self.find_invalid_els(v, validated_v)
+
+        validated_list = [self.vc_scalar(u) for u in index]
+        invalid_uniques = np.array([u is None for u in validated_list])
+        if invalid_uniques.any() or self.numbers_allowed():
+            validated_uniques = np.empty(len(validated_list), dtype="object")
+            validated_uniques[:] = validated_list
+        else:
+            # Only strings remain, give the uniques a string dtype so that the
+            # broadcast array below already has it
+            validated_uniques = np.array(validated_list, dtype=str)
+        validated_v = validated_uniques[inverse].reshape(v.shape)
+
+        if invalid_uniques.any():
+            invalid_mask = invalid_uniques[inverse].reshape(v.shape)
+            invalid_els = v[invalid_mask].tolist()
+        else:
+            invalid_els = []
+
+        return validated_v, invalid_els
+
     @staticmethod
     def perform_validate_coerce(v, allow_number=None):
         """
@@ -2672,6 +2751,18 @@ class BaseDataValidator(BaseValidator):
 
         return self._class_map[trace_name]
 
+    @staticmethod
+    def _make_unvalidated_trace(trace_class, props):
+        # Passing _parent skips the generated constructor body, which looks up
+        # every property of the trace type, so only the properties present
+        # in props are set
+        trace = trace_class(_parent=None)
+        trace._validate = False
+        for k, v in props.items():
+            trace[k] = v
+        trace._props["type"] = trace.plotly_name
+        return trace
+
     def validate_coerce(self, v, skip_invalid=False, _validate=True):
         from plotly.basedatatypes import BaseTraceType
 
@@ -2709,6 +2800,11 @@ class BaseDataValidator(BaseValidator):
                         else:
                             res.append(None)
                             invalid_els.append(v_el)
+                    elif not _validate:
+                        trace = self._make_unvalidated_trace(
+                            self.get_trace_class(trace_type), v_el
+                        )
+                        res.append(trace)
                     else:
                         trace = self.get_trace_class(trace_type)(
                             skip_invalid=skip_invalid, _validate=_validate, **v_el
@@ -2734,8 +2830,13 @@ class BaseDataValidator(BaseValidator):
 
             # Set new UIDs
             if self.set_uid:
-                for trace in v:
-                    trace.uid = str(uuid.uuid4())
+                # Draw the random bytes of all version 4 UUIDs at once. UUIDs
+                # are valid uid values, so they're set without validation.
+                uid_bytes = os.urandom(16 * len(v))
+                for i, trace in enumerate(v):
+                    trace._props["uid"] = str(
+                        uuid.UUID(bytes=uid_bytes[16 * i : 16 * (i + 1)], version=4)
+                    )
 
         return v
 
@@ -2775,13 +2876,24 @@ class BaseTemplateValidator(CompoundValidator):
             # Check if v is a template identifier
             # (could be any hashable object)
             if v in pio.templates:
-                return copy.deepcopy(pio.templates[v])
+                template = pio.templates[v]
             # Otherwise, if v is a string, check to see if it consists of
             # multiple template names joined on '+' characters
-            elif isinstance(v, str):
-                template_names = v.split("+")
-                if all([name in pio.templates for name in template_names]):
-                    return pio.templates.merge_templates(*template_names)
+            elif isinstance(v, str) and all(
+                [name in pio.templates for name in v.split("+")]
+            ):
+                # The shared merged template is copied below
+                template = pio.templates._get_merged_template(tuple(v.split("+")))
+            else:
+                template = None
+
+            if template is not None:
+                # Registered and merged templates are already validated,
+                # so copy them without validating again, then validate
+                # later edits to the copy
+                template = self.data_class(template, _validate=False)
+                template._validate = True
+                return template
 
         except TypeError:
             # v is un-hashable
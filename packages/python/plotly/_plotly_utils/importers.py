@@ -1,4 +1,5 @@
 import importlib
+import sys
 
 
 def relative_import(parent_name, rel_modules=(), rel_classes=()):
@@ -26,21 +27,26 @@ def relative_import(parent_name, rel_modules=(), rel_classes=()):
         # Check for submodule
         if import_name in module_names:
             rel_import = module_names[import_name]
-            return importlib.import_module(rel_import, parent_name)
+            value = importlib.import_module(rel_import, parent_name)
 
         # Check for submodule class
-        if import_name in class_names:
+        elif import_name in class_names:
             rel_path_parts = class_names[import_name].split(".")
             rel_module = ".".join(rel_path_parts[:-1])
-            class_name = import_name
             class_module = importlib.import_module(rel_module, parent_name)
-            return getattr(class_module, class_name)
+            value = getattr(class_module, import_name)
 
-        raise AttributeError(
-            "module {__name__!r} has no attribute {name!r}".format(
-                name=import_name, __name__=parent_name
+        else:
+            raise AttributeError(
+                "module {__name__!r} has no attribute {name!r}".format(
+                    name=import_name, __name__=parent_name
+                )
             )
-        )
+
+        # Cache the result on the parent module so that the next lookups don't
+        # go through __getattr__ and importlib again
+        setattr(sys.modules[parent_name], import_name, value)
+        return value
 
     __all__ = list(module_names) + list(class_names)
 
@@ -234,6 +234,35 @@ def test_rejection_aok_colorscale(val, validator_aok_colorscale):
     assert "Invalid element(s)" in str(validation_failure.value)
 
 
+# Large numpy arrays
+# ------------------
+# Elements are validated once per unique value
+def test_acceptance_aok_repeated_array(validator_aok):
+    val = np.array(["red", "#d3d3d3", "rgba(255, 0, 0, 0.5)"] * 1000, dtype="object")
+    coerce_val = validator_aok.validate_coerce(val)
+
+    assert coerce_val.dtype.kind == "U"
+    assert np.array_equal(coerce_val, val)
+
+
+def test_rejection_aok_repeated_array(validator_aok):
+    val = np.array(["red", "redd", "blue", "bluee"] * 1000, dtype="object")
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    assert "Invalid elements include: ['redd', 'bluee', 'redd'" in str(
+        validation_failure.value
+    )
+
+
+def test_acceptance_aok_colorscale_mixed_array(validator_aok_colorscale):
+    val = np.array(["red", 0.5, "rgb(255, 0, 0)", 2] * 100, dtype="object")
+    coerce_val = validator_aok_colorscale.validate_coerce(val)
+
+    assert coerce_val.dtype.kind == "O"
+    assert np.array_equal(coerce_val, val)
+
+
 # Description
 # -----------
 # Test dynamic description logic
@@ -36,10 +36,38 @@ plotlyjsShortTypes = {
 }
 
 
-def to_typed_array_spec(v):
+def _min_max(v, chunk_size=1 << 15):
+    """
+    Return the minimum and maximum of a numpy array
+
+    numpy has no reduction computing both at once, so this still makes two
+    passes, but over one cache sized chunk at a time: the max of a chunk is
+    computed while the chunk is still in cache after its min, so that large
+    arrays are only read once from main memory.
+    """
+    v = v.reshape(-1)
+    if v.size <= chunk_size:
+        return v.min(), v.max()
+
+    lo = hi = v[0]
+    for start in range(0, v.size, chunk_size):
+        chunk = v[start : start + chunk_size]
+        chunk_lo = chunk.min()
+        chunk_hi = chunk.max()
+        if chunk_lo < lo:
+            lo = chunk_lo
+        if chunk_hi > hi:
+            hi = chunk_hi
+    return lo, hi
+
+
+def to_typed_array_spec(v, encode_dates=False):
     """
     Convert numpy array to plotly.js typed array spec
     If not possible return the original value
+
+    If encode_dates is True, datetime64 arrays are converted to float64
+    milliseconds since the epoch (with NaT as NaN) before being encoded.
     """
     v = copy_to_readonly_numpy_array(v)
 
@@ -49,12 +77,16 @@ def to_typed_array_spec(v):
     if not np or not isinstance(v, np.ndarray) or v.size == 0:
         return v
 
+    if encode_dates and v.dtype.kind == "M":
+        epoch_ms = v.astype("datetime64[us]").astype("int64") / 1000.0
+        epoch_ms[np.isnat(v)] = np.nan
+        v = epoch_ms
+
     dtype = str(v.dtype)
 
     # convert default Big Ints until we could support them in plotly.js
     if dtype == "int64":
-        max = v.max()
-        min = v.min()
+        min, max = _min_max(v)
         if max <= int8max and min >= int8min:
             v = v.astype("int8")
         elif max <= int16max and min >= int16min:
@@ -65,8 +97,7 @@ def to_typed_array_spec(v):
             return v
 
     elif dtype == "uint64":
-        max = v.max()
-        min = v.min()
+        min, max = _min_max(v)
         if max <= uint8max and min >= 0:
             v = v.astype("uint8")
         elif max <= uint16max and min >= 0:
@@ -95,6 +126,10 @@ def to_typed_array_spec(v):
 def is_skipped_key(key):
     """
     Return whether the key is skipped for conversion to the typed array spec
+
+    This is only a fallback for objects that do not match the plotly schema,
+    figures are converted according to the valType of each property (see
+    plotly.io.json.encode_typed_arrays).
     """
     skipped_keys = ["geojson", "layer", "layers", "range"]
     return any(skipped_key == key for skipped_key in skipped_keys)
@@ -101,6 +101,11 @@ class {fig_classname}({base_classname}):\n"""
             If True, invalid properties in the figure specification will be
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
+        copy: bool
+            If True (default), numpy arrays in the figure specification are
+            copied. If False, they are adopted as read-only views, which
+            avoids duplicating large arrays. In this case the arrays must not
+            be modified in place after the figure is constructed.
 
         Raises
         ------
@@ -157,8 +162,8 @@ class {fig_classname}({base_classname}):\n"""
 
     add_wrapper(
         "add_traces",
-        "data,rows=None,cols=None,secondary_ys=None,exclude_empty_subplots=False",
-        "data,rows,cols,secondary_ys,exclude_empty_subplots",
+        "data,rows=None,cols=None,secondary_ys=None,exclude_empty_subplots=False,validate=True",
+        "data,rows,cols,secondary_ys,exclude_empty_subplots,validate",
     )
 
     add_wrapper(
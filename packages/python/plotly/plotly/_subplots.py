@@ -1371,7 +1371,7 @@ def _build_grid_str(specs, grid_ref, insets, insets_ref, row_seq):
     return grid_str
 
 
-def _set_trace_grid_reference(trace, layout, grid_ref, row, col, secondary_y=False):
+def _get_grid_subplot_ref(grid_ref, row, col, secondary_y=False):
     if row <= 0:
         raise Exception(
             "Row value is out of range. " "Note: the starting cell is (1, 1)"
@@ -1406,11 +1406,13 @@ created with the secondary_y spec property set to True. See the docstring
 for the specs argument to plotly.subplots.make_subplots for more information.
 """
             )
-        trace_kwargs = subplot_refs[1].trace_kwargs
+        return subplot_refs[1]
     else:
-        trace_kwargs = subplot_refs[0].trace_kwargs
+        return subplot_refs[0]
+
 
-    for k in trace_kwargs:
+def _check_trace_subplot_ref(trace, subplot_ref, row, col):
+    for k in subplot_ref.trace_kwargs:
         if k not in trace:
             raise ValueError(
                 """\
@@ -1420,14 +1422,19 @@ at grid position ({row}, {col})
 See the docstring for the specs argument to plotly.subplots.make_subplots
 for more information on subplot types""".format(
                     typ=trace.type,
-                    subplot_type=subplot_refs[0].subplot_type,
+                    subplot_type=subplot_ref.subplot_type,
                     row=row,
                     col=col,
                 )
             )
 
+
+def _set_trace_grid_reference(trace, layout, grid_ref, row, col, secondary_y=False):
+    subplot_ref = _get_grid_subplot_ref(grid_ref, row, col, secondary_y)
+    _check_trace_subplot_ref(trace, subplot_ref, row, col)
+
     # Update trace reference
-    trace.update(trace_kwargs)
+    trace.update(subplot_ref.trace_kwargs)
 
 
 def _get_grid_subplot(fig, row, col, secondary_y=False):
@@ -2,10 +2,10 @@ import collections
 from collections import OrderedDict
 import re
 import warnings
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from copy import deepcopy, copy
 import itertools
-from functools import reduce
+from functools import lru_cache, reduce
 
 from _plotly_utils.utils import (
     _natural_sort_strings,
@@ -15,9 +15,9 @@ from _plotly_utils.utils import (
     display_string_positions,
     chomp_empty_strings,
     find_closest_string,
-    convert_to_base64,
 )
 from _plotly_utils.exceptions import PlotlyKeyError
+from _plotly_utils.basevalidators import _copy_arrays, adopt_arrays
 from .optional_imports import get_module
 
 from . import shapeannotation
@@ -47,12 +47,16 @@ def _len_dict_item(item):
     return l
 
 
+@lru_cache(maxsize=4096)
 def _str_to_dict_path_full(key_path_str):
     """
     Convert a key path string into a tuple of key path elements and also
     return a tuple of indices marking the beginning of each element in the
     string.
 
+    The same key paths are parsed over and over by property access and by
+    restyle / relayout operations, so results are kept in a bounded LRU cache.
+
     Parameters
     ----------
     key_path_str : str
@@ -128,7 +132,7 @@ def _str_to_dict_path_full(key_path_str):
         key_path3 = []
         elem_idcs = []
 
-    return (tuple(key_path3), elem_idcs)
+    return (tuple(key_path3), tuple(elem_idcs))
 
 
 def _remake_path_from_tuple(props):
@@ -248,6 +252,129 @@ Bad property path:
     return None
 
 
+def _walk_prop_tree(obj, prop, path, error_cast=None):
+    """
+    obj:        the object in which the first property is looked up
+    prop:       the key path tuple to walk down
+    path:       the original path, used to describe a lookup error
+    error_cast: see _check_path_in_prop_tree
+    returns
+          a tuple of the object holding the last property in prop and the
+          value of that property. If the lookup fails, the error built by
+          _check_path_in_prop_tree is raised. The path is only checked on
+          failure so that valid paths are walked once.
+    """
+    parent = res = obj
+    try:
+        for p in prop:
+            parent, res = res, res[p]
+        return parent, res
+    except (ValueError, KeyError, IndexError, TypeError):
+        pass
+
+    err = _check_path_in_prop_tree(obj, path, error_cast=error_cast)
+    if err is not None:
+        raise err
+
+    parent = res = obj
+    for p in prop:
+        parent, res = res, res[p]
+    return parent, res
+
+
+def _props_unchanged(props, new_props):
+    """
+    Return whether new_props, a property value or properties dict, is equal
+    to the current property value props, with matching types, so that
+    assigning it would not change the figure. Lists and tuples are treated
+    alike since validators store both as lists.
+    """
+    if isinstance(props, dict):
+        return (
+            isinstance(new_props, dict)
+            and props.keys() == new_props.keys()
+            and all(_props_unchanged(props[k], new_props[k]) for k in props)
+        )
+    elif isinstance(props, (list, tuple)):
+        return (
+            isinstance(new_props, (list, tuple))
+            and len(props) == len(new_props)
+            and all(_props_unchanged(v1, v2) for v1, v2 in zip(props, new_props))
+        )
+    elif type(props) is not type(new_props):
+        return False
+
+    np = get_module("numpy", should_load=False)
+    if np is not None and isinstance(props, np.ndarray):
+        return props.dtype == new_props.dtype and np.array_equal(props, new_props)
+
+    try:
+        return bool(props == new_props)
+    except Exception:
+        return False
+
+
+def _merge_props(props, new_props):
+    """
+    Merge the nested properties dict new_props into props, in place
+    """
+    for k, v in new_props.items():
+        if isinstance(v, dict) and isinstance(props.get(k, None), dict):
+            _merge_props(props[k], v)
+        else:
+            props[k] = v
+
+
+def _invalid_schema_paths(props, path):
+    """
+    Return the key path tuples of the properties in props, the properties
+    dict of the object at schema path (e.g. 'scatter.marker'), that are not
+    part of the plotly schema
+    """
+    from .validator_cache import ValidatorCache
+    from _plotly_utils.basevalidators import (
+        CompoundValidator,
+        CompoundArrayValidator,
+    )
+
+    invalid = []
+    for key, val in props.items():
+        validator = ValidatorCache.find_validator(path, key)
+        if validator is None:
+            invalid.append((key,))
+        elif isinstance(validator, CompoundValidator) and isinstance(val, dict):
+            child_path = validator.data_class._path_str
+            invalid.extend((key,) + p for p in _invalid_schema_paths(val, child_path))
+        elif isinstance(validator, CompoundArrayValidator) and isinstance(
+            val, (list, tuple)
+        ):
+            child_path = validator.data_class._path_str
+            for i, el in enumerate(val):
+                if isinstance(el, dict):
+                    invalid.extend(
+                        (key, i) + p for p in _invalid_schema_paths(el, child_path)
+                    )
+    return invalid
+
+
+def _check_trace_schema(trace):
+    """
+    Raise a ValueError if the unvalidated trace has properties that are not
+    part of the plotly schema of its trace type
+    """
+    props = {k: v for k, v in trace._props.items() if k != "type"}
+    invalid = _invalid_schema_paths(props, trace.plotly_name)
+    if invalid:
+        raise ValueError(
+            """
+Invalid properties specified for trace of type {typ}:
+    {paths}""".format(
+                typ=trace.plotly_name,
+                paths=", ".join(repr(_remake_path_from_tuple(p)) for p in invalid),
+            )
+        )
+
+
 def _combine_dicts(dicts):
     all_args = dict()
     for d in dicts:
@@ -385,6 +512,27 @@ def _generator(i):
         yield x
 
 
+def _copy_props(props):
+    """
+    Deep copy a properties dict.
+
+    Inside of an `adopt_arrays` context, read-only numpy arrays are shared
+    rather than copied, so that adopted buffers are never duplicated.
+    """
+    if _copy_arrays.get():
+        return deepcopy(props)
+
+    np = get_module("numpy", should_load=False)
+    if isinstance(props, dict):
+        return {k: _copy_props(v) for k, v in props.items()}
+    elif isinstance(props, (list, tuple)):
+        return type(props)(_copy_props(v) for v in props)
+    elif np and isinstance(props, np.ndarray) and not props.flags.writeable:
+        return props
+    else:
+        return deepcopy(props)
+
+
 class BaseFigure(object):
     """
     Base class for all figure types (both widget and non-widget)
@@ -448,6 +596,11 @@ class BaseFigure(object):
             If True, invalid properties in the figure specification will be
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
+        copy: bool
+            If True (default), numpy arrays in the figure specification are
+            copied. If False, they are adopted as read-only views, which
+            avoids duplicating large arrays. In this case the arrays must not
+            be modified in place after the figure is constructed.
 
         Raises
         ------
@@ -462,6 +615,9 @@ class BaseFigure(object):
         # Initialize validation
         self._validate = kwargs.pop("_validate", True)
 
+        # Copy input arrays, or adopt them as read-only views
+        array_context = nullcontext if kwargs.pop("copy", True) else adopt_arrays
+
         # Assign layout_plotly to layout
         # ------------------------------
         # See docstring note for explanation
@@ -510,18 +666,19 @@ class BaseFigure(object):
         self._data_validator = DataValidator(set_uid=self._set_trace_uid)
 
         # ### Import traces ###
-        data = self._data_validator.validate_coerce(
-            data, skip_invalid=skip_invalid, _validate=self._validate
-        )
+        with array_context():
+            data = self._data_validator.validate_coerce(
+                data, skip_invalid=skip_invalid, _validate=self._validate
+            )
+
+            # ### Import clone of trace properties ###
+            # The _data property is a list of dicts containing the properties
+            # explicitly set by the user for each trace.
+            self._data = [_copy_props(trace._props) for trace in data]
 
         # ### Save tuple of trace objects ###
         self._data_objs = data
 
-        # ### Import clone of trace properties ###
-        # The _data property is a list of dicts containing the properties
-        # explicitly set by the user for each trace.
-        self._data = [deepcopy(trace._props) for trace in data]
-
         # ### Create data defaults ###
         # _data_defaults is a tuple of dicts, one for each trace. When
         # running in a widget context, these defaults are populated with
@@ -553,12 +710,13 @@ class BaseFigure(object):
         self._layout_validator = LayoutValidator()
 
         # ### Import Layout ###
-        self._layout_obj = self._layout_validator.validate_coerce(
-            layout, skip_invalid=skip_invalid, _validate=self._validate
-        )
+        with array_context():
+            self._layout_obj = self._layout_validator.validate_coerce(
+                layout, skip_invalid=skip_invalid, _validate=self._validate
+            )
 
-        # ### Import clone of layout properties ###
-        self._layout = deepcopy(self._layout_obj._props)
+            # ### Import clone of layout properties ###
+            self._layout = _copy_props(self._layout_obj._props)
 
         # ### Initialize layout defaults dict ###
         self._layout_defaults = {}
@@ -588,9 +746,10 @@ class BaseFigure(object):
         self._frames_validator = FramesValidator()
 
         # ### Import frames ###
-        self._frame_objs = self._frames_validator.validate_coerce(
-            frames, skip_invalid=skip_invalid
-        )
+        with array_context():
+            self._frame_objs = self._frames_validator.validate_coerce(
+                frames, skip_invalid=skip_invalid
+            )
 
         # Note: Because frames are not currently supported in the widget
         # context, we don't need to follow the pattern above and create
@@ -690,12 +849,7 @@ class BaseFigure(object):
         # ----------------------
         # e.g. ('foo', 1)
         else:
-            err = _check_path_in_prop_tree(self, orig_prop, error_cast=ValueError)
-            if err is not None:
-                raise err
-            res = self
-            for p in prop[:-1]:
-                res = res[p]
+            res, _ = _walk_prop_tree(self, prop, orig_prop, error_cast=ValueError)
 
             res._validate = self._validate
 
@@ -748,13 +902,7 @@ class BaseFigure(object):
         # ----------------------
         # e.g. ('foo', 1)
         else:
-            err = _check_path_in_prop_tree(self, orig_prop, error_cast=PlotlyKeyError)
-            if err is not None:
-                raise err
-            res = self
-            for p in prop:
-                res = res[p]
-
+            _, res = _walk_prop_tree(self, prop, orig_prop, error_cast=PlotlyKeyError)
             return res
 
     def __iter__(self):
@@ -2119,6 +2267,7 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         cols=None,
         secondary_ys=None,
         exclude_empty_subplots=False,
+        validate=True,
     ):
         """
         Add traces to the figure
@@ -2160,6 +2309,15 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
             If True, the trace will not be added to subplots that don't already
             have traces.
 
+        validate: True, False or 'schema' (default True)
+            How the trace properties are validated:
+              - True: property names and values are validated and coerced
+              - 'schema': property names are checked against the plotly
+                schema, but values are not validated
+              - False: traces are added as is, without validation
+            Skipping value validation makes adding many traces much faster,
+            but invalid values are only reported by plotly.js.
+
         Returns
         -------
         BaseFigure
@@ -2187,12 +2345,25 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         Figure(...)
         """
 
+        if validate not in (True, False, "schema"):
+            raise ValueError(
+                """
+The validate argument to add_traces must be True, False or 'schema'
+    Received value: {val}""".format(
+                    val=repr(validate)
+                )
+            )
+
         # Validate traces
-        data = self._data_validator.validate_coerce(data)
+        data = self._data_validator.validate_coerce(data, _validate=validate is True)
+        if validate == "schema":
+            for trace in data:
+                _check_trace_schema(trace)
 
         # Set trace indexes
+        n_traces = len(self._data_objs)
         for ind, new_trace in enumerate(data):
-            new_trace._trace_ind = ind + len(self.data)
+            new_trace._trace_ind = ind + n_traces
 
         # Allow integers as inputs to subplots
         int_type = _get_int_type()
@@ -2233,8 +2404,25 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
 
         # Apply rows / cols
         if rows is not None:
+            from plotly._subplots import _get_grid_subplot_ref, _check_trace_subplot_ref
+
+            grid_ref = self._validate_get_grid_ref()
+
+            # The subplot reference properties are looked up, checked and
+            # validated once per grid cell and trace type, then merged into
+            # the properties of each new trace
+            subplot_props = {}
             for trace, row, col, secondary_y in zip(data, rows, cols, secondary_ys):
-                self._set_trace_grid_position(trace, row, col, secondary_y)
+                key = (row, col, bool(secondary_y), trace.__class__)
+                if key not in subplot_props:
+                    subplot_ref = _get_grid_subplot_ref(grid_ref, row, col, secondary_y)
+                    _check_trace_subplot_ref(trace, subplot_ref, row, col)
+                    subplot_props[key] = trace.__class__(
+                        subplot_ref.trace_kwargs
+                    )._props
+                    subplot_props[key].pop("type", None)
+
+                _merge_props(trace._props, subplot_props[key])
 
         if exclude_empty_subplots:
             data = list(
@@ -2249,15 +2437,18 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         # Make deep copy of trace data (Optimize later if needed)
         new_traces_data = [deepcopy(trace._props) for trace in data]
 
-        # Update trace parent
+        # Update trace parent. Traces added with validate=False or
+        # validate='schema' were built unvalidated, so validation of later
+        # updates is restored to the figure's setting
         for trace in data:
             trace._parent = self
             trace._orphan_props.clear()
+            trace._validate = self._validate
 
         # Update python side
         #  Use extend instead of assignment so we don't trigger serialization
         self._data.extend(new_traces_data)
-        self._data_defaults = self._data_defaults + [{} for _ in data]
+        self._data_defaults.extend({} for _ in data)
         self._data_objs = self._data_objs + data
 
         # Update messages
@@ -2265,6 +2456,49 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
 
         return self
 
+    @classmethod
+    def from_traces(cls, data, layout=None, validate=True, **kwargs):
+        """
+        Construct a figure from a list of traces
+
+        The traces are added in a single add_traces call, so that with
+        validate=False or validate='schema' figures with thousands of traces
+        are constructed much faster than with the figure constructor.
+
+        Parameters
+        ----------
+        data : list[BaseTraceType or dict]
+            A list of trace specifications. See the docstring of
+            `add_traces` for more info.
+
+        layout : BaseLayoutType or dict or None
+            The figure layout
+
+        validate: True, False or 'schema' (default True)
+            How the trace properties are validated. See the docstring of
+            `add_traces` for more info.
+
+        **kwargs
+            Additional keyword arguments passed to the figure constructor
+
+        Returns
+        -------
+        BaseFigure
+
+        Examples
+        --------
+
+        >>> import plotly.graph_objs as go
+        >>> fig = go.Figure.from_traces(
+        ...     [dict(type="scatter", y=[i, i + 1]) for i in range(1000)],
+        ...     validate="schema",
+        ... )
+        >>> len(fig.data)
+        1000
+        """
+        fig = cls(layout=layout, **kwargs)
+        return fig.add_traces(data, validate=validate)
+
     # Subplots
     # --------
     def print_grid(self):
@@ -3312,9 +3546,9 @@ Invalid property path '{key_path_str}' for layout
             res["frames"] = frames
 
         # Add base64 conversion before sending to the front-end
-        convert_to_base64(res)
+        from plotly.io._json import encode_typed_arrays
 
-        return res
+        return encode_typed_arrays(res)
 
     def to_plotly_json(self):
         """
@@ -3500,6 +3734,12 @@ Invalid property path '{key_path_str}' for layout
             If not specified, the default encoder is set to the current value of
             plotly.io.json.config.default_encoder.
 
+        stream: bool (default False)
+            True if the JSON representation should be written incrementally,
+            one property value (e.g. one data array) at a time, rather than
+            being built as a single string first. Not supported together
+            with pretty=True.
+
         Returns
         -------
         None
@@ -3868,8 +4108,12 @@ Invalid property path '{key_path_str}' for layout
             # This should be valid even if xaxis2 hasn't been initialized:
             # >>> layout.update(xaxis2={'title': 'xaxis 2'})
             for key in update_obj:
+                if key in plotly_obj:
+                    # Valid property or property path
+                    continue
+
                 # special handling for missing keys that match _subplot_re_match
-                if key not in plotly_obj and isinstance(plotly_obj, BaseLayoutType):
+                if isinstance(plotly_obj, BaseLayoutType):
                     # try _subplot_re_match
                     match = plotly_obj._subplot_re_match(key)
                     if match:
@@ -3888,9 +4132,20 @@ Invalid property path '{key_path_str}' for layout
 
             # Process valid properties
             # ------------------------
+            props = plotly_obj._props
             for key in update_obj:
                 val = update_obj[key]
 
+                # Skip values that are equal to the current property value, so
+                # that only changed properties are validated and assigned
+                if props is not None and key in props:
+                    if isinstance(val, BasePlotlyType):
+                        new_props = val._props
+                    else:
+                        new_props = val
+                    if _props_unchanged(props[key], new_props):
+                        continue
+
                 if overwrite:
                     # Don't recurse and assign property as-is
                     plotly_obj[key] = val
@@ -4742,13 +4997,7 @@ class BasePlotlyType(object):
         # ----------------------
         # e.g. ('foo', 1), ()
         else:
-            err = _check_path_in_prop_tree(self, orig_prop, error_cast=PlotlyKeyError)
-            if err is not None:
-                raise err
-            res = self
-            for p in prop:
-                res = res[p]
-
+            _, res = _walk_prop_tree(self, prop, orig_prop, error_cast=PlotlyKeyError)
             return res
 
     def __contains__(self, prop):
@@ -4780,18 +5029,18 @@ class BasePlotlyType(object):
             prop = self._mapped_properties[prop[0]] + prop[1:]
 
         obj = self
-        for p in prop:
+        for i, p in enumerate(prop):
             if isinstance(p, int):
-                if isinstance(obj, tuple) and 0 <= p < len(obj):
-                    obj = obj[p]
-                else:
+                if not (isinstance(obj, tuple) and 0 <= p < len(obj)):
                     return False
             else:
-                if hasattr(obj, "_valid_props") and p in obj._valid_props:
-                    obj = obj[p]
-                else:
+                if not (hasattr(obj, "_valid_props") and p in obj._valid_props):
                     return False
 
+            # No need to look up the value of the last element
+            if i < len(prop) - 1:
+                obj = obj[p]
+
         return True
 
     def __setitem__(self, prop, value):
@@ -4888,12 +5137,7 @@ class BasePlotlyType(object):
         # ----------------------
         # e.g. ('foo', 1), ()
         else:
-            err = _check_path_in_prop_tree(self, orig_prop, error_cast=ValueError)
-            if err is not None:
-                raise err
-            res = self
-            for p in prop[:-1]:
-                res = res[p]
+            res, _ = _walk_prop_tree(self, prop, orig_prop, error_cast=ValueError)
 
             res._validate = self._validate
 
@@ -5266,12 +5510,12 @@ class BasePlotlyType(object):
         # ------------------------------------------
         curr_val = self._compound_props.get(prop, None)
         if curr_val is not None:
-            curr_dict_val = deepcopy(curr_val._props)
+            curr_dict_val = _copy_props(curr_val._props)
         else:
             curr_dict_val = None
 
         if val is not None:
-            new_dict_val = deepcopy(val._props)
+            new_dict_val = _copy_props(val._props)
         else:
             new_dict_val = None
 
@@ -5340,12 +5584,12 @@ class BasePlotlyType(object):
         # ------------------------------------------
         curr_val = self._compound_array_props.get(prop, None)
         if curr_val is not None:
-            curr_dict_vals = [deepcopy(cv._props) for cv in curr_val]
+            curr_dict_vals = [_copy_props(cv._props) for cv in curr_val]
         else:
             curr_dict_vals = None
 
         if val is not None:
-            new_dict_vals = [deepcopy(nv._props) for nv in val]
+            new_dict_vals = [_copy_props(nv._props) for nv in val]
         else:
             new_dict_vals = None
 
@@ -70,6 +70,8 @@ from ._core import (  # noqa: F401
     set_mapbox_access_token,
     defaults,
     get_trendline_results,
+    register_downsampling,
+    share_frame_data,
     NO_COLOR,
 )
 
@@ -123,6 +125,8 @@ __all__ = [
     "trendline_functions",
     "set_mapbox_access_token",
     "get_trendline_results",
+    "register_downsampling",
+    "share_frame_data",
     "IdentityMap",
     "Constant",
     "Range",
@@ -56,6 +56,8 @@ def scatter(
     range_x=None,
     range_y=None,
     render_mode="auto",
+    downsample=None,
+    downsample_on_zoom=False,
     title=None,
     subtitle=None,
     template=None,
@@ -177,6 +179,7 @@ def density_heatmap(
     histnorm=None,
     nbinsx=None,
     nbinsy=None,
+    binning="client",
     text_auto=False,
     title=None,
     subtitle=None,
@@ -257,6 +260,8 @@ def line(
     range_y=None,
     line_shape=None,
     render_mode="auto",
+    downsample=None,
+    downsample_on_zoom=False,
     title=None,
     subtitle=None,
     template=None,
@@ -474,6 +479,7 @@ def histogram(
     histfunc=None,
     cumulative=None,
     nbins=None,
+    binning="client",
     text_auto=False,
     title=None,
     subtitle=None,
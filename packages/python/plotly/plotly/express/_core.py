@@ -3,8 +3,14 @@ import plotly.io as pio
 from collections import namedtuple, OrderedDict
 from ._special_inputs import IdentityMap, Constant, Range
 from .trendline_functions import ols, lowess, rolling, expanding, ewm
+from ._downsample import downsample_functions
 
-from _plotly_utils.basevalidators import ColorscaleValidator
+from _plotly_utils.basevalidators import (
+    BaseDataValidator,
+    ColorscaleValidator,
+    CompoundArrayValidator,
+    CompoundValidator,
+)
 from plotly.colors import qualitative, sequential
 import math
 
@@ -124,6 +130,82 @@ def get_trendline_results(fig):
     return fig._px_trendlines
 
 
+def register_downsampling(widget, fig=None):
+    """
+    Downsamples the traces of a figure made with the `downsample` argument
+    again whenever the range of their axis changes, so that zooming in a
+    `go.FigureWidget` reveals the full-resolution data of the visible range.
+
+    Parameters
+    ----------
+    widget: go.FigureWidget
+        Widget displaying `fig`, e.g. `go.FigureWidget(fig)`
+    fig: go.Figure
+        Figure returned by `px.line` or `px.scatter` with the `downsample`
+        argument and `downsample_on_zoom=True`, defaults to `widget`
+    """
+    import numpy as np
+
+    fig = widget if fig is None else fig
+    sources = getattr(fig, "_px_downsample", None)
+    if sources is None:
+        raise ValueError(
+            "The figure was not made by `px.line` or `px.scatter` with the "
+            "`downsample` argument and `downsample_on_zoom=True`."
+        )
+    args = sources["args"]
+    base = "y" if args.get("orientation") == "h" else "x"
+    is_date = False
+    traces_by_axis = OrderedDict()
+    positions = {}
+    for i, (trace_spec, group, labels) in sources["traces"].items():
+        axis = widget.data[i][base + "axis"] or base
+        traces_by_axis.setdefault(base + "axis" + axis[1:], []).append(i)
+        positions[i] = _downsample_values(group, args[base])
+        if positions[i] is None:
+            positions[i] = np.arange(len(group), dtype=float)
+        dtype = group.get_column(args[base]).dtype if args[base] else None
+        is_date = is_date or dtype == nw.Datetime or dtype == nw.Date
+
+    def to_position(value):
+        if is_date and isinstance(value, str):
+            delta = np.datetime64(value, "us") - np.datetime64(0, "us")
+            return delta / np.timedelta64(1, "s")
+        return float(value)
+
+    def redownsample(layout, *ranges_and_autoranges):
+        with widget.batch_update():
+            for axis_key, axis_range, autorange in zip(
+                traces_by_axis,
+                ranges_and_autoranges[::2],
+                ranges_and_autoranges[1::2],
+            ):
+                for i in traces_by_axis[axis_key]:
+                    trace_spec, group, labels = sources["traces"][i]
+                    if axis_range is not None and autorange is not True:
+                        lo, hi = sorted(to_position(v) for v in axis_range)
+                        # also keep the neighbours of the visible points, so
+                        # that lines run up to the edges of the plot
+                        visible = (positions[i] >= lo) & (positions[i] <= hi)
+                        keep = visible.copy()
+                        keep[1:] |= visible[:-1]
+                        keep[:-1] |= visible[1:]
+                        group = group[np.flatnonzero(keep)]
+                    patch, _ = make_trace_kwargs(
+                        args,
+                        trace_spec,
+                        downsample_trace_data(args, group),
+                        labels.copy(),
+                        sources["sizeref"],
+                    )
+                    widget.data[i].update(patch)
+
+    widget.layout.on_change(
+        redownsample,
+        *[(key, prop) for key in traces_by_axis for prop in ["range", "autorange"]],
+    )
+
+
 Mapping = namedtuple(
     "Mapping",
     [
@@ -139,6 +221,160 @@ Mapping = namedtuple(
 TraceSpec = namedtuple("TraceSpec", ["constructor", "attrs", "trace_patch", "marginal"])
 
 
+class _TraceBuilderCache(object):
+    """
+    Lookups shared by the `_TraceBuilder` instances of a figure:
+      - `scratch_traces`: an empty trace of each trace class, used to look up
+        validators
+      - `validators`: the validator of each (trace class, property path)
+      - `values`: the validated value of each (validator, type, value) of
+        scalar values
+    """
+
+    def __init__(self):
+        self.scratch_traces = {}
+        self.validators = {}
+        self.values = {}
+
+    def get_scratch_trace(self, trace_class):
+        """Returns a `trace_class` trace, only used to look up validators"""
+        if trace_class not in self.scratch_traces:
+            self.scratch_traces[trace_class] = trace_class()
+        return self.scratch_traces[trace_class]
+
+    def get_prop_validator(self, trace_class, path):
+        """
+        Returns the validator of the property at `path` (a tuple of property
+        names) of a `trace_class` trace, or None if `path` does not lead to a
+        simple or a compound property.
+        """
+        key = (trace_class, path)
+        if key not in self.validators:
+            obj = self.get_scratch_trace(trace_class)
+            validator = None
+            for i, prop in enumerate(path):
+                if prop not in obj._valid_props:
+                    validator = None
+                    break
+                validator = obj._get_validator(prop)
+                if i < len(path) - 1:
+                    if not isinstance(validator, CompoundValidator):
+                        validator = None
+                        break
+                    obj = obj[prop]
+            if isinstance(validator, (CompoundArrayValidator, BaseDataValidator)):
+                validator = None
+            self.validators[key] = validator
+        return self.validators[key]
+
+    def validate_scalar(self, validator, value):
+        """Returns the validated `value`, a str, bool, int or float"""
+        key = (validator, type(value), value)
+        if key not in self.values:
+            self.values[key] = validator.validate_coerce(value)
+        return self.values[key]
+
+
+def _flatten_trace_patch(trace_class, patch, cache, path=()):
+    """
+    Yields the (path, validator, value) of each simple property of `patch`, with
+    a None validator for the properties that can't be validated on their own.
+    """
+    for key, value in patch.items():
+        prop_path = path + tuple(key.split("."))
+        validator = cache.get_prop_validator(trace_class, prop_path)
+        if isinstance(validator, CompoundValidator):
+            if isinstance(value, dict):
+                yield from _flatten_trace_patch(trace_class, value, cache, prop_path)
+                continue
+            validator = None
+        yield prop_path, validator, value
+
+
+def _merge_trace_props(props, patch):
+    """Merges the validated `patch` into the `props` of a trace, in place"""
+    for key, value in patch.items():
+        if isinstance(value, dict):
+            sub_props = props.get(key, {})
+            _merge_trace_props(sub_props, value)
+            if sub_props:
+                props[key] = sub_props
+        elif value is None:
+            props.pop(key, None)
+        else:
+            props[key] = value
+
+
+class _TraceBuilder(object):
+    """
+    Stand-in for a trace while px sets its properties with `update`, which are
+    validated like `trace.update` would and collected in `props`, until the
+    trace is created at once by `build`.
+
+    Traces of high-cardinality groups differ only by a few properties, so the
+    validators of the properties are looked up once per trace type and the
+    validated values of scalar properties, like names, colors or symbols, are
+    reused from `cache`, a `_TraceBuilderCache` shared by all the traces of a
+    figure. Arrays are coerced by their validator directly, and the few
+    properties that can't be validated on their own, like compound arrays, on
+    a scratch trace.
+    """
+
+    def __init__(self, trace_class, cache):
+        self.trace_class = trace_class
+        self.cache = cache
+        self.props = {}
+
+    @property
+    def type(self):
+        return self.cache.get_scratch_trace(self.trace_class).type
+
+    def __contains__(self, prop):
+        return prop in self.cache.get_scratch_trace(self.trace_class)
+
+    def update(self, dict1=None, **kwargs):
+        for patch in [dict1 or {}, kwargs]:
+            leaves = list(_flatten_trace_patch(self.trace_class, patch, self.cache))
+            if any(validator is None for _, validator, _ in leaves):
+                scratch = self.trace_class()
+                scratch.update(patch)
+                validated = scratch._props
+            else:
+                validated = {}
+                for path, validator, value in leaves:
+                    if type(value) in (str, bool, int, float):
+                        value = self.cache.validate_scalar(validator, value)
+                    else:
+                        value = validator.validate_coerce(value)
+                    parent = validated
+                    for prop in path[:-1]:
+                        parent = parent.setdefault(prop, {})
+                    parent[path[-1]] = value
+            _merge_trace_props(self.props, validated)
+        return self
+
+    def build(self):
+        # sort the properties like the generated constructors of the traces
+        # and of their compound properties do. Dict values of other
+        # properties, like geojson, are data and are left as is
+        def sort_props(props, path):
+            sorted_props = {}
+            for key, value in sorted(props.items()):
+                if isinstance(value, dict) and isinstance(
+                    self.cache.get_prop_validator(self.trace_class, path + (key,)),
+                    CompoundValidator,
+                ):
+                    value = sort_props(value, path + (key,))
+                sorted_props[key] = value
+            return sorted_props
+
+        trace = BaseDataValidator._make_unvalidated_trace(
+            self.trace_class, sort_props(self.props, ())
+        )
+        trace._validate = True
+        return trace
+
+
 def get_label(args, column):
     try:
         return args["labels"][column]
@@ -848,6 +1084,124 @@ def configure_geo(args, fig, orders):
     )
 
 
+def _frame_values_equal(a, b):
+    import numpy as np
+
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        if not (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)):
+            return False
+        if a.dtype != b.dtype or a.shape != b.shape:
+            return False
+        if a.dtype == object:
+            return a.tolist() == b.tolist()
+        # compare the buffers, so that NaNs are equal too
+        return a.tobytes() == b.tobytes()
+    if type(a) is not type(b):
+        return False
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        # e.g. lists of arrays
+        return False
+
+
+def _diff_frame_props(props, base_props):
+    """
+    Returns the properties of `props` which differ from `base_props`, or None if
+    `base_props` has properties that `props` doesn't have, since merging `props`
+    into `base_props` would then add these properties.
+    """
+    if any(key not in props for key in base_props):
+        return None
+    diff = {}
+    for key, value in props.items():
+        base_value = base_props.get(key)
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            sub_diff = _diff_frame_props(value, base_value)
+            if sub_diff is None:
+                return None
+            if sub_diff:
+                diff[key] = sub_diff
+        elif key not in base_props or not _frame_values_equal(value, base_value):
+            diff[key] = value
+    return diff
+
+
+def share_frame_data(fig):
+    """
+    Leaves out of the frames of a figure the properties they have in common
+    with its first frame, which becomes their `baseframe`: plotly.js merges
+    the properties of a frame into its base frame before applying it. Columns
+    that are the same in every frame, like a categorical x, labels, ids or
+    customdata, are then serialized only once instead of once per frame.
+
+    Frames with fewer traces than the first frame, or whose traces lack some
+    properties of the traces of the first frame, are left untouched, since the
+    merge would add traces or properties to them.
+
+    The frames then only hold the properties which differ from the first
+    frame, e.g. `fig.frames[1].data[0].x` is None if it is the same as in the
+    first frame, and they must be kept with the first frame. Call this once
+    the frames of the figure are final, before exporting it.
+
+    Parameters
+    ----------
+    fig: go.Figure
+        Figure with animation frames, e.g. made by a `plotly.express`
+        function with the `animation_frame` argument
+
+    Returns
+    -------
+    go.Figure
+        The figure, updated in place
+    """
+    frame_list = [frame._props for frame in fig.frames]
+    if len(frame_list) < 2:
+        return fig
+    base = frame_list[0]
+    if base.get("name") is None or "baseframe" in base or "traces" in base:
+        return fig
+    base_data = base.get("data", [])
+    shared = False
+    for i, frame in enumerate(frame_list[1:], 1):
+        data = frame.get("data", [])
+        if (
+            len(data) < len(base_data)
+            or "baseframe" in frame
+            or "traces" in frame
+            or ("layout" in frame) != ("layout" in base)
+        ):
+            continue
+        diffs = []
+        for props, base_props in zip(data, base_data):
+            if props.get("type") != base_props.get("type"):
+                break
+            diff = _diff_frame_props(props, base_props)
+            if diff is None:
+                break
+            # keep the type, which defaults to scatter
+            diffs.append(dict(type=props.get("type", "scatter"), **diff))
+        else:
+            layout = None
+            if "layout" in base:
+                layout = _diff_frame_props(frame["layout"], base["layout"])
+                if layout is None:
+                    continue
+            frame = dict(frame, data=diffs + data[len(base_data) :])
+            frame["baseframe"] = base["name"]
+            if layout:
+                frame["layout"] = layout
+            else:
+                frame.pop("layout", None)
+            frame_list[i] = frame
+            shared = True
+    if shared:
+        fig.frames = frame_list
+    return fig
+
+
 def configure_animation_controls(args, constructor, fig):
     def frame_args(duration):
         return {
@@ -1119,6 +1473,29 @@ def _get_reserved_col_names(args):
     return reserved_names
 
 
+def _get_referenced_col_names(args, columns):
+    """
+    This function builds the list of the columns of the data_frame argument
+    which are used as arguments, either as str arguments or as named series,
+    in the order of `columns`.
+    """
+    if "dimensions" in args and args["dimensions"] is None:
+        return list(columns)
+    referenced_names = set()
+    for field in args:
+        if field not in all_attrables:
+            continue
+        names = args[field] if field in array_attrables else [args[field]]
+        if names is None:
+            continue
+        for arg in names:
+            if isinstance(arg, str):
+                referenced_names.add(arg)
+            elif nw.dependencies.is_into_series(arg):
+                referenced_names.add(nw.from_native(arg, series_only=True).name)
+    return [col for col in columns if col in referenced_names]
+
+
 def _is_col_list(columns, arg, is_pd_like, native_namespace):
     """Returns True if arg looks like it's a list of columns or references to columns
     in df_input, and False otherwise (in which case it's assumed to be a single column
@@ -1490,6 +1867,11 @@ def build_dataframe(args, constructor):
     # True if Ibis, DuckDB, Vaex, or implements __dataframe__
     needs_interchanging = False
 
+    # Flag that indicates if data_frame needs to be collected.
+    # True if polars LazyFrame, Dask DataFrame or any other lazy frame supported
+    # by Narwhals
+    needs_collecting = False
+
     # If data_frame is provided, we parse it into a narwhals DataFrame, while accounting
     # for compatibility with pandas specific paths (e.g. Index/MultiIndex case).
     if df_provided:
@@ -1520,6 +1902,16 @@ def build_dataframe(args, constructor):
             needs_interchanging = nw.get_level(data_frame) == "interchange"
             columns = args["data_frame"].columns
 
+        # data_frame is a lazy frame natively supported via Narwhals. It is only
+        # collected once we know which of its columns are going to be plotted.
+        elif isinstance(
+            lazy_frame := nw.from_native(args["data_frame"], pass_through=True),
+            nw.LazyFrame,
+        ):
+            args["data_frame"] = lazy_frame
+            needs_collecting = True
+            columns = args["data_frame"].columns
+
         # data_frame is any other Series object natively supported via Narwhals.
         # With `pass_through=True`, the original object will be returned if unable to convert
         # to a Narwhals Series, making this condition False.
@@ -1577,7 +1969,7 @@ def build_dataframe(args, constructor):
     df_input: nw.DataFrame | None = args["data_frame"]
     index = (
         nw.maybe_get_index(df_input)
-        if df_provided and not needs_interchanging
+        if df_provided and not needs_interchanging and not needs_collecting
         else None
     )
     native_namespace = (
@@ -1660,31 +2052,24 @@ def build_dataframe(args, constructor):
     # If the data_frame has interchange-only support levelin Narwhals, then we need to
     # convert it to a full support level backend.
     # Hence we convert requires Interchange to PyArrow.
-    if needs_interchanging:
-        if wide_mode:
+    # Lazy frames are collected to their eager backend.
+    if needs_interchanging or needs_collecting:
+        # Save precious resources by only materialising the columns that are
+        # actually going to be plotted (in wide mode without `x` nor `y`, these
+        # are all the columns). The rest of the function then only ever sees
+        # these columns.
+        columns = _get_referenced_col_names(args, columns)
+        projected_frame = args["data_frame"].select(columns)
+        if needs_interchanging:
             args["data_frame"] = nw.from_native(
-                args["data_frame"].to_arrow(), eager_only=True
+                projected_frame.to_arrow(), eager_only=True
             )
         else:
-            # Save precious resources by only interchanging columns that are
-            # actually going to be plotted. This is tricky to do in the general case,
-            # because Plotly allows calls like `px.line(df, x='x', y=['y1', df['y1']])`,
-            # but interchange-only objects (e.g. DuckDB) don't typically have a concept
-            # of self-standing Series. It's more important to perform project pushdown
-            # here seeing as we're materialising to an (eager) PyArrow table.
-            necessary_columns = {
-                i for i in args.values() if isinstance(i, str) and i in columns
-            }
-            for field in args:
-                if args[field] is not None and field in array_attrables:
-                    necessary_columns.update(i for i in args[field] if i in columns)
-            columns = list(necessary_columns)
-            args["data_frame"] = nw.from_native(
-                args["data_frame"].select(columns).to_arrow(), eager_only=True
-            )
-        import pyarrow as pa
-
-        native_namespace = pa
+            args["data_frame"] = projected_frame.collect()
+        native_namespace = nw.get_native_namespace(args["data_frame"])
+        is_pd_like = nw.dependencies.is_pandas_like_dataframe(
+            args["data_frame"].to_native()
+        )
     missing_bar_dim = None
     if (
         constructor in [go.Scatter, go.Bar, go.Funnel] + hist2d_types
@@ -2381,6 +2766,25 @@ def infer_config(args, constructor, trace_patch, layout_patch):
     if "trendline_options" in args and args["trendline_options"] is None:
         args["trendline_options"] = dict()
 
+    if args.get("downsample") is not None and not (
+        args["downsample"] in downsample_functions
+        or (
+            isinstance(args["downsample"], int)
+            and not isinstance(args["downsample"], bool)
+            and args["downsample"] > 2
+        )
+    ):
+        raise ValueError(
+            "`downsample` must be one of None, 'lttb', 'minmax' or an integer "
+            + "greater than 2. '%s' was provided." % (args["downsample"],)
+        )
+
+    if "binning" in args and args["binning"] not in ["client", "server"]:
+        raise ValueError(
+            "`binning` must be one of 'client' or 'server'. "
+            + "'%s' was provided." % args["binning"]
+        )
+
     if "ecdfnorm" in args:
         if args.get("ecdfnorm", None) not in [None, "percent", "probability"]:
             raise ValueError(
@@ -2400,6 +2804,72 @@ def infer_config(args, constructor, trace_patch, layout_patch):
     return trace_specs, grouped_mappings, sizeref, show_colorbar
 
 
+def _partition_groups(df, required_grouper, orders, unique_cache):
+    """
+    Splits `df` into one data frame per combination of values of the
+    `required_grouper` columns, leaving out the rows with null values.
+
+    Rather than iterating over a group-by, which is slow with many groups, the
+    rows are sorted once by the position of their values in `orders` and each
+    group is sliced out of the sorted data frame. Groups are returned in the
+    order of `orders`, the rows of each group in their original order.
+
+    Returns
+    -------
+    list
+        The group names, as tuples of values of the `required_grouper` columns
+    list
+        The data frame of each group
+    """
+    import numpy as np
+
+    columns = df.columns
+    row_col = _generate_temporary_column_name(n_bytes=8, columns=columns)
+    code_col = _generate_temporary_column_name(n_bytes=8, columns=columns + [row_col])
+    keys = (
+        df.select(required_grouper)
+        .with_row_index(row_col)
+        .drop_nulls(subset=required_grouper)
+    )
+
+    # the code of a row for a grouper column is the index of its value in the
+    # unique values of the column, which is mapped to the position of the value
+    # in the orders, looked up in a dict rather than with `list.index`
+    unique_values = []
+    unique_positions = []
+    for col in required_grouper:
+        uniques, values = unique_cache[col]
+        position = {value: i for i, value in reversed(list(enumerate(orders[col])))}
+        unique_values.append(values)
+        unique_positions.append(np.array([position[value] for value in values]))
+        keys = keys.join(
+            uniques.to_frame().with_row_index(code_col + col), on=col, how="left"
+        )
+
+    rows = keys.get_column(row_col).to_numpy()
+    codes = [keys.get_column(code_col + col).to_numpy() for col in required_grouper]
+    positions = [p[c] for p, c in zip(unique_positions, codes)]
+
+    # sort by positions, the first grouper column first, then by row
+    order = np.lexsort([rows] + positions[::-1])
+    rows = rows[order]
+    codes = [c[order] for c in codes]
+    is_start = np.zeros(len(rows), dtype=bool)
+    is_start[:1] = True
+    for p in positions:
+        p = p[order]
+        is_start[1:] |= p[1:] != p[:-1]
+    starts = np.flatnonzero(is_start).tolist()
+    ends = starts[1:] + [len(rows)]
+
+    sorted_df = df[rows]
+    group_names = [
+        tuple(v[c[start]] for v, c in zip(unique_values, codes)) for start in starts
+    ]
+    group_frames = [sorted_df[start:end] for start, end in zip(starts, ends)]
+    return group_names, group_frames
+
+
 def get_groups_and_orders(args, grouper):
     """
     `orders` is the user-supplied ordering with the remaining data-frame-supplied
@@ -2422,10 +2892,9 @@ def get_groups_and_orders(args, grouper):
             single_group_name.append("")
         else:
             if col not in unique_cache:
-                unique_cache[col] = (
-                    df.get_column(col).unique(maintain_order=True).to_list()
-                )
-            uniques = unique_cache[col]
+                uniques = df.get_column(col).unique(maintain_order=True)
+                unique_cache[col] = (uniques, uniques.to_list())
+            uniques = unique_cache[col][1]
             if len(uniques) == 1:
                 single_group_name.append(uniques[0])
             if col not in orders:
@@ -2438,35 +2907,318 @@ def get_groups_and_orders(args, grouper):
         groups = {tuple(single_group_name): df}
     else:
         required_grouper = [group for group in orders if group in grouper]
-        grouped = dict(df.group_by(required_grouper, drop_null_keys=True).__iter__())
-
-        sorted_group_names = sorted(
-            grouped.keys(),
-            key=lambda values: [
-                orders[group].index(value) if value in orders[group] else -1
-                for group, value in zip(required_grouper, values)
-            ],
+        sorted_group_names, group_frames = _partition_groups(
+            df, required_grouper, orders, unique_cache
         )
 
         # calculate the full group_names by inserting "" in the tuple index for one_group groups
-        full_sorted_group_names = [
-            tuple(
-                [
-                    ""
-                    if col == one_group
-                    else sub_group_names[required_grouper.index(col)]
-                    for col in grouper
-                ]
-            )
-            for sub_group_names in sorted_group_names
+        grouper_index = [
+            None if col == one_group else required_grouper.index(col) for col in grouper
         ]
-
         groups = {
-            sf: grouped[s] for sf, s in zip(full_sorted_group_names, sorted_group_names)
+            tuple(
+                "" if i is None else sub_group_names[i] for i in grouper_index
+            ): group_frame
+            for sub_group_names, group_frame in zip(sorted_group_names, group_frames)
         }
     return groups, orders
 
 
+ServerBins = namedtuple("ServerBins", ["start", "size", "positions", "categories"])
+
+server_binned_constructors = {go.Histogram: go.Bar, go.Histogram2d: go.Heatmap}
+
+
+def _round_up(val, rounding_set, reverse=False):
+    """Port of plotly.js' Lib.roundUp: the smallest element of `rounding_set`
+    greater than `val`, or the largest element lower than or equal to `val` if
+    `reverse`"""
+    if reverse:
+        candidates = [r for r in rounding_set if r <= val]
+        return candidates[-1] if candidates else rounding_set[0]
+    candidates = [r for r in rounding_set if r > val]
+    return candidates[0] if candidates else rounding_set[-1]
+
+
+def _auto_bin_size(values, data_min, data_max, nbins, is2d):
+    """Port of the bin size computation of plotly.js' Axes.autoBin"""
+    import numpy as np
+
+    if nbins:
+        size0 = (data_max - data_min) / nbins
+    else:
+        n = len(values)
+        size0 = 2 * nw.to_py_scalar(values.std(ddof=0)) / n ** (0.25 if is2d else 0.4)
+        # the minimal bin size only matters when the data is made of a few
+        # distinct values: if the distinct values of a sample are already
+        # closer than size0 on average, their minimal difference is too
+        for sample in [values.head(10_000), values]:
+            n_unique = nw.to_py_scalar(sample.n_unique())
+            if n_unique > 1 and (data_max - data_min) / (n_unique - 1) < size0:
+                break
+        else:
+            distinct = np.sort(values.unique().to_numpy().astype(float))
+            min_diff = (data_max - data_min) or 1
+            err_diff = min_diff / max(n - 1, 1) / 10000
+            diffs = np.diff(distinct)
+            diffs = diffs[diffs > err_diff]
+            if len(diffs):
+                min_diff = min(min_diff, diffs.min())
+            msexp = 10 ** math.floor(math.log(min_diff) / math.log(10))
+            min_size = msexp * _round_up(
+                min_diff / msexp, [0.9, 1.9, 4.9, 9.9], reverse=True
+            )
+            size0 = max(min_size, size0)
+    if not size0 > 0 or not math.isfinite(size0):
+        size0 = 1
+    # piggyback off the tick code of plotly.js to make "nice" bin sizes
+    base = 10 ** math.floor(math.log(size0) / math.log(10))
+    return base * _round_up(size0 / base, [2, 5, 10])
+
+
+def _auto_shift_bins(col, bin_start, size, data_min, data_max, values):
+    """Port of plotly.js' autoShiftNumericBins, which moves the bins by half a
+    bin when many values fall on their edges"""
+
+    def near_edge(v):
+        # is a value within 1% of a bin edge?
+        return (1 + (v - bin_start) * 100 / size) % 100 < 2
+
+    counts = values.to_frame().select(
+        int_count=(nw.col(col) % 1 == 0).sum(),
+        edge_count=near_edge(nw.col(col)).sum(),
+        mid_count=near_edge(nw.col(col) + size / 2).sum(),
+    )
+    int_count, edge_count, mid_count = [
+        nw.to_py_scalar(counts.item(0, c)) for c in counts.columns
+    ]
+
+    if int_count == len(values):
+        if size < 1:
+            bin_start = data_min - 0.5 * size
+        else:
+            bin_start -= 0.5
+            if bin_start + size < data_min:
+                bin_start += size
+    elif mid_count < edge_count * 0.1:
+        if edge_count > len(values) * 0.3 or near_edge(data_min) or near_edge(data_max):
+            shift = size / 2
+            bin_start += shift if bin_start + shift < data_min else -shift
+    return bin_start
+
+
+def compute_server_bins(args, letter, nbins, is2d):
+    """
+    Computes the bins of the `letter` column over the whole data frame, in the
+    same way as the automatic binning of plotly.js so that the server-binned
+    figure looks like the client-binned one.
+    """
+    import numpy as np
+
+    col = args[letter]
+    df: nw.DataFrame = args["data_frame"]
+    series = df.get_column(col)
+    dtype = series.dtype
+    if dtype == nw.Datetime or dtype == nw.Date:
+        raise ValueError(
+            "`binning='server'` does not support date columns, '%s' is of type %s."
+            % (col, dtype)
+        )
+    if args.get("log_" + letter):
+        raise ValueError("`binning='server'` does not support `log_%s=True`." % letter)
+
+    values = series.drop_nulls()
+    if not dtype.is_numeric():
+        categories = values.unique(maintain_order=True).to_list()
+        if col in (args.get("category_orders") or {}):
+            order = list(args["category_orders"][col])
+            categories = [c for c in order if c in categories] + [
+                c for c in categories if c not in order
+            ]
+        return ServerBins(0, 1, categories, categories)
+
+    if dtype in (nw.Float32, nw.Float64):
+        # drop NaN and infinite values, is_between is false for NaN with
+        # every backend
+        values = values.filter(values.is_between(-math.inf, math.inf, closed="none"))
+    if len(values) == 0:
+        return ServerBins(0, 1, np.array([]), None)
+    data_min = nw.to_py_scalar(values.min())
+    data_max = nw.to_py_scalar(values.max())
+
+    size = _auto_bin_size(values, data_min, data_max, nbins, is2d)
+    tmin = math.ceil((data_min * 1.0001 - data_max * 0.0001) / size) * size
+    bin_start = _auto_shift_bins(
+        col, tmin - size, size, data_min, data_max, values.alias(col)
+    )
+    bin_count = 1 + math.floor((data_max - bin_start) / size)
+    bin_end = bin_start + bin_count * size
+
+    # plotly.js creates the bins by adding up their size
+    edges = np.cumsum(np.r_[bin_start, np.full(bin_count + 1, size)])
+    bin_count = int(np.count_nonzero(edges[:-1] < bin_end))
+    edges = edges[: bin_count + 1]
+    return ServerBins(bin_start, size, (edges[:-1] + edges[1:]) / 2, None)
+
+
+def make_server_binned_patch(args, trace_spec, trace_data, patch, bins):
+    """
+    Replaces the raw data of a histogram trace patch by the value of each bin,
+    computed with a group-by on `trace_data`, and drops the histogram-only
+    attributes so that the patch can be applied to a Bar or a Heatmap.
+    """
+    import numpy as np
+
+    patch = {
+        k: v
+        for k, v in patch.items()
+        if k
+        not in [
+            "histfunc",
+            "histnorm",
+            "cumulative",
+            "nbinsx",
+            "nbinsy",
+            "bingroup",
+            "xbingroup",
+            "ybingroup",
+        ]
+    }
+    histfunc = trace_spec.trace_patch.get("histfunc") or "count"
+    histnorm = trace_spec.trace_patch.get("histnorm") or ""
+    cumulative = (trace_spec.trace_patch.get("cumulative") or {}).get("enabled")
+    if trace_spec.constructor == go.Histogram2d:
+        letters = ["x", "y"]
+        value = args["z"]
+        patch.pop("orientation", None)
+    else:
+        letters = [trace_spec.marginal or trace_spec.trace_patch["bingroup"]]
+        other = "y" if letters[0] == "x" else "x"
+        value = None if trace_spec.marginal else args[other]
+        patch["orientation"] = "v" if letters[0] == "x" else "h"
+    if value is None:
+        histfunc = "count"
+    if cumulative:
+        histnorm = {"density": "", "probability density": "probability"}.get(
+            histnorm, histnorm
+        )
+
+    columns = [args[letter] for letter in letters]
+    if value is not None:
+        columns.append(value)
+    token = _generate_temporary_column_name(n_bytes=16, columns=columns)
+    keys = [letter + token for letter in letters]
+    key_exprs = []
+    for letter, key in zip(letters, keys):
+        col = args[letter]
+        trace_data = trace_data.filter(~nw.col(col).is_null())
+        if bins[letter].categories is not None:
+            key_exprs.append(nw.col(col).alias(key))
+            continue
+        if trace_data.schema[col] in (nw.Float32, nw.Float64):
+            trace_data = trace_data.filter(
+                nw.col(col).is_between(-math.inf, math.inf, closed="none")
+            )
+        # floor of a positive number, the bins cover the whole data frame
+        index = (nw.col(col) - bins[letter].start) / bins[letter].size + 1e-9
+        key_exprs.append((index - index % 1).cast(nw.Int64()).alias(key))
+
+    if histfunc == "count":
+        agg = nw.len()
+    else:
+        agg = nw.col(value)
+        if not trace_data.schema[value].is_numeric():
+            agg = agg.cast(nw.Float64())
+        agg = getattr(agg, "mean" if histfunc == "avg" else histfunc)()
+    result = (
+        trace_data.select(*key_exprs, *([nw.col(value)] if value else []))
+        .group_by(*keys)
+        .agg(agg.alias(token))
+    )
+
+    shape = [len(bins[letter].positions) for letter in letters]
+    fill = 0.0 if histfunc in ["count", "sum"] else np.nan
+    z = np.full(shape[::-1], fill)
+    index = []
+    for letter, key in zip(letters[::-1], keys[::-1]):
+        keys_values = result.get_column(key).to_list()
+        if bins[letter].categories is not None:
+            positions = {c: i for i, c in enumerate(bins[letter].categories)}
+            keys_values = [positions[k] for k in keys_values]
+        index.append(np.asarray(keys_values, dtype=int))
+    in_range = np.all([(i >= 0) & (i < n) for i, n in zip(index, shape[::-1])], axis=0)
+    z[tuple(i[in_range] for i in index)] = np.asarray(
+        result.get_column(token).cast(nw.Float64()).to_numpy(), dtype=float
+    )[in_range]
+
+    # same normalizations as plotly.js
+    total = np.nansum(z)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if histnorm == "percent":
+            z *= 100 / total
+        elif histnorm == "probability":
+            z /= total
+        elif histnorm in ["density", "probability density"]:
+            for letter in letters:
+                if bins[letter].categories is None:
+                    z /= bins[letter].size
+            if histnorm == "probability density":
+                z /= total
+    if cumulative:
+        z = np.nancumsum(z)
+
+    if trace_spec.constructor == go.Histogram2d:
+        patch.update(x=bins["x"].positions, y=bins["y"].positions, z=z)
+    else:
+        other = "y" if letters[0] == "x" else "x"
+        patch.update({letters[0]: bins[letters[0]].positions, other: z})
+        if bins[letters[0]].categories is None and shape[0] == 1:
+            patch["width"] = bins[letters[0]].size
+    return patch
+
+
+downsample_max_points = 2000
+
+
+def _downsample_values(trace_data, col):
+    """Numeric values of `col` for downsampling, or None if `col` is neither
+    numeric nor a date"""
+    import numpy as np
+
+    if col is None:
+        return None
+    series = trace_data.get_column(col)
+    if series.dtype == nw.Datetime or series.dtype == nw.Date:
+        series = _to_unix_epoch_seconds(series)
+    elif not series.dtype.is_numeric():
+        return None
+    return np.asarray(series.cast(nw.Float64()).to_numpy(), dtype=float)
+
+
+def downsample_trace_data(args, trace_data):
+    """
+    Keeps the rows of `trace_data` selected by the `downsample` method along
+    `x` (or `y` if `orientation` is `'h'`), in row order.
+    """
+    import numpy as np
+
+    downsample = args["downsample"]
+    if isinstance(downsample, str):
+        method, n_out = downsample, downsample_max_points
+    else:
+        method, n_out = "lttb", downsample
+    if len(trace_data) <= n_out:
+        return trace_data
+    base, value = ("y", "x") if args.get("orientation") == "h" else ("x", "y")
+    positions = _downsample_values(trace_data, args[base])
+    if positions is None:
+        positions = np.arange(len(trace_data), dtype=float)
+    values = _downsample_values(trace_data, args[value])
+    if values is None:
+        values = positions
+    return trace_data[downsample_functions[method](positions, values, n_out)]
+
+
 def make_figure(args, constructor, trace_patch=None, layout_patch=None):
     trace_patch = trace_patch or {}
     layout_patch = layout_patch or {}
@@ -2488,9 +3240,45 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
     trace_specs, grouped_mappings, sizeref, show_colorbar = infer_config(
         args, constructor, trace_patch, layout_patch
     )
+    if args.get("downsample") is not None:
+        # downsampling drops rows, keep the original row of each point
+        index_col = _generate_temporary_column_name(
+            n_bytes=16, columns=args["data_frame"].columns
+        )
+        args["data_frame"] = args["data_frame"].with_row_index(index_col)
+        args["custom_data"] = list(args["custom_data"] or []) + [index_col]
+    downsample_sources = []
+
     grouper = [x.grouper or one_group for x in grouped_mappings] or [one_group]
     groups, orders = get_groups_and_orders(args, grouper)
 
+    # With server binning, the bins are shared by all the traces like a
+    # bingroup would on the client side
+    server_bins = None
+    if args.get("binning") == "server":
+        is2d = constructor == go.Histogram2d
+        server_bins = {}
+        for trace_spec in trace_specs:
+            if trace_spec.constructor == go.Histogram2d:
+                letters = ["x", "y"]
+            elif trace_spec.constructor == go.Histogram:
+                letters = [trace_spec.marginal or trace_spec.trace_patch["bingroup"]]
+            else:
+                continue
+            for letter in letters:
+                if letter not in server_bins:
+                    server_bins[letter] = compute_server_bins(
+                        args,
+                        letter,
+                        trace_specs[0].trace_patch.get("nbins" + letter),
+                        is2d,
+                    )
+            if (
+                trace_spec.constructor == go.Histogram
+                and args["template"].layout.bargap is None
+            ):
+                layout_patch["bargap"] = 0
+
     col_labels = []
     row_labels = []
     nrows = ncols = 1
@@ -2518,6 +3306,7 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
     trendline_rows = []
     trace_name_labels = None
     facet_col_wrap = args.get("facet_col_wrap", 0)
+    validation_cache = _TraceBuilderCache()
     for group_name, group in groups.items():
         mapping_labels = OrderedDict()
         trace_name_labels = OrderedDict()
@@ -2538,7 +3327,13 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
 
         for trace_spec in trace_specs:
             # Create the trace
-            trace = trace_spec.constructor(name=trace_name)
+            trace_constructor = trace_spec.constructor
+            if server_bins is not None:
+                trace_constructor = server_binned_constructors.get(
+                    trace_constructor, trace_constructor
+                )
+            trace = _TraceBuilder(trace_constructor, validation_cache)
+            trace.update(name=trace_name)
             if trace_spec.constructor not in [
                 go.Parcats,
                 go.Parcoords,
@@ -2639,9 +3434,9 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
             if (
                 trace_specs[0].constructor == go.Histogram2dContour
                 and trace_spec.constructor == go.Box
-                and trace.line.color
+                and trace.props.get("line", {}).get("color")
             ):
-                trace.update(marker=dict(color=trace.line.color))
+                trace.update(marker=dict(color=trace.props["line"]["color"]))
 
             if "ecdfmode" in args:
                 base = args["x"] if args["orientation"] == "v" else args["y"]
@@ -2663,9 +3458,22 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
                 elif args["ecdfnorm"] == "percent":
                     group = group.with_columns((nw.col(var) / group_sum) * 100.0)
 
+            trace_data = group
+            downsampled = (
+                args.get("downsample") is not None and trace_spec is trace_specs[0]
+            )
+            if downsampled:
+                trace_data = downsample_trace_data(args, group)
             patch, fit_results = make_trace_kwargs(
-                args, trace_spec, group, mapping_labels.copy(), sizeref
+                args, trace_spec, trace_data, mapping_labels.copy(), sizeref
             )
+            if server_bins is not None and trace_spec.constructor in [
+                go.Histogram,
+                go.Histogram2d,
+            ]:
+                patch = make_server_binned_patch(
+                    args, trace_spec, group, patch, server_bins
+                )
             trace.update(patch)
             if fit_results is not None:
                 trendline_rows.append(mapping_labels.copy())
@@ -2673,6 +3481,16 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
             if frame_name not in frames:
                 frames[frame_name] = dict(data=[], name=frame_name)
             frames[frame_name]["data"].append(trace)
+            if downsampled and args.get("downsample_on_zoom"):
+                downsample_sources.append(
+                    (
+                        frame_name,
+                        len(frames[frame_name]["data"]) - 1,
+                        trace_spec,
+                        group,
+                        mapping_labels.copy(),
+                    )
+                )
     frame_list = [f for f in frames.values()]
     if len(frame_list) > 1:
         frame_list = sorted(
@@ -2732,10 +3550,10 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
         args, subplot_type, frame_list, nrows, ncols, col_labels, row_labels
     )
 
-    # Position traces in subplots
+    # Position traces in subplots and create them
     for frame in frame_list:
         for trace in frame["data"]:
-            if isinstance(trace, go.Splom):
+            if trace.trace_class == go.Splom:
                 # Special case that is not compatible with make_subplots
                 continue
 
@@ -2746,9 +3564,11 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
                 nrows - trace._subplot_row + 1,
                 trace._subplot_col,
             )
+        frame["data"] = [trace.build() for trace in frame["data"]]
 
     # Add traces, layout and frames to figure
-    fig.add_traces(frame_list[0]["data"] if len(frame_list) > 0 else [])
+    # The traces were validated as they were built, so they are added as is
+    fig.add_traces(frame_list[0]["data"] if len(frame_list) > 0 else [], validate=False)
     fig.update_layout(layout_patch)
     if "template" in args and args["template"] is not None:
         fig.update_layout(template=args["template"], overwrite=True)
@@ -2756,6 +3576,19 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
         f["name"] = str(f["name"])
     fig.frames = frame_list if len(frames) > 1 else []
 
+    if args.get("downsample") is not None and args.get("downsample_on_zoom"):
+        # the full-resolution data of the traces of the first frame, to
+        # downsample them again when their range changes
+        fig._px_downsample = dict(
+            args=args,
+            sizeref=sizeref,
+            traces={
+                i: (trace_spec, group, labels)
+                for frame_name, i, trace_spec, group, labels in downsample_sources
+                if frame_list and str(frame_name) == frame_list[0]["name"]
+            },
+        )
+
     if args.get("trendline") and args.get("trendline_scope", "trace") == "overall":
         trendline_spec = make_trendline_spec(args, constructor)
         trendline_trace = trendline_spec.constructor(
@@ -571,6 +571,29 @@ docs = dict(
     nbins=["int", "Positive integer.", "Sets the number of bins."],
     nbinsx=["int", "Positive integer.", "Sets the number of bins along the x axis."],
     nbinsy=["int", "Positive integer.", "Sets the number of bins along the y axis."],
+    downsample=[
+        "str or int (default `None`)",
+        "One of `'lttb'` or `'minmax'`, or a maximum number of points per trace.",
+        "If set, the points of each trace are decimated in Python before the figure is built, "
+        "along `x` (or `y` if `orientation` is `'h'`) in the order of the rows of `data_frame`: "
+        "`'lttb'` keeps the points which best preserve the shape of the line (Largest-Triangle-Three-Buckets) "
+        "and `'minmax'` keeps the lowest and highest points of each bucket, both up to 2000 points per trace. "
+        "An integer keeps up to that many points with `'lttb'`. "
+        "The original row of each point is appended to `custom_data`.",
+    ],
+    downsample_on_zoom=[
+        "boolean (default `False`)",
+        "If `True`, the figure keeps the full-resolution data of the traces downsampled with `downsample`, "
+        "so that `plotly.express.register_downsampling` can downsample them again on zoom in a `go.FigureWidget`.",
+    ],
+    binning=[
+        "str (default `'client'`)",
+        "One of `'client'` or `'server'`",
+        "If `'client'`, the raw data is sent to the browser where it is binned.",
+        "If `'server'`, the bins and the values of `histfunc` and `histnorm` are computed in Python "
+        "and the figure holds one value per bin, in a `go.Bar` or `go.Heatmap` trace. "
+        "The bins are shared by all the traces and animation frames.",
+    ],
     branchvalues=[
         "str",
         "'total' or 'remainder'",
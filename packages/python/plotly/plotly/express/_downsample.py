@@ -0,0 +1,103 @@
+import numpy as np
+
+
+def _bucket_edges(start, stop, n_buckets):
+    """Edges of `n_buckets` buckets of (almost) equal size covering the points
+    from `start` to `stop`"""
+    return np.linspace(start, stop, n_buckets + 1).astype(np.intp)
+
+
+def minmax(x, y, n_out):
+    """
+    Min-max decimation: keeps the first and the last point, and the points with
+    the lowest and the highest `y` in each of the `n_out // 2 - 1` buckets of
+    points in between, so that no peak of the series is lost.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Position of the points (shape N), unused
+    y : np.ndarray
+        Value of the points (shape N)
+    n_out : int
+        Maximum number of points to keep
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the points to keep
+    """
+    n = len(y)
+    n_buckets = n_out // 2 - 1
+    if n <= n_out or n_buckets < 1:
+        return np.arange(n)
+    # pad the points in between the first and the last one to a multiple of
+    # the bucket size with NaNs, which are never picked
+    size = -(-(n - 2) // n_buckets)
+    values = np.full(n_buckets * size, np.nan)
+    values[: n - 2] = y[1:-1]
+    values = values.reshape(n_buckets, size)
+    missing = np.isnan(values)
+    offsets = np.arange(n_buckets) * size + 1
+    argmin = np.where(missing, np.inf, values).argmin(axis=1) + offsets
+    argmax = np.where(missing, -np.inf, values).argmax(axis=1) + offsets
+    inner = np.sort(np.concatenate([argmin, argmax]))
+    return np.unique(np.concatenate([[0], inner[inner < n - 1], [n - 1]]))
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling: keeps the first and the last
+    point, and in each of the `n_out - 2` buckets of points in between the
+    point forming the largest triangle with the point kept in the previous
+    bucket and the average point of the next bucket.
+
+    Each bucket is processed with vectorized operations, so that the total cost
+    is linear in the number of points.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Position of the points (shape N)
+    y : np.ndarray
+        Value of the points (shape N)
+    n_out : int
+        Maximum number of points to keep
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the points to keep
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = _bucket_edges(1, n - 1, n_out - 2)
+
+    # average point of each bucket, the last point being the last bucket
+    valid = ~(np.isnan(x) | np.isnan(y))
+    counts = np.add.reduceat(valid, edges[:-1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_x = np.add.reduceat(np.where(valid, x, 0), edges[:-1]) / counts
+        avg_y = np.add.reduceat(np.where(valid, y, 0), edges[:-1]) / counts
+    avg_x = np.append(avg_x[1:], x[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0] = 0
+    kept[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y[i] - y[a])
+        )
+        a = lo + np.argmax(np.nan_to_num(area, nan=-1.0))
+        kept[i + 1] = a
+    return kept
+
+
+downsample_functions = {"lttb": lttb, "minmax": minmax}
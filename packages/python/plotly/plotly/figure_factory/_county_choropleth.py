@@ -311,86 +311,164 @@ def _intervals_as_labels(array_of_intervals, round_legend_values, exponent_forma
     return string_intervals
 
 
+def _ring_coordinates(polygons, tolerance):
+    """
+    Concatenate the simplified exterior rings of polygons into flat arrays
+    of x and y coordinates, with a nan after each ring
+    """
+    x_rings = []
+    y_rings = []
+    for poly in polygons:
+        x, y = poly.simplify(tolerance).exterior.xy
+        x_rings.extend([np.asarray(x), [np.nan]])
+        y_rings.extend([np.asarray(y), [np.nan]])
+    if not x_rings:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(x_rings), np.concatenate(y_rings)
+
+
+def _to_coordinate_list(arrays):
+    """
+    Concatenate flat coordinate arrays, with nan ring separators, into a list
+    """
+    if not arrays:
+        return []
+    return np.concatenate(arrays).tolist()
+
+
+class _CountyGeometry(object):
+    """
+    County and state geometry read once from the plotly-geo shapefiles
+
+    Holds the polygon, county and state names and centroids of each county
+    keyed by FIPS, and caches the simplified rings of counties and states
+    for each simplification tolerance as flat coordinate arrays.
+    """
+
+    def __init__(self, df, df_state):
+        self.df = df
+        self.df_state = df_state
+        self.polygons = dict(zip(df["FIPS"].tolist(), df["geometry"].tolist()))
+
+        first_rows = df.drop_duplicates("FIPS")
+        self.names = dict(
+            zip(
+                first_rows["FIPS"].tolist(),
+                zip(
+                    first_rows["COUNTY_NAME"].astype(str).tolist(),
+                    first_rows["STATE_NAME"].astype(str).tolist(),
+                ),
+            )
+        )
+
+        self.centroids = {}
+        for f, polygon in self.polygons.items():
+            if polygon.geom_type == "Polygon":
+                x_c, y_c = polygon.centroid.xy
+                self.centroids[f] = ([x_c[0]], [y_c[0]])
+            elif polygon.geom_type == "MultiPolygon":
+                self.centroids[f] = (
+                    [poly.centroid.xy[0].tolist() for poly in polygon.geoms],
+                    [poly.centroid.xy[1].tolist() for poly in polygon.geoms],
+                )
+
+        self._county_rings = {}
+        self._state_rings = {}
+
+    def county_rings(self, f, tolerance):
+        """
+        Simplified rings of the county with FIPS f, with a nan after each ring
+        """
+        key = (f, tolerance)
+        if key not in self._county_rings:
+            polygon = self.polygons[f]
+            if polygon.geom_type == "Polygon":
+                polygons = [polygon]
+            elif polygon.geom_type == "MultiPolygon":
+                polygons = polygon.geoms
+            else:
+                polygons = []
+            self._county_rings[key] = _ring_coordinates(polygons, tolerance)
+        return self._county_rings[key]
+
+    def state_rings(self, index, tolerance):
+        """
+        Simplified outline of the state in row index of df_state, with a nan
+        after each ring of a multi-part state and at the end of the outline
+        """
+        key = (index, tolerance)
+        if key not in self._state_rings:
+            geometry = self.df_state["geometry"][index]
+            if geometry.geom_type == "Polygon":
+                x, y = geometry.simplify(tolerance).exterior.xy
+                x = np.append(x, np.nan)
+                y = np.append(y, np.nan)
+            elif geometry.geom_type == "MultiPolygon":
+                x, y = _ring_coordinates(geometry.geoms, tolerance)
+                x = np.append(x, np.nan)
+                y = np.append(y, np.nan)
+            else:
+                x = np.array([np.nan])
+                y = np.array([np.nan])
+            self._state_rings[key] = (x, y)
+        return self._state_rings[key]
+
+
+_us_counties_geometry = None
+
+
+def _get_us_counties_geometry():
+    """
+    Return the county geometry store, reading the shapefiles on first use
+    """
+    global _us_counties_geometry
+    if _us_counties_geometry is None:
+        df, df_state = _create_us_counties_df(st_to_state_name_dict, state_to_st_dict)
+        _us_counties_geometry = _CountyGeometry(df, df_state)
+    return _us_counties_geometry
+
+
 def _calculations(
-    df,
-    fips,
+    geometry,
     values,
     index,
     f,
     simplify_county,
     level,
-    x_centroids,
-    y_centroids,
-    centroid_text,
+    centroids,
     x_traces,
     y_traces,
-    fips_polygon_map,
 ):
+    polygon = geometry.polygons[f]
+    if polygon.geom_type not in ("Polygon", "MultiPolygon"):
+        return
+
     # 0-pad FIPS code to ensure exactly 5 digits
     padded_f = str(f).zfill(5)
-    if fips_polygon_map[f].type == "Polygon":
-        x = fips_polygon_map[f].simplify(simplify_county).exterior.xy[0].tolist()
-        y = fips_polygon_map[f].simplify(simplify_county).exterior.xy[1].tolist()
-
-        x_c, y_c = fips_polygon_map[f].centroid.xy
-        county_name_str = str(df[df["FIPS"] == f]["COUNTY_NAME"].iloc[0])
-        state_name_str = str(df[df["FIPS"] == f]["STATE_NAME"].iloc[0])
-
-        t_c = (
-            "County: "
-            + county_name_str
-            + "<br>"
-            + "State: "
-            + state_name_str
-            + "<br>"
-            + "FIPS: "
-            + padded_f
-            + "<br>Value: "
-            + str(values[index])
-        )
-
-        x_centroids.append(x_c[0])
-        y_centroids.append(y_c[0])
-        centroid_text.append(t_c)
-
-        x_traces[level] = x_traces[level] + x + [np.nan]
-        y_traces[level] = y_traces[level] + y + [np.nan]
-    elif fips_polygon_map[f].type == "MultiPolygon":
-        x = [
-            poly.simplify(simplify_county).exterior.xy[0].tolist()
-            for poly in fips_polygon_map[f].geoms
-        ]
-        y = [
-            poly.simplify(simplify_county).exterior.xy[1].tolist()
-            for poly in fips_polygon_map[f].geoms
-        ]
+    x, y = geometry.county_rings(f, simplify_county)
+    x_c, y_c = geometry.centroids[f]
+    county_name_str, state_name_str = geometry.names[f]
+
+    text = (
+        "County: "
+        + county_name_str
+        + "<br>"
+        + "State: "
+        + state_name_str
+        + "<br>"
+        + "FIPS: "
+        + padded_f
+        + "<br>Value: "
+        + str(values[index])
+    )
 
-        x_c = [poly.centroid.xy[0].tolist() for poly in fips_polygon_map[f].geoms]
-        y_c = [poly.centroid.xy[1].tolist() for poly in fips_polygon_map[f].geoms]
-
-        county_name_str = str(df[df["FIPS"] == f]["COUNTY_NAME"].iloc[0])
-        state_name_str = str(df[df["FIPS"] == f]["STATE_NAME"].iloc[0])
-        text = (
-            "County: "
-            + county_name_str
-            + "<br>"
-            + "State: "
-            + state_name_str
-            + "<br>"
-            + "FIPS: "
-            + padded_f
-            + "<br>Value: "
-            + str(values[index])
-        )
-        t_c = [text for poly in fips_polygon_map[f].geoms]
-        x_centroids = x_c + x_centroids
-        y_centroids = y_c + y_centroids
-        centroid_text = t_c + centroid_text
-        for x_y_idx in range(len(x)):
-            x_traces[level] = x_traces[level] + x[x_y_idx] + [np.nan]
-            y_traces[level] = y_traces[level] + y[x_y_idx] + [np.nan]
+    # The centroids of multi-part counties go in front of the centroids of
+    # the counties before them
+    prepend = polygon.geom_type == "MultiPolygon"
+    centroids.append((x_c, y_c, [text] * len(x_c), prepend))
 
-    return x_traces, y_traces, x_centroids, y_centroids, centroid_text
+    x_traces[level].append(x)
+    y_traces[level].append(y)
 
 
 def create_choropleth(
@@ -641,9 +719,8 @@ $ conda install -c plotly plotly-geo
             "```"
         )
 
-    df, df_state = _create_us_counties_df(st_to_state_name_dict, state_to_st_dict)
-
-    fips_polygon_map = dict(zip(df["FIPS"].tolist(), df["geometry"].tolist()))
+    geometry = _get_us_counties_geometry()
+    df, df_state = geometry.df, geometry.df_state
 
     if not state_outline:
         state_outline = {"color": "rgb(240, 240, 240)", "width": 1}
@@ -764,73 +841,42 @@ $ conda install -c plotly plotly-geo
     df_state = df_state[df_state["STATE_NAME"].isin(scope_names)]
 
     plot_data = []
-    x_centroids = []
-    y_centroids = []
-    centroid_text = []
+    centroids = []
     fips_not_in_shapefile = []
-    if not binning_endpoints:
-        for index, f in enumerate(fips):
-            level = values[index]
-            try:
-                fips_polygon_map[f].type
-
-                (
-                    x_traces,
-                    y_traces,
-                    x_centroids,
-                    y_centroids,
-                    centroid_text,
-                ) = _calculations(
-                    df,
-                    fips,
-                    values,
-                    index,
-                    f,
-                    simplify_county,
-                    level,
-                    x_centroids,
-                    y_centroids,
-                    centroid_text,
-                    x_traces,
-                    y_traces,
-                    fips_polygon_map,
-                )
-            except KeyError:
-                fips_not_in_shapefile.append(f)
-
-    else:
-        for index, f in enumerate(fips):
+    for index, f in enumerate(fips):
+        if binning_endpoints:
             for j, inter in enumerate(intervals):
                 if inter[0] < values[index] <= inter[1]:
                     break
             level = LEVELS[j]
+        else:
+            level = values[index]
 
-            try:
-                fips_polygon_map[f].type
-
-                (
-                    x_traces,
-                    y_traces,
-                    x_centroids,
-                    y_centroids,
-                    centroid_text,
-                ) = _calculations(
-                    df,
-                    fips,
-                    values,
-                    index,
-                    f,
-                    simplify_county,
-                    level,
-                    x_centroids,
-                    y_centroids,
-                    centroid_text,
-                    x_traces,
-                    y_traces,
-                    fips_polygon_map,
-                )
-            except KeyError:
-                fips_not_in_shapefile.append(f)
+        if f not in geometry.polygons:
+            fips_not_in_shapefile.append(f)
+            continue
+
+        _calculations(
+            geometry,
+            values,
+            index,
+            f,
+            simplify_county,
+            level,
+            centroids,
+            x_traces,
+            y_traces,
+        )
+
+    x_centroids = []
+    y_centroids = []
+    centroid_text = []
+    for x_c, y_c, t_c, prepend in [c for c in reversed(centroids) if c[3]] + [
+        c for c in centroids if not c[3]
+    ]:
+        x_centroids.extend(x_c)
+        y_centroids.extend(y_c)
+        centroid_text.extend(t_c)
 
     if len(fips_not_in_shapefile) > 0:
         msg = (
@@ -844,28 +890,16 @@ $ conda install -c plotly plotly-geo
 
     x_states = []
     y_states = []
-    for index, row in df_state.iterrows():
-        if df_state["geometry"][index].type == "Polygon":
-            x = row.geometry.simplify(simplify_state).exterior.xy[0].tolist()
-            y = row.geometry.simplify(simplify_state).exterior.xy[1].tolist()
-            x_states = x_states + x
-            y_states = y_states + y
-        elif df_state["geometry"][index].type == "MultiPolygon":
-            x = [
-                poly.simplify(simplify_state).exterior.xy[0].tolist()
-                for poly in df_state["geometry"][index].geoms
-            ]
-            y = [
-                poly.simplify(simplify_state).exterior.xy[1].tolist()
-                for poly in df_state["geometry"][index].geoms
-            ]
-            for segment in range(len(x)):
-                x_states = x_states + x[segment]
-                y_states = y_states + y[segment]
-                x_states.append(np.nan)
-                y_states.append(np.nan)
-        x_states.append(np.nan)
-        y_states.append(np.nan)
+    for index in df_state.index:
+        x, y = geometry.state_rings(index, simplify_state)
+        x_states.append(x)
+        y_states.append(y)
+    x_states = _to_coordinate_list(x_states)
+    y_states = _to_coordinate_list(y_states)
+
+    for lev in LEVELS:
+        x_traces[lev] = _to_coordinate_list(x_traces[lev])
+        y_traces[lev] = _to_coordinate_list(y_traces[lev])
 
     for lev in LEVELS:
         county_data = dict(
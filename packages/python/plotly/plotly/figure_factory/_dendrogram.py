@@ -19,6 +19,9 @@ def create_dendrogram(
     linkagefun=lambda x: sch.linkage(x, "complete"),
     hovertext=None,
     color_threshold=None,
+    merge_traces=False,
+    linkage=None,
+    distances=None,
 ):
     """
     Function that returns a dendrogram Plotly figure object. This is a thin
@@ -43,6 +46,17 @@ def create_dendrogram(
     :param (list[list]) hovertext: List of hovertext for constituent traces of dendrogram
                                clusters
     :param (double) color_threshold: Value at which the separation of clusters will be made
+    :param (bool) merge_traces: If True, all the links of the same color are
+                                drawn by a single trace, as segments separated
+                                by NaN values, instead of one trace per link.
+                                Much faster for dendrograms with many leaves.
+    :param (ndarray) linkage: Precomputed linkage matrix, as returned by
+                              scipy.cluster.hierarchy.linkage. If given,
+                              distfun and linkagefun are not called and X may
+                              be None
+    :param (ndarray) distances: Precomputed pairwise distances, as returned
+                                by distfun. If given, distfun is not called
+                                and X may be None
 
     Example 1: Simple bottom oriented dendrogram
 
@@ -77,6 +91,18 @@ def create_dendrogram(
     >>> df = pd.DataFrame(abs(np.random.randn(10, 10)), index=Index)
     >>> fig = create_dendrogram(df, labels=Index)
     >>> fig.show()
+
+    Example 4: Dendrogram of many observations from a precomputed linkage
+
+    >>> from plotly.figure_factory import create_dendrogram
+    >>> from scipy.cluster.hierarchy import linkage
+
+    >>> import numpy as np
+
+    >>> X = np.random.rand(2000, 10)
+    >>> Z = linkage(X, "complete")
+    >>> fig = create_dendrogram(X, linkage=Z, merge_traces=True)
+    >>> fig.show()
     """
     if not scp or not scs or not sch:
         raise ImportError(
@@ -84,9 +110,10 @@ def create_dendrogram(
                             scipy.spatial and scipy.hierarchy"
         )
 
-    s = X.shape
-    if len(s) != 2:
-        exceptions.PlotlyError("X should be 2-dimensional array.")
+    if linkage is None and distances is None:
+        s = X.shape
+        if len(s) != 2:
+            exceptions.PlotlyError("X should be 2-dimensional array.")
 
     if distfun is None:
         distfun = scs.distance.pdist
@@ -100,6 +127,9 @@ def create_dendrogram(
         linkagefun=linkagefun,
         hovertext=hovertext,
         color_threshold=color_threshold,
+        merge_traces=merge_traces,
+        linkage=linkage,
+        distances=distances,
     )
 
     return graph_objs.Figure(data=dendrogram.data, layout=dendrogram.layout)
@@ -122,6 +152,9 @@ class _Dendrogram(object):
         linkagefun=lambda x: sch.linkage(x, "complete"),
         hovertext=None,
         color_threshold=None,
+        merge_traces=False,
+        linkage=None,
+        distances=None,
     ):
         self.orientation = orientation
         self.labels = labels
@@ -146,7 +179,15 @@ class _Dendrogram(object):
             distfun = scs.distance.pdist
 
         (dd_traces, xvals, yvals, ordered_labels, leaves) = self.get_dendrogram_traces(
-            X, colorscale, distfun, linkagefun, hovertext, color_threshold
+            X,
+            colorscale,
+            distfun,
+            linkagefun,
+            hovertext,
+            color_threshold,
+            merge_traces=merge_traces,
+            linkage=linkage,
+            distances=distances,
         )
 
         self.labels = ordered_labels
@@ -154,11 +195,7 @@ class _Dendrogram(object):
         yvals_flat = yvals.flatten()
         xvals_flat = xvals.flatten()
 
-        self.zero_vals = []
-
-        for i in range(len(yvals_flat)):
-            if yvals_flat[i] == 0.0 and xvals_flat[i] not in self.zero_vals:
-                self.zero_vals.append(xvals_flat[i])
+        self.zero_vals = list(np.unique(xvals_flat[yvals_flat == 0.0]))
 
         if len(self.zero_vals) > len(yvals) + 1:
             # If the length of zero_vals is larger than the length of yvals,
@@ -310,7 +347,16 @@ class _Dendrogram(object):
         return self.layout
 
     def get_dendrogram_traces(
-        self, X, colorscale, distfun, linkagefun, hovertext, color_threshold
+        self,
+        X,
+        colorscale,
+        distfun,
+        linkagefun,
+        hovertext,
+        color_threshold,
+        merge_traces=False,
+        linkage=None,
+        distances=None,
     ):
         """
         Calculates all the elements needed for plotting a dendrogram.
@@ -322,6 +368,12 @@ class _Dendrogram(object):
         :param (function) linkagefun: Function to compute the linkage matrix
                                       from the pairwise distances
         :param (list) hovertext: List of hovertext for constituent traces of dendrogram
+        :param (double) color_threshold: Value at which the separation of
+                                         clusters will be made
+        :param (bool) merge_traces: Draw all the links of the same color with
+                                    a single NaN separated trace
+        :param (ndarray) linkage: Precomputed linkage matrix
+        :param (ndarray) distances: Precomputed pairwise distances
         :rtype (tuple): Contains all the traces in the following order:
             (a) trace_list: List of Plotly trace objects for dendrogram tree
             (b) icoord: All X points of the dendrogram tree as array of arrays
@@ -333,8 +385,10 @@ class _Dendrogram(object):
             (e) P['leaves']: left-to-right traversal of the leaves
 
         """
-        d = distfun(X)
-        Z = linkagefun(d)
+        Z = linkage
+        if Z is None:
+            d = distances if distances is not None else distfun(X)
+            Z = linkagefun(d)
         P = sch.dendrogram(
             Z,
             orientation=self.orientation,
@@ -349,44 +403,68 @@ class _Dendrogram(object):
         color_list = np.array(P["color_list"])
         colors = self.get_color_dict(colorscale)
 
-        trace_list = []
+        # xs and ys are arrays of 4 points that make up the '∩' shapes
+        # of the dendrogram tree
+        if self.orientation in ["top", "bottom"]:
+            xs, ys = icoord, dcoord
+        else:
+            xs, ys = dcoord, icoord
+        xs = np.multiply(self.sign[self.xaxis], xs)
+        ys = np.multiply(self.sign[self.yaxis], ys)
+
+        try:
+            x_index = int(self.xaxis[-1])
+        except ValueError:
+            x_index = ""
+
+        try:
+            y_index = int(self.yaxis[-1])
+        except ValueError:
+            y_index = ""
+
+        if merge_traces:
+            # Group the links by their color, in order of first appearance
+            link_colors = np.array([colors[color_key] for color_key in color_list])
+            trace_colors, first = np.unique(link_colors, return_index=True)
+            trace_colors = trace_colors[np.argsort(first)]
+            groups = [np.flatnonzero(link_colors == c) for c in trace_colors]
+        else:
+            trace_colors = [colors[color_key] for color_key in color_list]
+            groups = range(len(icoord))
 
-        for i in range(len(icoord)):
-            # xs and ys are arrays of 4 points that make up the '∩' shapes
-            # of the dendrogram tree
-            if self.orientation in ["top", "bottom"]:
-                xs = icoord[i]
-            else:
-                xs = dcoord[i]
+        trace_list = []
 
-            if self.orientation in ["top", "bottom"]:
-                ys = dcoord[i]
-            else:
-                ys = icoord[i]
-            color_key = color_list[i]
+        for color, links in zip(trace_colors, groups):
             hovertext_label = None
-            if hovertext:
-                hovertext_label = hovertext[i]
+            if merge_traces:
+                # Separate the links by a NaN point so that they are drawn as
+                # disconnected lines
+                gap = np.full((len(links), 1), np.nan)
+                x = np.hstack([xs[links], gap]).ravel()
+                y = np.hstack([ys[links], gap]).ravel()
+                if hovertext:
+                    hovertext_label = []
+                    for i in links:
+                        label = hovertext[i]
+                        if isinstance(label, str) or len(label) != 4:
+                            label = [label] * 4
+                        hovertext_label.extend(label)
+                        hovertext_label.append(None)
+            else:
+                x = xs[links]
+                y = ys[links]
+                if hovertext:
+                    hovertext_label = hovertext[links]
             trace = dict(
                 type="scatter",
-                x=np.multiply(self.sign[self.xaxis], xs),
-                y=np.multiply(self.sign[self.yaxis], ys),
+                x=x,
+                y=y,
                 mode="lines",
-                marker=dict(color=colors[color_key]),
+                marker=dict(color=color),
                 text=hovertext_label,
                 hoverinfo="text",
             )
 
-            try:
-                x_index = int(self.xaxis[-1])
-            except ValueError:
-                x_index = ""
-
-            try:
-                y_index = int(self.yaxis[-1])
-            except ValueError:
-                y_index = ""
-
             trace["xaxis"] = f"x{x_index}"
             trace["yaxis"] = f"y{y_index}"
 
@@ -11,6 +11,7 @@ scipy_stats = optional_imports.get_module("scipy.stats")
 
 DEFAULT_HISTNORM = "probability density"
 ALTERNATIVE_HISTNORM = "probability"
+KDE_GRID_SIZE = 1024
 
 
 def validate_distplot(hist_data, curve_type):
@@ -58,6 +59,8 @@ def create_distplot(
     show_hist=True,
     show_curve=True,
     show_rug=True,
+    binned=False,
+    max_rug_points=1000,
 ):
     """
     Function that creates a distplot similar to seaborn.distplot;
@@ -89,6 +92,13 @@ def create_distplot(
     :param (bool) show_rug: Add rug to distplot? Default = True
     :param (list[str]) colors: Colors for traces.
     :param (list[list]) rug_text: Hovertext values for rug_plot,
+    :param (bool) binned: If True, the histograms are computed in Python and
+        drawn as bars, the kde is computed by FFT convolution of the binned
+        samples and the rug shows at most `max_rug_points` samples, so the
+        size of the figure does not depend on the number of samples.
+        Use for large samples. Default = False
+    :param (int) max_rug_points: Maximum number of samples, chosen at random,
+        in the rug plot of each data set when `binned` is True. Default = 1000
     :return (dict): Representation of a distplot figure.
 
     Example 1: Simple distplot of 1 data set
@@ -169,6 +179,17 @@ def create_distplot(
     ...                    '2013': np.random.randn(200)+1})
     >>> fig = create_distplot([df[c] for c in df.columns], df.columns)
     >>> fig.show()
+
+
+    Example 5: Distplot of large samples
+
+    >>> from plotly.figure_factory import create_distplot
+    >>> import numpy as np
+
+    >>> hist_data = [np.random.randn(1000000), np.random.randn(1000000) + 1]
+    >>> group_labels = ['a', 'b']
+    >>> fig = create_distplot(hist_data, group_labels, bin_size=.1, binned=True)
+    >>> fig.show()
     """
     if colors is None:
         colors = []
@@ -181,67 +202,32 @@ def create_distplot(
     if isinstance(bin_size, (float, int)):
         bin_size = [bin_size] * len(hist_data)
 
+    distplot = _Distplot(
+        hist_data,
+        histnorm,
+        group_labels,
+        bin_size,
+        curve_type,
+        colors,
+        rug_text,
+        show_hist,
+        show_curve,
+        binned=binned,
+        max_rug_points=max_rug_points,
+    )
+
     data = []
     if show_hist:
-
-        hist = _Distplot(
-            hist_data,
-            histnorm,
-            group_labels,
-            bin_size,
-            curve_type,
-            colors,
-            rug_text,
-            show_hist,
-            show_curve,
-        ).make_hist()
-
-        data.append(hist)
+        data.append(distplot.make_hist())
 
     if show_curve:
-
         if curve_type == "normal":
-            curve = _Distplot(
-                hist_data,
-                histnorm,
-                group_labels,
-                bin_size,
-                curve_type,
-                colors,
-                rug_text,
-                show_hist,
-                show_curve,
-            ).make_normal()
+            data.append(distplot.make_normal())
         else:
-            curve = _Distplot(
-                hist_data,
-                histnorm,
-                group_labels,
-                bin_size,
-                curve_type,
-                colors,
-                rug_text,
-                show_hist,
-                show_curve,
-            ).make_kde()
-
-        data.append(curve)
+            data.append(distplot.make_kde())
 
     if show_rug:
-
-        rug = _Distplot(
-            hist_data,
-            histnorm,
-            group_labels,
-            bin_size,
-            curve_type,
-            colors,
-            rug_text,
-            show_hist,
-            show_curve,
-        ).make_rug()
-
-        data.append(rug)
+        data.append(distplot.make_rug())
         layout = graph_objs.Layout(
             barmode="overlay",
             hovermode="closest",
@@ -279,13 +265,19 @@ class _Distplot(object):
         rug_text,
         show_hist,
         show_curve,
+        binned=False,
+        max_rug_points=1000,
     ):
+        if binned:
+            hist_data = [np.asarray(trace, dtype=float) for trace in hist_data]
         self.hist_data = hist_data
         self.histnorm = histnorm
         self.group_labels = group_labels
         self.bin_size = bin_size
         self.show_hist = show_hist
         self.show_curve = show_curve
+        self.binned = binned
+        self.max_rug_points = max_rug_points
         self.trace_number = len(hist_data)
         if rug_text:
             self.rug_text = rug_text
@@ -313,8 +305,12 @@ class _Distplot(object):
         self.curve_y = [None] * self.trace_number
 
         for trace in self.hist_data:
-            self.start.append(min(trace) * 1.0)
-            self.end.append(max(trace) * 1.0)
+            if binned:
+                self.start.append(trace.min())
+                self.end.append(trace.max())
+            else:
+                self.start.append(min(trace) * 1.0)
+                self.end.append(max(trace) * 1.0)
 
     def make_hist(self):
         """
@@ -322,6 +318,9 @@ class _Distplot(object):
 
         :rtype (list) hist: list of histogram representations
         """
+        if self.binned:
+            return self.make_binned_hist()
+
         hist = [None] * self.trace_number
 
         for index in range(self.trace_number):
@@ -344,6 +343,85 @@ class _Distplot(object):
             )
         return hist
 
+    def make_binned_hist(self):
+        """
+        Makes the histogram(s) for create_distplot() as bar traces of the
+        bin heights computed with numpy.
+
+        This is called when binned = True in create_distplot().
+
+        :rtype (list) hist: list of bar representations
+        """
+        hist = [None] * self.trace_number
+
+        for index in range(self.trace_number):
+            start = self.start[index]
+            size = self.bin_size[index]
+            # Same bins as the xbins of the histogram trace: the last bin
+            # contains the maximum
+            nbins = int((self.end[index] - start) // size) + 1
+            edges = start + size * np.arange(nbins + 1)
+            counts, _ = np.histogram(self.hist_data[index], bins=edges)
+
+            n = len(self.hist_data[index])
+            if self.histnorm == "percent":
+                heights = counts * 100.0 / n
+            elif self.histnorm == "probability":
+                heights = counts / n
+            elif self.histnorm == "density":
+                heights = counts / size
+            elif self.histnorm == "probability density":
+                heights = counts / (n * size)
+            else:
+                heights = counts
+
+            hist[index] = dict(
+                type="bar",
+                x=edges[:-1] + size / 2,
+                y=heights,
+                width=size,
+                xaxis="x1",
+                yaxis="y1",
+                name=self.group_labels[index],
+                legendgroup=self.group_labels[index],
+                marker=dict(color=self.colors[index % len(self.colors)]),
+                opacity=0.7,
+            )
+        return hist
+
+    def binned_kde(self, index):
+        """
+        Computes the gaussian kernel density estimation of a data set by
+        binning the samples on a regular grid and convolving the bin counts
+        with the kernel using the FFT. The bandwidth follows Scott's rule,
+        as in scipy.stats.gaussian_kde.
+
+        :param (int) index: Index of the data set
+        :rtype (tuple): x and y values of the kde, evaluated at the centers
+            of KDE_GRID_SIZE bins
+        """
+        data = self.hist_data[index]
+        n = len(data)
+        start = self.start[index]
+        end = self.end[index]
+
+        counts, edges = np.histogram(data, bins=KDE_GRID_SIZE, range=(start, end))
+        delta = edges[1] - edges[0]
+        bandwidth = data.std(ddof=1) * n ** (-1.0 / 5)
+
+        offsets = np.arange(-KDE_GRID_SIZE + 1, KDE_GRID_SIZE) * delta
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (
+            bandwidth * np.sqrt(2 * np.pi)
+        )
+
+        # Zero padded FFT convolution, so that the convolution is not circular
+        size = 1 << int(np.ceil(np.log2(len(counts) + len(kernel) - 1)))
+        density = np.fft.irfft(
+            np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size
+        )[KDE_GRID_SIZE - 1 : 2 * KDE_GRID_SIZE - 1]
+
+        return edges[:-1] + delta / 2, np.clip(density, 0, None) / n
+
     def make_kde(self):
         """
         Makes the kernel density estimation(s) for create_distplot().
@@ -354,13 +432,16 @@ class _Distplot(object):
         """
         curve = [None] * self.trace_number
         for index in range(self.trace_number):
-            self.curve_x[index] = [
-                self.start[index] + x * (self.end[index] - self.start[index]) / 500
-                for x in range(500)
-            ]
-            self.curve_y[index] = scipy_stats.gaussian_kde(self.hist_data[index])(
-                self.curve_x[index]
-            )
+            if self.binned:
+                self.curve_x[index], self.curve_y[index] = self.binned_kde(index)
+            else:
+                self.curve_x[index] = [
+                    self.start[index] + x * (self.end[index] - self.start[index]) / 500
+                    for x in range(500)
+                ]
+                self.curve_y[index] = scipy_stats.gaussian_kde(self.hist_data[index])(
+                    self.curve_x[index]
+                )
 
             if self.histnorm == ALTERNATIVE_HISTNORM:
                 self.curve_y[index] *= self.bin_size[index]
@@ -428,18 +509,30 @@ class _Distplot(object):
         """
         rug = [None] * self.trace_number
         for index in range(self.trace_number):
+            x = self.hist_data[index]
+            text = self.rug_text[index]
+            if self.binned and len(x) > self.max_rug_points:
+                # Uniform random sample of the data, in their original order.
+                # The generator is seeded so that the figure is reproducible.
+                rng = np.random.default_rng(0)
+                sample = np.sort(
+                    rng.choice(len(x), size=self.max_rug_points, replace=False)
+                )
+                x = x[sample]
+                if text is not None and not isinstance(text, str):
+                    text = [text[i] for i in sample]
 
             rug[index] = dict(
                 type="scatter",
-                x=self.hist_data[index],
-                y=([self.group_labels[index]] * len(self.hist_data[index])),
+                x=x,
+                y=([self.group_labels[index]] * len(x)),
                 xaxis="x1",
                 yaxis="y2",
                 mode="markers",
                 name=self.group_labels[index],
                 legendgroup=self.group_labels[index],
                 showlegend=(False if self.show_hist or self.show_curve else True),
-                text=self.rug_text[index],
+                text=text,
                 marker=dict(
                     color=self.colors[index % len(self.colors)], symbol="line-ns-open"
                 ),
@@ -1,4 +1,4 @@
-from plotly.express._core import build_dataframe
+from plotly.express._core import build_dataframe, _generate_temporary_column_name
 from plotly.express._doc import make_docstring
 from plotly.express._chart_types import choropleth_mapbox, scatter_mapbox
 import narwhals.stable.v1 as nw
@@ -54,42 +54,24 @@ def _getBoundsZoomLevel(lon_min, lon_max, lat_min, lat_max, mapDim):
     return min(latZoom, lngZoom, ZOOM_MAX)
 
 
-def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
+def _hexbin_grid(x_range, y_range, nx):
     """
-    Computes the aggregation at hexagonal bin level.
-    Also defines the coordinates of the hexagons for plotting.
+    Defines the hexagonal grid covering x_range and y_range.
     The binning is inspired by matplotlib's implementation.
 
     Parameters
     ----------
-    x : np.ndarray
-        Array of x values (shape N)
-    y : np.ndarray
-        Array of y values (shape N)
     x_range : np.ndarray
         Min and max x (shape 2)
     y_range : np.ndarray
         Min and max y (shape 2)
-    color : np.ndarray
-        Metric to aggregate at hexagon level (shape N)
     nx : int
         Number of hexagons horizontally
-    agg_func : function
-        Numpy compatible aggregator, this function must take a one-dimensional
-        np.ndarray as input and output a scalar
-    min_count : int
-        Minimum number of points in the hexagon for the hexagon to be displayed
 
     Returns
     -------
-    np.ndarray
-        X coordinates of each hexagon (shape M x 6)
-    np.ndarray
-        Y coordinates of each hexagon (shape M x 6)
-    np.ndarray
-        Centers of the hexagons (shape M x 2)
-    np.ndarray
-        Aggregated value in each hexagon (shape M)
+    tuple
+        (xmin, ymin, dx, dy, nx, ny) describing the grid
 
     """
     xmin = x_range.min()
@@ -117,6 +99,22 @@ def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
     # Center the hexagons vertically since we only want regular hexagons
     ymin -= (ymin + dy * ny - ymax) / 2
 
+    return xmin, ymin, dx, dy, nx, ny
+
+
+def _hexbin_ids(x, y, grid):
+    """
+    Assigns each point to a hexagon of the grid returned by _hexbin_grid.
+    The hexagons of the first lattice are numbered before the hexagons of
+    the second (offset) lattice, in the order of _hexbin_geometry.
+
+    Returns
+    -------
+    np.ndarray
+        Hexagon id of each point, -1 for points outside of the grid (shape N)
+
+    """
+    xmin, ymin, dx, dy, nx, ny = grid
     x = (x - xmin) / dx
     y = (y - ymin) / dy
     ix1 = np.round(x).astype(int)
@@ -128,67 +126,41 @@ def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
     ny1 = ny + 1
     nx2 = nx
     ny2 = ny
-    n = nx1 * ny1 + nx2 * ny2
 
     d1 = (x - ix1) ** 2 + 3.0 * (y - iy1) ** 2
     d2 = (x - ix2 - 0.5) ** 2 + 3.0 * (y - iy2 - 0.5) ** 2
     bdist = d1 < d2
 
-    if color is None:
-        lattice1 = np.zeros((nx1, ny1))
-        lattice2 = np.zeros((nx2, ny2))
-        c1 = (0 <= ix1) & (ix1 < nx1) & (0 <= iy1) & (iy1 < ny1) & bdist
-        c2 = (0 <= ix2) & (ix2 < nx2) & (0 <= iy2) & (iy2 < ny2) & ~bdist
-        np.add.at(lattice1, (ix1[c1], iy1[c1]), 1)
-        np.add.at(lattice2, (ix2[c2], iy2[c2]), 1)
-        if min_count is not None:
-            lattice1[lattice1 < min_count] = np.nan
-            lattice2[lattice2 < min_count] = np.nan
-        accum = np.concatenate([lattice1.ravel(), lattice2.ravel()])
-        good_idxs = ~np.isnan(accum)
-    else:
-        if min_count is None:
-            min_count = 1
-
-        # create accumulation arrays
-        lattice1 = np.empty((nx1, ny1), dtype=object)
-        for i in range(nx1):
-            for j in range(ny1):
-                lattice1[i, j] = []
-        lattice2 = np.empty((nx2, ny2), dtype=object)
-        for i in range(nx2):
-            for j in range(ny2):
-                lattice2[i, j] = []
-
-        for i in range(len(x)):
-            if bdist[i]:
-                if 0 <= ix1[i] < nx1 and 0 <= iy1[i] < ny1:
-                    lattice1[ix1[i], iy1[i]].append(color[i])
-            else:
-                if 0 <= ix2[i] < nx2 and 0 <= iy2[i] < ny2:
-                    lattice2[ix2[i], iy2[i]].append(color[i])
-
-        for i in range(nx1):
-            for j in range(ny1):
-                vals = lattice1[i, j]
-                if len(vals) >= min_count:
-                    lattice1[i, j] = agg_func(vals)
-                else:
-                    lattice1[i, j] = np.nan
-        for i in range(nx2):
-            for j in range(ny2):
-                vals = lattice2[i, j]
-                if len(vals) >= min_count:
-                    lattice2[i, j] = agg_func(vals)
-                else:
-                    lattice2[i, j] = np.nan
-
-        accum = np.hstack(
-            (lattice1.astype(float).ravel(), lattice2.astype(float).ravel())
-        )
-        good_idxs = ~np.isnan(accum)
+    c1 = (0 <= ix1) & (ix1 < nx1) & (0 <= iy1) & (iy1 < ny1) & bdist
+    c2 = (0 <= ix2) & (ix2 < nx2) & (0 <= iy2) & (iy2 < ny2) & ~bdist
 
-    agreggated_value = accum[good_idxs]
+    ids = np.full(len(x), -1, dtype=np.intp)
+    ids[c1] = ix1[c1] * ny1 + iy1[c1]
+    ids[c2] = nx1 * ny1 + ix2[c2] * ny2 + iy2[c2]
+    return ids
+
+
+def _hexbin_geometry(grid):
+    """
+    Defines the coordinates of every hexagon of the grid returned by
+    _hexbin_grid, in hexagon id order.
+
+    Returns
+    -------
+    np.ndarray
+        X coordinates of each hexagon (shape n x 6)
+    np.ndarray
+        Y coordinates of each hexagon (shape n x 6)
+    np.ndarray
+        Centers of the hexagons (shape n x 2)
+
+    """
+    xmin, ymin, dx, dy, nx, ny = grid
+    nx1 = nx + 1
+    ny1 = ny + 1
+    nx2 = nx
+    ny2 = ny
+    n = nx1 * ny1 + nx2 * ny2
 
     centers = np.zeros((n, 2), float)
     centers[: nx1 * ny1, 0] = np.repeat(np.arange(nx1), ny1)
@@ -199,7 +171,6 @@ def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
     centers[:, 1] *= dy
     centers[:, 0] += xmin
     centers[:, 1] += ymin
-    centers = centers[good_idxs]
 
     # Define normalised regular hexagon coordinates
     hx = [0, 0.5, 0.5, 0, -0.5, -0.5]
@@ -212,14 +183,163 @@ def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
         -0.5 * np.tan(np.pi / 6),
     ]
 
-    # Number of hexagons needed
-    m = len(centers)
-
     # Coordinates for all hexagonal patches
-    hxs = np.array([hx] * m) * dx + np.vstack(centers[:, 0])
-    hys = np.array([hy] * m) * dy / np.sqrt(3) + np.vstack(centers[:, 1])
+    hxs = np.array([hx] * n) * dx + np.vstack(centers[:, 0])
+    hys = np.array([hy] * n) * dy / np.sqrt(3) + np.vstack(centers[:, 1])
+
+    return hxs, hys, centers
+
+
+# Aggregators that are computed for all the hexagons at once rather than
+# by calling agg_func on the values of each hexagon
+_vectorized_agg_funcs = {
+    np.mean: "mean",
+    np.sum: "sum",
+    sum: "sum",
+    np.min: "min",
+    np.amin: "min",
+    min: "min",
+    np.max: "max",
+    np.amax: "max",
+    max: "max",
+    len: "count",
+    np.size: "count",
+}
+
+
+def _aggregate_hexbin(ids, n, color, agg_func, min_count):
+    """
+    Aggregates color at hexagonal bin level.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        Hexagon id of each point, as returned by _hexbin_ids (shape N)
+    n : int
+        Number of hexagons in the grid
+    color : np.ndarray
+        Metric to aggregate at hexagon level (shape N), if None the points
+        in each hexagon are counted
+    agg_func : function
+        Numpy compatible aggregator, this function must take a one-dimensional
+        np.ndarray as input and output a scalar
+    min_count : int
+        Minimum number of points in the hexagon for the hexagon to be displayed
+
+    Returns
+    -------
+    np.ndarray
+        Aggregated value in each hexagon, NaN if the hexagon is not
+        displayed (shape n)
+
+    """
+    inside = ids >= 0
+    ids = ids[inside]
+    counts = np.bincount(ids, minlength=n)
+
+    if color is None:
+        accum = counts.astype(float)
+        if min_count is not None:
+            accum[counts < min_count] = np.nan
+        return accum
+
+    if min_count is None:
+        min_count = 1
+    color = np.asarray(color)[inside]
+    displayed = counts >= min_count
+    accum = np.full(n, np.nan)
+
+    how = _vectorized_agg_funcs.get(agg_func)
+    if how == "count":
+        accum[displayed] = counts[displayed]
+    elif how in ("sum", "mean"):
+        sums = np.bincount(ids, weights=color.astype(float), minlength=n)
+        if how == "mean":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sums /= counts
+        accum[displayed] = sums[displayed]
+    else:
+        # Sort the values by hexagon so that each hexagon is a contiguous
+        # segment of the sorted values
+        color = color[np.argsort(ids, kind="stable")]
+        starts = np.cumsum(counts) - counts
+        if how is not None:
+            # Each reduced segment runs up to the start of the next one, so
+            # every non empty hexagon is reduced before hiding the ones with
+            # less than min_count points
+            nonempty = counts > 0
+            reduce = np.minimum if how == "min" else np.maximum
+            reduced = np.full(n, np.nan)
+            reduced[nonempty] = reduce.reduceat(color.astype(float), starts[nonempty])
+            accum[displayed] = reduced[displayed]
+        else:
+            for i in np.flatnonzero(displayed):
+                accum[i] = agg_func(color[starts[i] : starts[i] + counts[i]])
+
+    return accum
+
+
+def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
+    """
+    Computes the aggregation at hexagonal bin level.
+    Also defines the coordinates of the hexagons for plotting.
+    The binning is inspired by matplotlib's implementation.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Array of x values (shape N)
+    y : np.ndarray
+        Array of y values (shape N)
+    x_range : np.ndarray
+        Min and max x (shape 2)
+    y_range : np.ndarray
+        Min and max y (shape 2)
+    color : np.ndarray
+        Metric to aggregate at hexagon level (shape N)
+    nx : int
+        Number of hexagons horizontally
+    agg_func : function
+        Numpy compatible aggregator, this function must take a one-dimensional
+        np.ndarray as input and output a scalar
+    min_count : int
+        Minimum number of points in the hexagon for the hexagon to be displayed
+
+    Returns
+    -------
+    np.ndarray
+        X coordinates of each hexagon (shape M x 6)
+    np.ndarray
+        Y coordinates of each hexagon (shape M x 6)
+    np.ndarray
+        Centers of the hexagons (shape M x 2)
+    np.ndarray
+        Aggregated value in each hexagon (shape M)
+
+    """
+    grid = _hexbin_grid(x_range, y_range, nx)
+    hxs, hys, centers = _hexbin_geometry(grid)
+    accum = _aggregate_hexbin(
+        _hexbin_ids(x, y, grid), len(centers), color, agg_func, min_count
+    )
+    good_idxs = ~np.isnan(accum)
+
+    return hxs[good_idxs], hys[good_idxs], centers[good_idxs], accum[good_idxs]
 
-    return hxs, hys, centers, agreggated_value
+
+def _hexagons_ids(centers, native_namespace):
+    """
+    Creates a unique feature id for each hexagon based on its center
+    """
+    centers = centers.astype(str)
+    return (
+        nw.from_dict(
+            {"x1": centers[:, 0], "x2": centers[:, 1]},
+            native_namespace=native_namespace,
+        )
+        .select(hexagons_ids=nw.concat_str([nw.col("x1"), nw.col("x2")], separator=","))
+        .get_column("hexagons_ids")
+    )
 
 
 def _compute_wgs84_hexbin(
@@ -288,15 +408,7 @@ def _compute_wgs84_hexbin(
     hexagons_lats, hexagons_lons = _project_wgs84_to_latlon(hxs, hys)
 
     # Create unique feature id based on hexagon center
-    centers = centers.astype(str)
-    hexagons_ids = (
-        nw.from_dict(
-            {"x1": centers[:, 0], "x2": centers[:, 1]},
-            native_namespace=native_namespace,
-        )
-        .select(hexagons_ids=nw.concat_str([nw.col("x1"), nw.col("x2")], separator=","))
-        .get_column("hexagons_ids")
-    )
+    hexagons_ids = _hexagons_ids(centers, native_namespace)
 
     return hexagons_lats, hexagons_lons, hexagons_ids, agreggated_value
 
@@ -376,19 +488,26 @@ def create_hexbin_mapbox(
         .squeeze()
     )
 
-    hexagons_lats, hexagons_lons, hexagons_ids, count = _compute_wgs84_hexbin(
-        lat=args["data_frame"].get_column(args["lat"]).to_numpy(),
-        lon=args["data_frame"].get_column(args["lon"]).to_numpy(),
-        lat_range=lat_range,
-        lon_range=lon_range,
-        color=None,
-        nx=nx_hexagon,
-        agg_func=agg_func,
-        min_count=min_count,
-        native_namespace=native_namespace,
+    # Project the points and assign them to their hexagon once, the frames
+    # below only aggregate the hexagon ids of their own rows
+    x, y = _project_latlon_to_wgs84(
+        args["data_frame"].get_column(args["lat"]).to_numpy(),
+        args["data_frame"].get_column(args["lon"]).to_numpy(),
+    )
+    x_range, y_range = _project_latlon_to_wgs84(lat_range, lon_range)
+    grid = _hexbin_grid(x_range, y_range, nx_hexagon)
+    hxs, hys, centers = _hexbin_geometry(grid)
+    ids = _hexbin_ids(x, y, grid)
+    hexagons_ids = _hexagons_ids(centers, native_namespace)
+
+    count = _aggregate_hexbin(ids, len(centers), None, agg_func, min_count)
+    good_idxs = np.flatnonzero(~np.isnan(count))
+    hexagons_lats, hexagons_lons = _project_wgs84_to_latlon(
+        hxs[good_idxs], hys[good_idxs]
+    )
+    geojson = _hexagons_to_geojson(
+        hexagons_lats, hexagons_lons, hexagons_ids[good_idxs]
     )
-
-    geojson = _hexagons_to_geojson(hexagons_lats, hexagons_lons, hexagons_ids)
 
     if zoom is None:
         if height is None and width is None:
@@ -406,34 +525,41 @@ def create_hexbin_mapbox(
     if center is None:
         center = dict(lat=lat_range.mean(), lon=lon_range.mean())
 
+    color_values = (
+        args["data_frame"].get_column(args["color"]).to_numpy()
+        if args["color"]
+        else None
+    )
     if args["animation_frame"] is not None:
-        groups = dict(
-            args["data_frame"]
-            .group_by(args["animation_frame"], drop_null_keys=True)
-            .__iter__()
+        row_index = _generate_temporary_column_name(
+            n_bytes=8, columns=[args["animation_frame"]]
         )
+        groups = {
+            key: df.get_column(row_index).to_numpy()
+            for key, df in args["data_frame"]
+            .select(args["animation_frame"])
+            .with_row_index(row_index)
+            .group_by(args["animation_frame"], drop_null_keys=True)
+        }
     else:
-        groups = {(0,): args["data_frame"]}
+        groups = {(0,): slice(None)}
 
     agg_data_frame_list = []
-    for key, df in groups.items():
-        _, _, hexagons_ids, aggregated_value = _compute_wgs84_hexbin(
-            lat=df.get_column(args["lat"]).to_numpy(),
-            lon=df.get_column(args["lon"]).to_numpy(),
-            lat_range=lat_range,
-            lon_range=lon_range,
-            color=df.get_column(args["color"]).to_numpy() if args["color"] else None,
-            nx=nx_hexagon,
-            agg_func=agg_func,
-            min_count=min_count,
-            native_namespace=native_namespace,
+    for key, rows in groups.items():
+        aggregated_value = _aggregate_hexbin(
+            ids[rows],
+            len(centers),
+            color_values[rows] if color_values is not None else None,
+            agg_func,
+            min_count,
         )
+        good_idxs = np.flatnonzero(~np.isnan(aggregated_value))
         agg_data_frame_list.append(
             nw.from_dict(
                 {
-                    "frame": [key[0]] * len(hexagons_ids),
-                    "locations": hexagons_ids,
-                    "color": aggregated_value,
+                    "frame": [key[0]] * len(good_idxs),
+                    "locations": hexagons_ids[good_idxs],
+                    "color": aggregated_value[good_idxs],
                 },
                 native_namespace=native_namespace,
             )
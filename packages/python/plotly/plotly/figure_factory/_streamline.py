@@ -1,3 +1,4 @@
+import itertools
 import math
 
 from plotly import exceptions, optional_imports
@@ -112,12 +113,9 @@ def create_streamline(
     validate_streamline(x, y)
     utils.validate_positive_scalars(density=density, arrow_scale=arrow_scale)
 
-    streamline_x, streamline_y = _Streamline(
-        x, y, u, v, density, angle, arrow_scale
-    ).sum_streamlines()
-    arrow_x, arrow_y = _Streamline(
-        x, y, u, v, density, angle, arrow_scale
-    ).get_streamline_arrows()
+    streamlines = _Streamline(x, y, u, v, density, angle, arrow_scale)
+    streamline_x, streamline_y = streamlines.sum_streamlines()
+    arrow_x, arrow_y = streamlines.get_streamline_arrows()
 
     streamline = graph_objs.Scatter(
         x=streamline_x + arrow_x, y=streamline_y + arrow_y, mode="lines", **kwargs
@@ -144,8 +142,6 @@ class _Streamline(object):
         self.density = int(30 * density)  # Scale similarly to other functions
         self.delta_x = self.x[1] - self.x[0]
         self.delta_y = self.y[1] - self.y[0]
-        self.val_x = self.x
-        self.val_y = self.y
 
         # Set up spacing
         self.blank = np.zeros((self.density, self.density))
@@ -161,11 +157,32 @@ class _Streamline(object):
         # Rescale u and v for integrations.
         self.u *= len(self.x)
         self.v *= len(self.y)
+
+        # Values of speed, u and v at the four corners of each grid cell, so
+        # that they are interpolated together with a single lookup
+        field = np.stack([self.speed, self.u, self.v], axis=-1)
+        self.field_shape = field.shape[:2]
+        field_right = np.roll(field, -1, axis=1)
+        self.corners = np.stack(
+            [
+                field,
+                field_right,
+                np.roll(field, -1, axis=0),
+                np.roll(field_right, -1, axis=0),
+            ],
+            axis=2,
+        ).reshape(-1, 4, 3)
+
+        # Trajectory length (in units of axes) after each integration step
+        self.ds = 0.01
+        self.lengths = [0]
+        while self.lengths[-1] <= 2:
+            self.lengths.append(self.lengths[-1] + self.ds)
+        self.max_steps = len(self.lengths) - 1
+
         self.st_x = []
         self.st_y = []
         self.get_streamlines()
-        streamline_x, streamline_y = self.sum_streamlines()
-        arrows_x, arrows_y = self.get_streamline_arrows()
 
     def blank_pos(self, xi, yi):
         """
@@ -173,147 +190,225 @@ class _Streamline(object):
         """
         return (int((xi / self.spacing_x) + 0.5), int((yi / self.spacing_y) + 0.5))
 
-    def value_at(self, a, xi, yi):
+    def check(self, xi, yi):
         """
-        Set up for RK4 function, based on Bokeh's streamline code
+        Whether the (arrays of) points lie inside the grid
         """
-        if isinstance(xi, np.ndarray):
-            self.x = xi.astype(int)
-            self.y = yi.astype(int)
-        else:
-            self.val_x = int(xi)
-            self.val_y = int(yi)
-        a00 = a[self.val_y, self.val_x]
-        a01 = a[self.val_y, self.val_x + 1]
-        a10 = a[self.val_y + 1, self.val_x]
-        a11 = a[self.val_y + 1, self.val_x + 1]
-        xt = xi - self.val_x
-        yt = yi - self.val_y
-        a0 = a00 * (1 - xt) + a01 * xt
-        a1 = a10 * (1 - xt) + a11 * xt
-        return a0 * (1 - yt) + a1 * yt
-
-    def rk4_integrate(self, x0, y0):
+        return (0 <= xi) & (xi < len(self.x) - 1) & (0 <= yi) & (yi < len(self.y) - 1)
+
+    def value_at(self, xi, yi):
         """
-        RK4 forward and back trajectories from the initial conditions.
+        Bilinear interpolation of speed, u and v at arrays of points, based
+        on Bokeh's streamline code
 
-        Adapted from Bokeh's streamline -uses Runge-Kutta method to fill
-        x and y trajectories then checks length of traj (s in units of axes)
+        Returns the interpolated values as an (n, 3) array, and a boolean
+        array that is False for the points that fall outside the field.
         """
+        ny, nx = self.field_shape
+        ix = np.trunc(xi)
+        iy = np.trunc(yi)
+        # Negative indices wrap around, as when indexing the field directly
+        ok = (ix >= -nx) & (ix + 1 < nx) & (iy >= -ny) & (iy + 1 < ny)
+        ix = np.where(ok, ix, 0).astype(int)
+        iy = np.where(ok, iy, 0).astype(int)
+        a = self.corners[(iy % ny) * nx + ix % nx]
+        xt = (xi - ix)[:, None]
+        yt = (yi - iy)[:, None]
+        a0 = a[:, 0] * (1 - xt) + a[:, 1] * xt
+        a1 = a[:, 2] * (1 - xt) + a[:, 3] * xt
+        return a0 * (1 - yt) + a1 * yt, ok
+
+    def rk4_integrate(self, x0, y0, direction):
+        """
+        RK4 trajectories from arrays of initial conditions.
 
-        def f(xi, yi):
-            dt_ds = 1.0 / self.value_at(self.speed, xi, yi)
-            ui = self.value_at(self.u, xi, yi)
-            vi = self.value_at(self.v, xi, yi)
-            return ui * dt_ds, vi * dt_ds
-
-        def g(xi, yi):
-            dt_ds = 1.0 / self.value_at(self.speed, xi, yi)
-            ui = self.value_at(self.u, xi, yi)
-            vi = self.value_at(self.v, xi, yi)
-            return -ui * dt_ds, -vi * dt_ds
-
-        check = lambda xi, yi: (0 <= xi < len(self.x) - 1 and 0 <= yi < len(self.y) - 1)
-        xb_changes = []
-        yb_changes = []
-
-        def rk4(x0, y0, f):
-            ds = 0.01
-            stotal = 0
-            xi = x0
-            yi = y0
-            xb, yb = self.blank_pos(xi, yi)
-            xf_traj = []
-            yf_traj = []
-            while check(xi, yi):
-                xf_traj.append(xi)
-                yf_traj.append(yi)
-                try:
-                    k1x, k1y = f(xi, yi)
-                    k2x, k2y = f(xi + 0.5 * ds * k1x, yi + 0.5 * ds * k1y)
-                    k3x, k3y = f(xi + 0.5 * ds * k2x, yi + 0.5 * ds * k2y)
-                    k4x, k4y = f(xi + ds * k3x, yi + ds * k3y)
-                except IndexError:
-                    break
-                xi += ds * (k1x + 2 * k2x + 2 * k3x + k4x) / 6.0
-                yi += ds * (k1y + 2 * k2y + 2 * k3y + k4y) / 6.0
-                if not check(xi, yi):
-                    break
-                stotal += ds
-                new_xb, new_yb = self.blank_pos(xi, yi)
-                if new_xb != xb or new_yb != yb:
-                    if self.blank[new_yb, new_xb] == 0:
-                        self.blank[new_yb, new_xb] = 1
-                        xb_changes.append(new_xb)
-                        yb_changes.append(new_yb)
-                        xb = new_xb
-                        yb = new_yb
-                    else:
-                        break
-                if stotal > 2:
+        Adapted from Bokeh's streamline -uses Runge-Kutta method to fill
+        x and y trajectories, advancing all trajectories together. Each
+        trajectory runs until it leaves the grid, reaches a length of 2
+        (in units of axes) or enters a cell of the blank grid covered by an
+        earlier streamline. Collisions between the new trajectories are
+        checked afterwards, by traj().
+
+        :param (ndarray) x0: x-values of the initial conditions
+        :param (ndarray) y0: y-values of the initial conditions
+        :param (ndarray) direction: 1 to integrate forward and -1 to
+            integrate backward, for each initial condition
+        :rtype (ndarray, ndarray, ndarray): x and y values of the
+            trajectories, one row per initial condition, and the number of
+            integration steps of each trajectory that stayed on the grid
+        """
+        ds = self.ds
+        n = len(x0)
+        x_traj = np.empty((n, self.max_steps + 1))
+        y_traj = np.empty((n, self.max_steps + 1))
+        x_traj[:, 0] = x0
+        y_traj[:, 0] = y0
+        n_steps = np.zeros(n, dtype=int)
+
+        def f(xi, yi, sign):
+            values, ok = self.value_at(xi, yi)
+            dt_ds = 1.0 / values[:, 0]
+            ui = values[:, 1] * dt_ds
+            vi = values[:, 2] * dt_ds
+            return sign * ui, sign * vi, ok
+
+        index = np.flatnonzero(self.check(x0, y0))
+        xi = x0[index]
+        yi = y0[index]
+        sign = direction[index]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for step in range(self.max_steps):
+                k1x, k1y, ok1 = f(xi, yi, sign)
+                k2x, k2y, ok2 = f(xi + 0.5 * ds * k1x, yi + 0.5 * ds * k1y, sign)
+                k3x, k3y, ok3 = f(xi + 0.5 * ds * k2x, yi + 0.5 * ds * k2y, sign)
+                k4x, k4y, ok4 = f(xi + ds * k3x, yi + ds * k3y, sign)
+                xi = xi + ds * (k1x + 2 * k2x + 2 * k3x + k4x) / 6.0
+                yi = yi + ds * (k1y + 2 * k2y + 2 * k3y + k4y) / 6.0
+
+                keep = ok1 & ok2 & ok3 & ok4 & self.check(xi, yi)
+                index = index[keep]
+                if not len(index):
                     break
-            return stotal, xf_traj, yf_traj
-
-        sf, xf_traj, yf_traj = rk4(x0, y0, f)
-        sb, xb_traj, yb_traj = rk4(x0, y0, g)
-        stotal = sf + sb
-        x_traj = xb_traj[::-1] + xf_traj[1:]
-        y_traj = yb_traj[::-1] + yf_traj[1:]
-
-        if len(x_traj) < 1:
-            return None
-        if stotal > 0.2:
-            initxb, inityb = self.blank_pos(x0, y0)
-            self.blank[inityb, initxb] = 1
-            return x_traj, y_traj
-        else:
-            for xb, yb in zip(xb_changes, yb_changes):
-                self.blank[yb, xb] = 0
-            return None
-
-    def traj(self, xb, yb):
+                xi = xi[keep]
+                yi = yi[keep]
+                sign = sign[keep]
+                x_traj[index, step + 1] = xi
+                y_traj[index, step + 1] = yi
+                n_steps[index] = step + 1
+
+                # Covered cells stay covered, the trajectory stops there
+                xb = (xi / self.spacing_x + 0.5).astype(int)
+                yb = (yi / self.spacing_y + 0.5).astype(int)
+                keep = self.blank[yb, xb] == 0
+                if not keep.all():
+                    index = index[keep]
+                    xi = xi[keep]
+                    yi = yi[keep]
+                    sign = sign[keep]
+
+        return x_traj, y_traj, n_steps
+
+    def traj(self, x_traj, y_traj, n_steps, started, changes):
         """
-        Integrate trajectories
-
-        :param (int) xb: results of passing xi through self.blank_pos
-        :param (int) xy: results of passing yi through self.blank_pos
-
-        Calculate each trajectory based on rk4 integrate method.
+        Cut an integrated trajectory where it runs into another trajectory
+
+        :param (ndarray) x_traj: x-values of the integrated trajectory
+        :param (ndarray) y_traj: y-values of the integrated trajectory
+        :param (int) n_steps: number of integration steps that stayed on
+            the grid
+        :param (bool) started: whether the initial condition is on the grid
+        :param (list) changes: list to which the flat indices of the cells
+            of the blank grid newly covered by the trajectory are appended
+
+        Walks the cells of the blank grid crossed by the trajectory, marking
+        them as covered until reaching a cell covered by an earlier
+        trajectory (or earlier by this trajectory).
+        :rtype (ndarray, ndarray, float): x and y values of the trajectory
+            and its length (in units of axes)
         """
+        if not started:
+            return x_traj[:0], y_traj[:0], 0
+
+        xb = (x_traj[: n_steps + 1] / self.spacing_x + 0.5).astype(int)
+        yb = (y_traj[: n_steps + 1] / self.spacing_y + 0.5).astype(int)
+        cells = yb * self.density + xb
+        steps = np.flatnonzero(cells[1:] != cells[:-1]) + 1
+        new_cells = cells[steps]
+
+        _, first, inverse = np.unique(new_cells, return_index=True, return_inverse=True)
+        blocked = (self.blank.flat[new_cells] != 0) | (
+            first[inverse] < np.arange(len(new_cells))
+        )
+        if blocked.any():
+            stop = np.argmax(blocked)
+            new_cells = new_cells[:stop]
+            n_points = steps[stop]
+            length = self.lengths[n_points]
+        elif n_steps == self.max_steps:
+            n_points = n_steps
+            length = self.lengths[n_steps]
+        else:
+            n_points = n_steps + 1
+            length = self.lengths[n_steps]
 
-        if xb < 0 or xb >= self.density or yb < 0 or yb >= self.density:
-            return
-        if self.blank[yb, xb] == 0:
-            t = self.rk4_integrate(xb * self.spacing_x, yb * self.spacing_y)
-            if t is not None:
-                self.trajectories.append(t)
+        self.blank.flat[new_cells] = 1
+        changes.extend(new_cells)
+        return x_traj[:n_points], y_traj[:n_points], length
 
     def get_streamlines(self):
         """
         Get streamlines by building trajectory set.
+
+        Seed points are integrated in batches. The trajectories of a batch
+        are then accepted one at a time, in seeding order, against the blank
+        grid.
         """
+        seeds = []
         for indent in range(self.density // 2):
             for xi in range(self.density - 2 * indent):
-                self.traj(xi + indent, indent)
-                self.traj(xi + indent, self.density - 1 - indent)
-                self.traj(indent, xi + indent)
-                self.traj(self.density - 1 - indent, xi + indent)
+                seeds.append((xi + indent, indent))
+                seeds.append((xi + indent, self.density - 1 - indent))
+                seeds.append((indent, xi + indent))
+                seeds.append((self.density - 1 - indent, xi + indent))
+
+        batch_size = 1024
+        for batch_start in range(0, len(seeds), batch_size):
+            batch = seeds[batch_start : batch_start + batch_size]
+            batch_seeds = list(
+                dict.fromkeys((xb, yb) for xb, yb in batch if self.blank[yb, xb] == 0)
+            )
+            if not batch_seeds:
+                continue
+            rows = {seed: row for row, seed in enumerate(batch_seeds)}
+            x0 = np.array([xb * self.spacing_x for xb, _ in batch_seeds])
+            y0 = np.array([yb * self.spacing_y for _, yb in batch_seeds])
+            n = len(batch_seeds)
+            x_traj, y_traj, n_steps = self.rk4_integrate(
+                np.tile(x0, 2),
+                np.tile(y0, 2),
+                np.repeat([1.0, -1.0], n),
+            )
+            started = self.check(x0, y0)
+
+            for xb, yb in batch:
+                if self.blank[yb, xb] != 0:
+                    continue
+                row = rows[(xb, yb)]
+                changes = []
+                xf, yf, sf = self.traj(
+                    x_traj[row], y_traj[row], n_steps[row], started[row], changes
+                )
+                xb_traj, yb_traj, sb = self.traj(
+                    x_traj[n + row],
+                    y_traj[n + row],
+                    n_steps[n + row],
+                    started[row],
+                    changes,
+                )
+                stotal = sf + sb
+                if len(xf) < 1:
+                    continue
+                if stotal > 0.2:
+                    initxb, inityb = self.blank_pos(x0[row], y0[row])
+                    self.blank[inityb, initxb] = 1
+                    self.trajectories.append(
+                        (
+                            np.concatenate([xb_traj[::-1], xf[1:]]),
+                            np.concatenate([yb_traj[::-1], yf[1:]]),
+                        )
+                    )
+                else:
+                    self.blank.flat[changes] = 0
 
         self.st_x = [
-            np.array(t[0]) * self.delta_x + self.x[0] for t in self.trajectories
+            np.append(t[0] * self.delta_x + self.x[0], np.nan).tolist()
+            for t in self.trajectories
         ]
         self.st_y = [
-            np.array(t[1]) * self.delta_y + self.y[0] for t in self.trajectories
+            np.append(t[1] * self.delta_y + self.y[0], np.nan).tolist()
+            for t in self.trajectories
         ]
 
-        for index in range(len(self.st_x)):
-            self.st_x[index] = self.st_x[index].tolist()
-            self.st_x[index].append(np.nan)
-
-        for index in range(len(self.st_y)):
-            self.st_y[index] = self.st_y[index].tolist()
-            self.st_y[index].append(np.nan)
-
     def get_streamline_arrows(self):
         """
         Makes an arrow for each streamline.
@@ -329,19 +424,16 @@ class _Streamline(object):
         :rtype (list, list) arrows_x: x-values to create arrowhead and
             arrows_y: y-values to create arrowhead
         """
-        arrow_end_x = np.empty((len(self.st_x)))
-        arrow_end_y = np.empty((len(self.st_y)))
-        arrow_start_x = np.empty((len(self.st_x)))
-        arrow_start_y = np.empty((len(self.st_y)))
-        for index in range(len(self.st_x)):
-            arrow_end_x[index] = self.st_x[index][int(len(self.st_x[index]) / 3)]
-            arrow_start_x[index] = self.st_x[index][
-                (int(len(self.st_x[index]) / 3)) - 1
-            ]
-            arrow_end_y[index] = self.st_y[index][int(len(self.st_y[index]) / 3)]
-            arrow_start_y[index] = self.st_y[index][
-                (int(len(self.st_y[index]) / 3)) - 1
-            ]
+        lengths = np.array([len(st_x) for st_x in self.st_x], dtype=int)
+        offsets = np.cumsum(lengths) - lengths
+        end = lengths // 3
+        # Index -1 is the last (nan) value of the streamline
+        start = np.where(end > 0, end - 1, lengths - 1)
+        all_x, all_y = (np.array(s, dtype=float) for s in self.sum_streamlines())
+        arrow_end_x = all_x[offsets + end]
+        arrow_start_x = all_x[offsets + start]
+        arrow_end_y = all_y[offsets + end]
+        arrow_start_y = all_y[offsets + start]
 
         dif_x = arrow_end_x - arrow_start_x
         dif_y = arrow_end_y - arrow_start_y
@@ -359,22 +451,11 @@ class _Streamline(object):
         seg2_x = np.cos(ang2) * self.arrow_scale
         seg2_y = np.sin(ang2) * self.arrow_scale
 
-        point1_x = np.empty((len(dif_x)))
-        point1_y = np.empty((len(dif_y)))
-        point2_x = np.empty((len(dif_x)))
-        point2_y = np.empty((len(dif_y)))
-
-        for index in range(len(dif_x)):
-            if dif_x[index] >= 0:
-                point1_x[index] = arrow_end_x[index] - seg1_x[index]
-                point1_y[index] = arrow_end_y[index] - seg1_y[index]
-                point2_x[index] = arrow_end_x[index] - seg2_x[index]
-                point2_y[index] = arrow_end_y[index] - seg2_y[index]
-            else:
-                point1_x[index] = arrow_end_x[index] + seg1_x[index]
-                point1_y[index] = arrow_end_y[index] + seg1_y[index]
-                point2_x[index] = arrow_end_x[index] + seg2_x[index]
-                point2_y[index] = arrow_end_y[index] + seg2_y[index]
+        forward = dif_x >= 0
+        point1_x = np.where(forward, arrow_end_x - seg1_x, arrow_end_x + seg1_x)
+        point1_y = np.where(forward, arrow_end_y - seg1_y, arrow_end_y + seg1_y)
+        point2_x = np.where(forward, arrow_end_x - seg2_x, arrow_end_x + seg2_x)
+        point2_y = np.where(forward, arrow_end_y - seg2_y, arrow_end_y + seg2_y)
 
         space = np.empty((len(point1_x)))
         space[:] = np.nan
@@ -399,6 +480,6 @@ class _Streamline(object):
             combined into single list and streamline_y: all y values for each
             streamline combined into single list
         """
-        streamline_x = sum(self.st_x, [])
-        streamline_y = sum(self.st_y, [])
+        streamline_x = list(itertools.chain.from_iterable(self.st_x))
+        streamline_y = list(itertools.chain.from_iterable(self.st_y))
         return streamline_x, streamline_y
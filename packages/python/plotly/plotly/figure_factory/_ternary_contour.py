@@ -1,3 +1,7 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 import plotly.colors as clrs
 from plotly.graph_objs import graph_objs as go
 from plotly import exceptions
@@ -5,6 +9,7 @@ from plotly import optional_imports
 
 np = optional_imports.get_module("numpy")
 scipy_interp = optional_imports.get_module("scipy.interpolate")
+scipy_spatial = optional_imports.get_module("scipy.spatial")
 
 from skimage import measure
 
@@ -184,11 +189,103 @@ def _prepare_barycentric_coord(b_coords):
     return np.stack((A, B, C))
 
 
+class _TernaryGrid(object):
+    """
+    Triangulation of the data points and regular grid used to interpolate
+    their values. They only depend on the coordinates of the data points,
+    so that they are reused to compute the contours of different values at
+    the same coordinates.
+
+    Parameters
+    ==========
+
+    coordinates : array-like
+        Barycentric coordinates of data points.
+    interp_mode : 'ilr' (default) or 'cartesian'
+        Defines how data are interpolated to compute contours.
+    """
+
+    def __init__(self, coordinates, interp_mode="ilr"):
+        if interp_mode == "cartesian":
+            M, invM = _transform_barycentric_cartesian()
+            coord_points = np.einsum("ik, kj -> ij", M, coordinates)
+        elif interp_mode == "ilr":
+            coordinates = _replace_zero_coords(coordinates)
+            coord_points = _ilr_transform(coordinates)
+        else:
+            raise ValueError("interp_mode should be cartesian or ilr")
+        xx, yy = coord_points[:2]
+        x_min, x_max = xx.min(), xx.max()
+        y_min, y_max = yy.min(), yy.max()
+        n_interp = max(200, int(np.sqrt(len(xx))))
+        self.gr_x = np.linspace(x_min, x_max, n_interp)
+        self.gr_y = np.linspace(y_min, y_max, n_interp)
+        self.triangulation = scipy_spatial.Delaunay(coord_points[:2].T)
+
+    def interpolate(self, values):
+        """
+        Interpolate values on the grid. We use cubic interpolation, values
+        outside of the convex hull of data points are NaN.
+        """
+        interpolator = scipy_interp.CloughTocher2DInterpolator(
+            self.triangulation, values
+        )
+        grid_x, grid_y = np.meshgrid(self.gr_x, self.gr_y)
+        return interpolator((grid_x, grid_y))
+
+
+# Grids of the most recently used coordinates, by interp_mode and coordinates.
+# A grid takes about 350 bytes per data point (mostly the triangulation), so
+# the cache is bounded by the total number of data points of its grids
+# (about 70MB) as well as by the number of grids. Grids of more points are
+# not cached.
+_ternary_grids = OrderedDict()
+_ternary_grids_lock = threading.Lock()
+_max_ternary_grids = 8
+_max_ternary_grid_points = 200000
+
+
+def _get_ternary_grid(coordinates, interp_mode="ilr"):
+    """
+    Return the (cached) _TernaryGrid of the coordinates
+    """
+    coordinates = np.ascontiguousarray(coordinates, dtype=float)
+    n_points = coordinates.shape[-1]
+    key = (
+        interp_mode,
+        coordinates.shape,
+        hashlib.sha1(coordinates.tobytes()).hexdigest(),
+    )
+    with _ternary_grids_lock:
+        grid = _ternary_grids.get(key)
+        if grid is not None:
+            _ternary_grids.move_to_end(key)
+            return grid
+
+    grid = _TernaryGrid(coordinates, interp_mode=interp_mode)
+    if n_points <= _max_ternary_grid_points:
+        with _ternary_grids_lock:
+            _ternary_grids[key] = grid
+            _ternary_grids.move_to_end(key)
+            total_points = sum(k[1][-1] for k in _ternary_grids)
+            while (
+                total_points > _max_ternary_grid_points
+                or len(_ternary_grids) > _max_ternary_grids
+            ):
+                evicted_key, _ = _ternary_grids.popitem(last=False)
+                total_points -= evicted_key[1][-1]
+    return grid
+
+
 def _compute_grid(coordinates, values, interp_mode="ilr"):
     """
     Transform data points with Cartesian or ILR mapping, then Compute
     interpolation on a regular grid.
 
+    The triangulation of the data points and the grid are cached, so that
+    only the interpolation is computed again for new values at the same
+    coordinates.
+
     Parameters
     ==========
 
@@ -199,32 +296,9 @@ def _compute_grid(coordinates, values, interp_mode="ilr"):
     interp_mode : 'ilr' (default) or 'cartesian'
         Defines how data are interpolated to compute contours.
     """
-    if interp_mode == "cartesian":
-        M, invM = _transform_barycentric_cartesian()
-        coord_points = np.einsum("ik, kj -> ij", M, coordinates)
-    elif interp_mode == "ilr":
-        coordinates = _replace_zero_coords(coordinates)
-        coord_points = _ilr_transform(coordinates)
-    else:
-        raise ValueError("interp_mode should be cartesian or ilr")
-    xx, yy = coord_points[:2]
-    x_min, x_max = xx.min(), xx.max()
-    y_min, y_max = yy.min(), yy.max()
-    n_interp = max(200, int(np.sqrt(len(values))))
-    gr_x = np.linspace(x_min, x_max, n_interp)
-    gr_y = np.linspace(y_min, y_max, n_interp)
-    grid_x, grid_y = np.meshgrid(gr_x, gr_y)
-    # We use cubic interpolation, except outside of the convex hull
-    # of data points where we use nearest neighbor values.
-    grid_z = scipy_interp.griddata(
-        coord_points[:2].T, values, (grid_x, grid_y), method="cubic"
-    )
-    grid_z_other = scipy_interp.griddata(
-        coord_points[:2].T, values, (grid_x, grid_y), method="nearest"
-    )
-    # mask_nan = np.isnan(grid_z)
-    # grid_z[mask_nan] = grid_z_other[mask_nan]
-    return grid_z, gr_x, gr_y
+    grid = _get_ternary_grid(coordinates, interp_mode=interp_mode)
+    grid_z = grid.interpolate(values)
+    return grid_z, grid.gr_x, grid.gr_y
 
 
 # ----------------------- Contour traces ----------------------
@@ -610,7 +684,7 @@ def create_ternary_contour(
     ...                                 title='Ternary plot',
     ...                                 pole_labels=['clay', 'quartz', 'fledspar'])
     """
-    if scipy_interp is None:
+    if scipy_interp is None or scipy_spatial is None:
         raise ImportError(
             """\
     The create_ternary_contour figure factory requires the scipy package"""
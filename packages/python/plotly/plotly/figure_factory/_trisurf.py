@@ -14,6 +14,18 @@ def map_face2color(face, colormap, scale, vmin, vmax):
     given parametrized surface. It returns an rgb color based on the mean
     distance between vmin and vmax
 
+    """
+    return str(map_faces2color([face], colormap, scale, vmin, vmax)[0])
+
+
+def map_faces2color(faces, colormap, scale, vmin, vmax):
+    """
+    Normalize an array of facecolor values by vmin/vmax and return an array
+    of rgb-color strings
+
+    Vectorized version of map_face2color. The colors are interpolated for
+    all the faces at once, and each distinct color is only formatted as an
+    rgb string once.
     """
     if vmin >= vmax:
         raise exceptions.PlotlyError(
@@ -22,55 +34,44 @@ def map_face2color(face, colormap, scale, vmin, vmax):
             "bigger than or equal to the value "
             "of vmax."
         )
+    faces = np.asarray(faces, dtype=float)
+    colors = np.array(colormap, dtype=float)
     if len(colormap) == 1:
         # color each triangle face with the same color in colormap
-        face_color = colormap[0]
-        face_color = clrs.convert_to_RGB_255(face_color)
-        face_color = clrs.label_rgb(face_color)
-        return face_color
-    if face == vmax:
-        # pick last color in colormap
-        face_color = colormap[-1]
-        face_color = clrs.convert_to_RGB_255(face_color)
-        face_color = clrs.label_rgb(face_color)
-        return face_color
+        face_colors = np.repeat(colors, len(faces), axis=0)
     else:
+        # find the normalized distance t of each triangle face between
+        # vmin and vmax where the distance is between 0 and 1
+        t = (faces - vmin) / float((vmax - vmin))
         if scale is None:
-            # find the normalized distance t of a triangle face between
-            # vmin and vmax where the distance is between 0 and 1
-            t = (face - vmin) / float((vmax - vmin))
-            low_color_index = int(t / (1.0 / (len(colormap) - 1)))
-
-            face_color = clrs.find_intermediate_color(
-                colormap[low_color_index],
-                colormap[low_color_index + 1],
-                t * (len(colormap) - 1) - low_color_index,
-            )
-
-            face_color = clrs.convert_to_RGB_255(face_color)
-            face_color = clrs.label_rgb(face_color)
+            low_color_index = (t / (1.0 / (len(colormap) - 1))).astype(int)
+            low_color_index = np.clip(low_color_index, 0, len(colormap) - 2)
+            intermed = t * (len(colormap) - 1) - low_color_index
         else:
-            # find the face color for a non-linearly interpolated scale
-            t = (face - vmin) / float((vmax - vmin))
-
-            low_color_index = 0
-            for k in range(len(scale) - 1):
-                if scale[k] <= t < scale[k + 1]:
-                    break
-                low_color_index += 1
-
+            # find the face colors for a non-linearly interpolated scale
+            scale = np.asarray(scale, dtype=float)
+            low_color_index = np.searchsorted(scale, t, side="right") - 1
+            low_color_index = np.clip(low_color_index, 0, len(scale) - 2)
             low_scale_val = scale[low_color_index]
             high_scale_val = scale[low_color_index + 1]
+            intermed = (t - low_scale_val) / (high_scale_val - low_scale_val)
 
-            face_color = clrs.find_intermediate_color(
-                colormap[low_color_index],
-                colormap[low_color_index + 1],
-                (t - low_scale_val) / (high_scale_val - low_scale_val),
-            )
+        low_colors = colors[low_color_index]
+        face_colors = low_colors + intermed[:, None] * (
+            colors[low_color_index + 1] - low_colors
+        )
+        # pick last color in colormap
+        face_colors[faces == vmax] = colors[-1]
 
-            face_color = clrs.convert_to_RGB_255(face_color)
-            face_color = clrs.label_rgb(face_color)
-        return face_color
+    # Round half to even, as convert_to_RGB_255 does
+    rgb_255 = np.rint(face_colors * 255.0).astype(int)
+    rgb_255_min = rgb_255.min(axis=0)
+    rgb_255_codes = np.ravel_multi_index(
+        (rgb_255 - rgb_255_min).T, rgb_255.max(axis=0) - rgb_255_min + 1
+    )
+    _, first, inverse = np.unique(rgb_255_codes, return_index=True, return_inverse=True)
+    labels = np.array([clrs.label_rgb(color) for color in rgb_255[first].tolist()])
+    return labels[inverse.reshape(-1)]
 
 
 def trisurf(
@@ -88,6 +89,7 @@ def trisurf(
     y_edge=None,
     z_edge=None,
     facecolor=None,
+    use_intensity=False,
 ):
     """
     Refer to FigureFactory.create_trisurf() for docstring
@@ -144,25 +146,53 @@ def trisurf(
         min_mean_dists = np.min(mean_dists)
         max_mean_dists = np.max(mean_dists)
 
-        if facecolor is None:
-            facecolor = []
-        for index in range(len(mean_dists)):
-            color = map_face2color(
-                mean_dists[index], colormap, scale, min_mean_dists, max_mean_dists
-            )
-            facecolor.append(color)
-
-    # Make sure facecolor is a list so output is consistent across Pythons
-    facecolor = np.asarray(facecolor)
+    mean_dists_are_numbers = not isinstance(mean_dists[0], str)
     ii, jj, kk = simplices.T
 
-    triangles = graph_objs.Mesh3d(
-        x=x, y=y, z=z, facecolor=facecolor, i=ii, j=jj, k=kk, name=""
-    )
+    if mean_dists_are_numbers and use_intensity:
+        # color the faces in the browser from their values
+        if min_mean_dists >= max_mean_dists:
+            raise exceptions.PlotlyError(
+                "Incorrect relation between vmin "
+                "and vmax. The vmin value cannot be "
+                "bigger than or equal to the value "
+                "of vmax."
+            )
+        colorscale = clrs.make_colorscale(
+            colormap if len(colormap) > 1 else colormap * 2, scale
+        )
+        colorscale = clrs.convert_colorscale_to_rgb(colorscale)
+        triangles = graph_objs.Mesh3d(
+            x=x,
+            y=y,
+            z=z,
+            intensity=mean_dists,
+            intensitymode="cell",
+            colorscale=colorscale,
+            showscale=show_colorbar,
+            i=ii,
+            j=jj,
+            k=kk,
+            name="",
+        )
+    else:
+        if mean_dists_are_numbers:
+            face_colors = map_faces2color(
+                mean_dists, colormap, scale, min_mean_dists, max_mean_dists
+            )
+            if facecolor is None:
+                facecolor = face_colors
+            else:
+                facecolor = np.append(facecolor, face_colors)
 
-    mean_dists_are_numbers = not isinstance(mean_dists[0], str)
+        # Make sure facecolor is an array so output is consistent across Pythons
+        facecolor = np.asarray(facecolor)
+
+        triangles = graph_objs.Mesh3d(
+            x=x, y=y, z=z, facecolor=facecolor, i=ii, j=jj, k=kk, name=""
+        )
 
-    if mean_dists_are_numbers and show_colorbar is True:
+    if mean_dists_are_numbers and show_colorbar is True and not use_intensity:
         # make a colorscale from the colors
         colorscale = clrs.make_colorscale(colormap, scale)
         colorscale = clrs.convert_colorscale_to_rgb(colorscale)
@@ -184,7 +214,7 @@ def trisurf(
 
     # the triangle sides are not plotted
     if plot_edges is False:
-        if mean_dists_are_numbers and show_colorbar is True:
+        if mean_dists_are_numbers and show_colorbar is True and not use_intensity:
             return [triangles, colorbar]
         else:
             return [triangles]
@@ -205,21 +235,13 @@ def trisurf(
 
     # Pull indices we care about, then add a None column to separate tris
     ixs_triangles = [0, 1, 2, 0]
-    pull_edges = tri_vertices[:, ixs_triangles, :]
-    x_edge_pull = np.hstack(
-        [pull_edges[:, :, 0], np.tile(None, [pull_edges.shape[0], 1])]
-    )
-    y_edge_pull = np.hstack(
-        [pull_edges[:, :, 1], np.tile(None, [pull_edges.shape[0], 1])]
-    )
-    z_edge_pull = np.hstack(
-        [pull_edges[:, :, 2], np.tile(None, [pull_edges.shape[0], 1])]
-    )
+    pull_edges = np.full((len(tri_vertices), 5, 3), None, dtype=object)
+    pull_edges[:, :4] = tri_vertices[:, ixs_triangles, :]
 
     # Now unravel the edges into a 1-d vector for plotting
-    x_edge = np.hstack([x_edge, x_edge_pull.reshape([1, -1])[0]])
-    y_edge = np.hstack([y_edge, y_edge_pull.reshape([1, -1])[0]])
-    z_edge = np.hstack([z_edge, z_edge_pull.reshape([1, -1])[0]])
+    x_edge = np.concatenate([x_edge, pull_edges[:, :, 0].ravel()])
+    y_edge = np.concatenate([y_edge, pull_edges[:, :, 1].ravel()])
+    z_edge = np.concatenate([z_edge, pull_edges[:, :, 2].ravel()])
 
     if not (len(x_edge) == len(y_edge) == len(z_edge)):
         raise exceptions.PlotlyError(
@@ -236,7 +258,7 @@ def trisurf(
         showlegend=False,
     )
 
-    if mean_dists_are_numbers and show_colorbar is True:
+    if mean_dists_are_numbers and show_colorbar is True and not use_intensity:
         return [triangles, lines, colorbar]
     else:
         return [triangles, lines]
@@ -261,6 +283,7 @@ def create_trisurf(
     height=800,
     width=800,
     aspectratio=None,
+    use_intensity=False,
 ):
     """
     Returns figure for a triangulated surface plot
@@ -301,6 +324,11 @@ def create_trisurf(
     :param (int|float) width: the width of the plot (in pixels)
     :param (dict) aspectratio: a dictionary of the aspect ratio values for
         the x, y and z axes. 'x', 'y' and 'z' take (int|float) values
+    :param (bool) use_intensity: if True, the values of the faces are sent
+        to the browser as the intensity of the mesh, with a colorscale made
+        from colormap and scale, instead of one rgb color string per face.
+        This keeps figures with many triangles small. Ignored if color_func
+        is a list of colors
 
     Example 1: Sphere
 
@@ -484,6 +512,7 @@ def create_trisurf(
         scale=scale,
         edges_color=edges_color,
         plot_edges=plot_edges,
+        use_intensity=use_intensity,
     )
 
     axis = dict(
@@ -631,6 +631,11 @@ class Figure(BaseFigure):
             If True, invalid properties in the figure specification will be
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
+        copy: bool
+            If True (default), numpy arrays in the figure specification are
+            copied. If False, they are adopted as read-only views, which
+            avoids duplicating large arrays. In this case the arrays must not
+            be modified in place after the figure is constructed.
 
         Raises
         ------
@@ -920,6 +925,7 @@ class Figure(BaseFigure):
         cols=None,
         secondary_ys=None,
         exclude_empty_subplots=False,
+        validate=True,
     ) -> "Figure":
         """
 
@@ -962,6 +968,15 @@ class Figure(BaseFigure):
             If True, the trace will not be added to subplots that don't already
             have traces.
 
+        validate: True, False or 'schema' (default True)
+            How the trace properties are validated:
+              - True: property names and values are validated and coerced
+              - 'schema': property names are checked against the plotly
+                schema, but values are not validated
+              - False: traces are added as is, without validation
+            Skipping value validation makes adding many traces much faster,
+            but invalid values are only reported by plotly.js.
+
         Returns
         -------
         BaseFigure
@@ -990,7 +1005,7 @@ class Figure(BaseFigure):
 
         """
         return super(Figure, self).add_traces(
-            data, rows, cols, secondary_ys, exclude_empty_subplots
+            data, rows, cols, secondary_ys, exclude_empty_subplots, validate
         )
 
     def add_vline(
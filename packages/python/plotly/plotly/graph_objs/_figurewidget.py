@@ -631,6 +631,11 @@ class FigureWidget(BaseFigureWidget):
             If True, invalid properties in the figure specification will be
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
+        copy: bool
+            If True (default), numpy arrays in the figure specification are
+            copied. If False, they are adopted as read-only views, which
+            avoids duplicating large arrays. In this case the arrays must not
+            be modified in place after the figure is constructed.
 
         Raises
         ------
@@ -922,6 +927,7 @@ class FigureWidget(BaseFigureWidget):
         cols=None,
         secondary_ys=None,
         exclude_empty_subplots=False,
+        validate=True,
     ) -> "FigureWidget":
         """
 
@@ -964,6 +970,15 @@ class FigureWidget(BaseFigureWidget):
             If True, the trace will not be added to subplots that don't already
             have traces.
 
+        validate: True, False or 'schema' (default True)
+            How the trace properties are validated:
+              - True: property names and values are validated and coerced
+              - 'schema': property names are checked against the plotly
+                schema, but values are not validated
+              - False: traces are added as is, without validation
+            Skipping value validation makes adding many traces much faster,
+            but invalid values are only reported by plotly.js.
+
         Returns
         -------
         BaseFigure
@@ -992,7 +1007,7 @@ class FigureWidget(BaseFigureWidget):
 
         """
         return super(FigureWidget, self).add_traces(
-            data, rows, cols, secondary_ys, exclude_empty_subplots
+            data, rows, cols, secondary_ys, exclude_empty_subplots, validate
         )
 
     def add_vline(
@@ -3,18 +3,26 @@ import sys
 from typing import TYPE_CHECKING
 
 if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._kaleido import to_image, write_image, full_figure_for_development
+    from ._kaleido import (
+        to_image,
+        write_image,
+        write_images,
+        full_figure_for_development,
+    )
     from . import orca, kaleido
     from . import json
     from ._json import to_json, from_json, read_json, write_json
+    from ._image_cache import image_cache
     from ._templates import templates, to_templated
-    from ._html import to_html, write_html
+    from ._html import to_html, write_html, write_html_report
     from ._renderers import renderers, show
     from . import base_renderers
 
     __all__ = [
         "to_image",
         "write_image",
+        "write_images",
+        "image_cache",
         "orca",
         "json",
         "to_json",
@@ -25,6 +33,7 @@ if sys.version_info < (3, 7) or TYPE_CHECKING:
         "to_templated",
         "to_html",
         "write_html",
+        "write_html_report",
         "renderers",
         "show",
         "base_renderers",
@@ -37,7 +46,9 @@ else:
         [
             "._kaleido.to_image",
             "._kaleido.write_image",
+            "._kaleido.write_images",
             "._kaleido.full_figure_for_development",
+            "._image_cache.image_cache",
             "._json.to_json",
             "._json.from_json",
             "._json.read_json",
@@ -46,6 +57,7 @@ else:
             "._templates.to_templated",
             "._html.to_html",
             "._html.write_html",
+            "._html.write_html_report",
             "._renderers.renderers",
             "._renderers.show",
         ],
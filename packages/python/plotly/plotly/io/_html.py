@@ -22,6 +22,33 @@ if (window.MathJax && window.MathJax.Hub && window.MathJax.Hub.Config) {window.M
 </script>"""
 
 
+# Script defining window.PlotlyReport.defer, which postpones drawing a figure
+# until its div scrolls into view. Used by write_html_report(lazy=True).
+_lazy_render_script = """\
+<script type="text/javascript">\
+window.PlotlyReport = window.PlotlyReport || (function() {\
+    var pending = new Map();\
+    var observer = ("IntersectionObserver" in window) ?\
+        new IntersectionObserver(function(entries) {\
+            entries.forEach(function(entry) {\
+                var render = pending.get(entry.target);\
+                if (entry.isIntersecting && render) {\
+                    pending.delete(entry.target);\
+                    observer.unobserve(entry.target);\
+                    render();\
+                }\
+            });\
+        }, {rootMargin: "200px"}) : null;\
+    return {defer: function(id, render) {\
+        var gd = document.getElementById(id);\
+        if (!gd || !observer) { render(); return; }\
+        pending.set(gd, render);\
+        observer.observe(gd);\
+    }};\
+})();\
+</script>"""
+
+
 def to_html(
     fig,
     config=None,
@@ -124,6 +151,151 @@ def to_html(
     str
         Representation of figure as an HTML div string
     """
+    # ## Handle loading/initializing plotly.js ##
+    load_plotlyjs = _get_load_plotlyjs(include_plotlyjs)
+
+    # ## Handle loading/initializing MathJax ##
+    mathjax_script = _get_mathjax_script(include_mathjax)
+
+    plotly_html_div = _to_html_div(
+        fig,
+        config=config,
+        auto_play=auto_play,
+        post_script=post_script,
+        animation_opts=animation_opts,
+        default_width=default_width,
+        default_height=default_height,
+        validate=validate,
+        div_id=div_id,
+        mathjax_script=mathjax_script,
+        load_plotlyjs=load_plotlyjs,
+    )
+
+    if full_html:
+        return """\
+<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    {div}
+</body>
+</html>""".format(
+            div=plotly_html_div
+        )
+    else:
+        return plotly_html_div
+
+
+def _get_load_plotlyjs(include_plotlyjs):
+    """
+    Build the HTML that loads plotly.js for the include_plotlyjs argument of
+    to_html
+    """
+    include_plotlyjs_orig = include_plotlyjs
+    if isinstance(include_plotlyjs, str):
+        include_plotlyjs = include_plotlyjs.lower()
+
+    # Init and load
+    load_plotlyjs = ""
+
+    if include_plotlyjs == "cdn":
+        load_plotlyjs = """\
+        {win_config}
+        <script charset="utf-8" src="{cdn_url}"></script>\
+    """.format(
+            win_config=_window_plotly_config, cdn_url=plotly_cdn_url()
+        )
+
+    elif include_plotlyjs == "directory":
+        load_plotlyjs = """\
+        {win_config}
+        <script charset="utf-8" src="plotly.min.js"></script>\
+    """.format(
+            win_config=_window_plotly_config
+        )
+
+    elif isinstance(include_plotlyjs, str) and include_plotlyjs.endswith(".js"):
+        load_plotlyjs = """\
+        {win_config}
+        <script charset="utf-8" src="{url}"></script>\
+    """.format(
+            win_config=_window_plotly_config, url=include_plotlyjs_orig
+        )
+
+    elif include_plotlyjs:
+        load_plotlyjs = """\
+        {win_config}
+        <script type="text/javascript">{plotlyjs}</script>\
+    """.format(
+            win_config=_window_plotly_config, plotlyjs=get_plotlyjs()
+        )
+
+    return load_plotlyjs
+
+
+def _get_mathjax_script(include_mathjax):
+    """
+    Build the HTML that loads MathJax for the include_mathjax argument of
+    to_html
+    """
+    include_mathjax_orig = include_mathjax
+    if isinstance(include_mathjax, str):
+        include_mathjax = include_mathjax.lower()
+
+    mathjax_template = """\
+    <script src="{url}?config=TeX-AMS-MML_SVG"></script>"""
+
+    if include_mathjax == "cdn":
+        mathjax_script = (
+            mathjax_template.format(
+                url=(
+                    "https://cdnjs.cloudflare.com" "/ajax/libs/mathjax/2.7.5/MathJax.js"
+                )
+            )
+            + _mathjax_config
+        )
+
+    elif isinstance(include_mathjax, str) and include_mathjax.endswith(".js"):
+
+        mathjax_script = (
+            mathjax_template.format(url=include_mathjax_orig) + _mathjax_config
+        )
+    elif not include_mathjax:
+        mathjax_script = ""
+    else:
+        raise ValueError(
+            """\
+Invalid value of type {typ} received as the include_mathjax argument
+    Received value: {val}
+
+include_mathjax may be specified as False, 'cdn', or a string ending with '.js'
+    """.format(
+                typ=type(include_mathjax), val=repr(include_mathjax)
+            )
+        )
+
+    return mathjax_script
+
+
+def _to_html_div(
+    fig,
+    config=None,
+    auto_play=True,
+    post_script=None,
+    animation_opts=None,
+    default_width="100%",
+    default_height="100%",
+    validate=True,
+    div_id=None,
+    mathjax_script="",
+    load_plotlyjs="",
+    lazy=False,
+):
+    """
+    Build the HTML div of a figure, see to_html for the description of the
+    arguments. mathjax_script and load_plotlyjs are HTML inserted before the
+    figure div, and if lazy is True the figure is only drawn once its div
+    scrolls into view (this requires _lazy_render_script on the page).
+    """
     from plotly.io.json import to_json_plotly
 
     # ## Validate figure ##
@@ -243,84 +415,17 @@ def to_html(
         then_post_script=then_post_script,
     )
 
-    # ## Handle loading/initializing plotly.js ##
-    include_plotlyjs_orig = include_plotlyjs
-    if isinstance(include_plotlyjs, str):
-        include_plotlyjs = include_plotlyjs.lower()
-
-    # Init and load
-    load_plotlyjs = ""
-
-    if include_plotlyjs == "cdn":
-        load_plotlyjs = """\
-        {win_config}
-        <script charset="utf-8" src="{cdn_url}"></script>\
-    """.format(
-            win_config=_window_plotly_config, cdn_url=plotly_cdn_url()
-        )
-
-    elif include_plotlyjs == "directory":
-        load_plotlyjs = """\
-        {win_config}
-        <script charset="utf-8" src="plotly.min.js"></script>\
-    """.format(
-            win_config=_window_plotly_config
-        )
-
-    elif isinstance(include_plotlyjs, str) and include_plotlyjs.endswith(".js"):
-        load_plotlyjs = """\
-        {win_config}
-        <script charset="utf-8" src="{url}"></script>\
-    """.format(
-            win_config=_window_plotly_config, url=include_plotlyjs_orig
-        )
-
-    elif include_plotlyjs:
-        load_plotlyjs = """\
-        {win_config}
-        <script type="text/javascript">{plotlyjs}</script>\
-    """.format(
-            win_config=_window_plotly_config, plotlyjs=get_plotlyjs()
-        )
-
-    # ## Handle loading/initializing MathJax ##
-    include_mathjax_orig = include_mathjax
-    if isinstance(include_mathjax, str):
-        include_mathjax = include_mathjax.lower()
-
-    mathjax_template = """\
-    <script src="{url}?config=TeX-AMS-MML_SVG"></script>"""
-
-    if include_mathjax == "cdn":
-        mathjax_script = (
-            mathjax_template.format(
-                url=(
-                    "https://cdnjs.cloudflare.com" "/ajax/libs/mathjax/2.7.5/MathJax.js"
-                )
-            )
-            + _mathjax_config
+    if lazy:
+        # Defer the call to Plotly.newPlot until the div scrolls into view,
+        # see _lazy_render_script
+        script = """\
+                window.PlotlyReport.defer("{id}", function() {{\
+{script};\
+                }})""".format(
+            id=plotdivid, script=script
         )
 
-    elif isinstance(include_mathjax, str) and include_mathjax.endswith(".js"):
-
-        mathjax_script = (
-            mathjax_template.format(url=include_mathjax_orig) + _mathjax_config
-        )
-    elif not include_mathjax:
-        mathjax_script = ""
-    else:
-        raise ValueError(
-            """\
-Invalid value of type {typ} received as the include_mathjax argument
-    Received value: {val}
-
-include_mathjax may be specified as False, 'cdn', or a string ending with '.js'
-    """.format(
-                typ=type(include_mathjax), val=repr(include_mathjax)
-            )
-        )
-
-    plotly_html_div = """\
+    return """\
 <div>\
         {mathjax_script}\
         {load_plotlyjs}\
@@ -340,19 +445,6 @@ style="height:{height}; width:{width};"></div>\
         script=script,
     ).strip()
 
-    if full_html:
-        return """\
-<html>
-<head><meta charset="utf-8" /></head>
-<body>
-    {div}
-</body>
-</html>""".format(
-            div=plotly_html_div
-        )
-    else:
-        return plotly_html_div
-
 
 def write_html(
     fig,
@@ -521,3 +613,134 @@ def write_html(
     if path is not None and full_html and auto_open:
         url = path.absolute().as_uri()
         webbrowser.open(url)
+
+
+def write_html_report(
+    figs,
+    file,
+    config=None,
+    auto_play=True,
+    include_plotlyjs=True,
+    include_mathjax=False,
+    post_script=None,
+    animation_opts=None,
+    validate=True,
+    default_width="100%",
+    default_height="450px",
+    lazy=False,
+    auto_open=False,
+):
+    """
+    Write a sequence of figures to a single HTML document
+
+    plotly.js (and MathJax) are loaded once in the document head, and the
+    div of each figure is written to the file as soon as it is built, so
+    only one figure is held in memory as HTML at a time.
+
+    Parameters
+    ----------
+    figs: iterable
+        Figure objects or dicts representing figures
+    file: str or writeable
+        A string representing a local file path or a writeable object
+        (e.g. a pathlib.Path object or an open file descriptor)
+    config: dict or None (default None)
+        Plotly.js figure config options, applied to every figure
+    auto_play: bool (default=True)
+        Whether to automatically start the animation sequence of figures
+        that contain frames once they are drawn.
+    include_plotlyjs: bool or string (default True)
+        Specifies how the plotly.js library is included/loaded in the
+        document, see `write_html`. If True, the plotly.js source code is
+        included once for all of the figures.
+    include_mathjax: bool or string (default False)
+        Specifies how the MathJax.js library is included in the document,
+        see `write_html`.
+    post_script: str or list or None (default None)
+        JavaScript snippet(s) to be run after each figure is drawn, see
+        `write_html`.
+    animation_opts: dict or None (default None)
+        dict of custom animation parameters to be passed to the function
+        Plotly.animate in Plotly.js, see `write_html`.
+    validate: bool (default True)
+        True if the figures should be validated before being converted to
+        JSON, False otherwise.
+    default_width, default_height: number or str (default '100%', '450px')
+        The default figure width/height to use if a figure does not
+        specify its own layout.width/layout.height property, see
+        `write_html`. The default height is fixed so that figures are laid
+        out one below the other.
+    lazy: bool (default False)
+        If True, each figure is only drawn once its div is about to scroll
+        into view. This makes documents with many figures open quickly.
+        Browsers that do not support IntersectionObserver draw every figure
+        on page load.
+    auto_open: bool (default False)
+        If True, open the saved file in a web browser after saving.
+
+    Returns
+    -------
+    None
+    """
+    # Build the document head first, so that invalid include_plotlyjs or
+    # include_mathjax arguments are reported before writing anything
+    head = """\
+<html>
+<head>
+    <meta charset="utf-8" />
+    {mathjax_script}{load_plotlyjs}{lazy_script}
+</head>
+<body>
+""".format(
+        mathjax_script=_get_mathjax_script(include_mathjax),
+        load_plotlyjs=_get_load_plotlyjs(include_plotlyjs),
+        lazy_script=_lazy_render_script if lazy else "",
+    )
+
+    # Check if file is a string
+    if isinstance(file, str):
+        path = Path(file)
+    elif isinstance(file, Path):
+        path = file
+    else:
+        path = None
+
+    def write_report(f):
+        f.write(head)
+        for fig in figs:
+            f.write("    ")
+            f.write(
+                _to_html_div(
+                    fig,
+                    config=config,
+                    auto_play=auto_play,
+                    post_script=post_script,
+                    animation_opts=animation_opts,
+                    default_width=default_width,
+                    default_height=default_height,
+                    validate=validate,
+                    lazy=lazy,
+                )
+            )
+            f.write("\n")
+        f.write("</body>\n</html>")
+
+    # Write HTML
+    if path is not None:
+        # To use a different file encoding, pass a file descriptor
+        with path.open("w", encoding="utf-8") as f:
+            write_report(f)
+    else:
+        write_report(file)
+
+    # Check if we should copy plotly.min.js to output directory
+    if path is not None and include_plotlyjs == "directory":
+        bundle_path = path.parent / "plotly.min.js"
+
+        if not bundle_path.exists():
+            bundle_path.write_text(get_plotlyjs(), encoding="utf-8")
+
+    # Handle auto_open
+    if path is not None and auto_open:
+        url = path.absolute().as_uri()
+        webbrowser.open(url)
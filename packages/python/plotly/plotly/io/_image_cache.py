@@ -0,0 +1,275 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class ImageCache(object):
+    """
+    On-disk cache of static images exported by `plotly.io.to_image`
+
+    Images are stored in `directory` under a hash of the validated figure
+    and of the export options, so exporting an identical figure again
+    returns the stored bytes without starting the image export engine.
+    The cache is disabled while `directory` is None (the default).
+
+    When the total size of the cached images exceeds `max_size` bytes, the
+    least recently used images are evicted. Their order of use and total
+    size are tracked in memory, starting from the modification times of
+    the images found in `directory` the first time it is accessed.
+    """
+
+    def __init__(self):
+        self._directory = None
+        self._max_size = 256 * 1024 * 1024
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        # key -> image size, from least to most recently used. None until the
+        # cache directory is first scanned.
+        self._index = None
+        self._total_size = 0
+
+    @property
+    def directory(self):
+        """
+        Directory where cached images are stored, or None to disable the cache
+
+        Returns
+        -------
+        pathlib.Path or None
+        """
+        return self._directory
+
+    @directory.setter
+    def directory(self, val):
+        if val is None:
+            self._directory = None
+            self._index = None
+            return
+
+        if not isinstance(val, (str, Path)):
+            raise ValueError(
+                """
+The directory property must be a string or pathlib.Path object.
+    Received value of type {typ}: {val}""".format(
+                    typ=type(val), val=val
+                )
+            )
+        path = Path(val)
+        path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._directory = path
+            self._index = None
+
+    @property
+    def max_size(self):
+        """
+        Maximum total size in bytes of the cached images
+
+        Returns
+        -------
+        int
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, val):
+        if not isinstance(val, int) or isinstance(val, bool) or val < 0:
+            raise ValueError(
+                """
+The max_size property must be a non-negative integer.
+    Received value: {val}""".format(
+                    val=repr(val)
+                )
+            )
+        with self._lock:
+            self._max_size = val
+            self._evict()
+
+    @property
+    def hits(self):
+        """
+        Number of images returned from the cache
+
+        Returns
+        -------
+        int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Number of images that had to be rendered because they were not cached
+
+        Returns
+        -------
+        int
+        """
+        return self._misses
+
+    def reset_stats(self):
+        """
+        Reset the hits and misses counters to zero
+        """
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def clear(self):
+        """
+        Remove all cached images from the cache directory
+        """
+        if self._directory is None:
+            return
+        with self._lock:
+            for entry in self._directory.glob("*.img"):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+            self._index = OrderedDict()
+            self._total_size = 0
+
+    def make_key(self, fig_dict, **options):
+        """
+        Compute the cache key of an image
+
+        Parameters
+        ----------
+        fig_dict: dict
+            The validated figure dict
+
+        **options
+            The resolved export options (e.g. format, width, height, scale,
+            engine and engine version)
+
+        Returns
+        -------
+        str
+            Hex digest identifying the image
+        """
+        from plotly.io._json import to_json_plotly
+
+        h = hashlib.sha256()
+        h.update(to_json_plotly(fig_dict).encode("utf-8"))
+        for name in sorted(options):
+            h.update("\0{name}={val!r}".format(name=name, val=options[name]).encode())
+        return h.hexdigest()
+
+    def get(self, key):
+        """
+        Return the cached image bytes for key, or None if not cached
+        """
+        path = self._directory / (key + ".img")
+        try:
+            img_bytes = path.read_bytes()
+        except OSError:
+            with self._lock:
+                self._misses += 1
+                self._forget(key)
+            return None
+
+        # Mark entry as recently used. The modification time orders the
+        # entries when the directory is scanned by a later session.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._hits += 1
+            self._touch(key, len(img_bytes))
+        return img_bytes
+
+    def put(self, key, img_bytes):
+        """
+        Store image bytes under key, evicting least recently used images if
+        the cache exceeds max_size. Images that can't be written (e.g. to a
+        full disk or a read-only directory) are not cached
+        """
+        if len(img_bytes) > self._max_size:
+            return
+
+        path = self._directory / (key + ".img")
+        # Write to a temporary file first so that concurrent readers never
+        # see a partially written image
+        tmp_path = path.with_name(
+            "{name}.{pid}.{tid}.tmp".format(
+                name=path.name, pid=os.getpid(), tid=threading.get_ident()
+            )
+        )
+        try:
+            tmp_path.write_bytes(img_bytes)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._touch(key, len(img_bytes))
+            self._evict()
+
+    def _load_index(self):
+        # Must be called with self._lock held
+        if self._index is not None or self._directory is None:
+            return
+        entries = []
+        for entry in self._directory.glob("*.img"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, entry.stem, stat.st_size))
+
+        # Entries with the same modification time are ordered by key, so that
+        # coarse file system timestamps don't make eviction arbitrary
+        self._index = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._total_size = sum(self._index.values())
+
+    def _touch(self, key, size):
+        # Must be called with self._lock held
+        self._load_index()
+        if self._index is None:
+            return
+        self._total_size += size - self._index.pop(key, 0)
+        self._index[key] = size
+
+    def _forget(self, key):
+        # Must be called with self._lock held
+        if self._index is not None and key in self._index:
+            self._total_size -= self._index.pop(key)
+
+    def _evict(self):
+        # Must be called with self._lock held
+        self._load_index()
+        if self._index is None:
+            return
+        while self._total_size > self._max_size and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_size -= size
+            try:
+                (self._directory / (key + ".img")).unlink()
+            except OSError:
+                pass
+
+    def __repr__(self):
+        return """\
+image cache
+-----------
+    directory: {directory}
+    max_size: {max_size}
+    hits: {hits}
+    misses: {misses}
+""".format(
+            directory=self.directory,
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+image_cache = ImageCache()
@@ -2,8 +2,10 @@ import json
 import decimal
 import datetime
 import warnings
+from functools import lru_cache
 from pathlib import Path
 
+import plotly.graph_objs as go
 from plotly.io._utils import validate_coerce_fig_to_dict, validate_coerce_output_type
 from _plotly_utils.optional_imports import get_module
 from _plotly_utils.basevalidators import ImageUriValidator
@@ -119,13 +121,6 @@ def to_json_plotly(plotly_object, pretty=False, engine=None):
     elif engine not in ["orjson", "json"]:
         raise ValueError("Invalid json engine: %s" % engine)
 
-    modules = {
-        "sage_all": get_module("sage.all", should_load=False),
-        "np": get_module("numpy", should_load=False),
-        "pd": get_module("pandas", should_load=False),
-        "image": get_module("PIL.Image", should_load=False),
-    }
-
     # Dump to a JSON string and return
     # --------------------------------
     if engine == "json":
@@ -154,24 +149,350 @@ def to_json_plotly(plotly_object, pretty=False, engine=None):
         except AttributeError:
             pass
 
-        # Try without cleaning
-        try:
-            return _safe(
-                orjson.dumps(plotly_object, option=opts).decode("utf8"), _swap_orjson
+        # numpy datetimes are formatted as by clean_to_json_compatible and the
+        # json engine rather than natively by orjson, which never passes them
+        # to the default hook
+        np = get_module("numpy", should_load=False)
+        if np is not None:
+            plotly_object = _clean_numpy_datetimes(plotly_object, np)
+
+        # Serialize in a single pass, with the values that orjson doesn't
+        # support natively cleaned on demand by the default hook
+        return _safe(
+            orjson.dumps(plotly_object, default=_orjson_default, option=opts).decode(
+                "utf8"
+            ),
+            _swap_orjson,
+        )
+
+
+# Mapping from type to the function that converts values of that type into
+# values that orjson can serialize. Populated lazily by _orjson_default
+_orjson_default_handlers = {}
+
+
+def _orjson_clean(obj):
+    """Generic orjson default handler, based on clean_to_json_compatible"""
+    modules = {
+        "sage_all": get_module("sage.all", should_load=False),
+        "np": get_module("numpy", should_load=False),
+        "pd": get_module("pandas", should_load=False),
+        "image": get_module("PIL.Image", should_load=False),
+    }
+    cleaned = clean_to_json_compatible(
+        obj, numpy_allowed=True, datetime_allowed=True, modules=modules
+    )
+    if cleaned is obj:
+        # Returning obj unchanged would make orjson call the hook again until
+        # it fails with an unhelpful recursion limit error
+        raise TypeError(
+            "Object of type {typ} is not JSON serializable".format(
+                typ=type(obj).__name__
             )
-        except TypeError:
-            pass
+        )
+    return cleaned
+
+
+def _clean_numpy_datetimes(obj, np):
+    """
+    Return obj with the numpy datetime64 arrays and values it contains
+    converted to strings, as clean_to_json_compatible does. Dicts, lists and
+    tuples are only copied if they contain such values.
+    """
+    if isinstance(obj, dict):
+        cleaned = None
+        for k, v in obj.items():
+            cleaned_v = _clean_numpy_datetimes(v, np)
+            if cleaned_v is not v:
+                if cleaned is None:
+                    cleaned = dict(obj)
+                cleaned[k] = cleaned_v
+        return obj if cleaned is None else cleaned
+    elif isinstance(obj, (list, tuple)):
+        cleaned = None
+        for i, v in enumerate(obj):
+            if isinstance(v, (str, int, float)):
+                continue
+            cleaned_v = _clean_numpy_datetimes(v, np)
+            if cleaned_v is not v:
+                if cleaned is None:
+                    cleaned = list(obj)
+                cleaned[i] = cleaned_v
+        return obj if cleaned is None else cleaned
+    elif isinstance(obj, np.ndarray) and obj.dtype.kind == "M":
+        return np.datetime_as_string(obj).tolist()
+    elif isinstance(obj, np.datetime64):
+        return str(obj)
+    return obj
+
+
+def _orjson_clean_ndarray(obj):
+    """orjson default handler for numpy arrays that orjson can't serialize"""
+    np = get_module("numpy")
+    if obj.dtype.kind in ("b", "i", "u", "f") and not obj.flags.c_contiguous:
+        return np.ascontiguousarray(obj)
+    elif obj.dtype.kind == "O":
+        # Elements are processed by orjson, and cleaned on demand
+        return _clean_numpy_datetimes(obj.tolist(), np)
+    return _orjson_clean(obj)
+
+
+def _orjson_default_handler(typ):
+    """
+    Choose the function that converts values of type typ into values that
+    orjson can serialize
+    """
+    np = get_module("numpy", should_load=False)
+    pd = get_module("pandas", should_load=False)
+    image = get_module("PIL.Image", should_load=False)
+
+    if np is not None and issubclass(typ, np.ndarray):
+        return _orjson_clean_ndarray
+    elif np is not None and issubclass(typ, np.ma.core.MaskedConstant):
+        return lambda obj: None
+    elif pd is not None and typ is type(pd.NaT):
+        return lambda obj: None
+    elif pd is not None and issubclass(typ, pd.Timestamp):
+        # orjson serializes the equivalent datetime
+        return lambda obj: obj.to_pydatetime()
+    elif issubclass(typ, decimal.Decimal):
+        return float
+    elif image is not None and issubclass(typ, image.Image):
+        return ImageUriValidator.pil_image_to_uri
+    else:
+        return _orjson_clean
+
+
+def _orjson_default(obj):
+    """
+    orjson default hook, called for values that orjson can't serialize.
+
+    The conversion function is chosen once per type and memoized, so that
+    large arrays of unsupported values (e.g. Decimal) are converted without
+    repeating the type checks of clean_to_json_compatible for every element
+    """
+    typ = type(obj)
+    handler = _orjson_default_handlers.get(typ)
+    if handler is None:
+        handler = _orjson_default_handler(typ)
+        _orjson_default_handlers[typ] = handler
+    return handler(obj)
+
+
+_binary_modes = ("auto", "always", "never")
+
+# Kind of value of properties that are not described by the schema, but are
+# part of the structure of figures and templates
+_structure_prop_kinds = {
+    "figure": {
+        "data": ("traces", None),
+        "layout": ("object", "layout"),
+        "frames": ("objects", "frame"),
+    },
+    "template": {"data": ("tracemap", None), "layout": ("object", "layout")},
+}
+
+
+@lru_cache(maxsize=4096)
+def _prop_kind(path, key):
+    """
+    Return the kind of value of property key of the object at schema path,
+    and the schema path of the value's objects, if any. Kinds are:
+      - "array": a data array or array_ok property, encoded as a typed array
+      - "any": a property accepting any value (e.g. selectedpoints), only
+        encoded if it is a numpy array or pandas series
+      - "value": any other property, left as is
+      - "object" / "objects": a dict / list of dicts at the returned path
+      - "traces": a list of trace dicts
+      - "tracemap": a dict from trace type to list of trace dicts
+      - None: the property is not part of the schema
+    """
+    if path in _structure_prop_kinds:
+        return _structure_prop_kinds[path].get(key, (None, None))
+
+    from _plotly_utils.utils import is_skipped_key
+
+    if is_skipped_key(key):
+        return "value", None
+
+    from plotly.validator_cache import ValidatorCache
+    import _plotly_utils.basevalidators as bv
+
+    validator = ValidatorCache.find_validator(path, key)
+    if validator is None:
+        return None, None
+    elif isinstance(validator, bv.AnyValidator):
+        return "any", None
+    elif isinstance(validator, bv.DataArrayValidator) or getattr(
+        validator, "array_ok", False
+    ):
+        return "array", None
+    elif isinstance(validator, bv.BaseDataValidator):
+        return "traces", None
+    elif isinstance(validator, bv.BaseTemplateValidator):
+        return "object", "template"
+    elif isinstance(validator, bv.CompoundValidator):
+        return "object", validator.data_class._path_str
+    elif isinstance(validator, bv.CompoundArrayValidator):
+        return "objects", validator.data_class._path_str
+    else:
+        return "value", None
+
 
-        cleaned = clean_to_json_compatible(
-            plotly_object,
-            numpy_allowed=True,
-            datetime_allowed=True,
-            modules=modules,
+def _contains_array(val):
+    """
+    Return True if val is, or contains, a numpy array or pandas series
+    """
+    from _plotly_utils.basevalidators import is_homogeneous_array
+
+    if isinstance(val, dict):
+        return any(_contains_array(v) for v in val.values())
+    elif isinstance(val, (list, tuple)):
+        return any(_contains_array(v) for v in val)
+    else:
+        return is_homogeneous_array(val)
+
+
+def _child_kind(kind, path, key, val, always=False):
+    """
+    Return the kind and schema path of the element key of a container of the
+    given kind (see _prop_kind)
+    """
+    if kind == "object":
+        child_kind = _prop_kind(path, key)
+        if (
+            child_kind == ("object", "template")
+            and not always
+            and not _contains_array(val)
+        ):
+            # Skip loading the validators of templates without arrays
+            return "value", None
+        return child_kind
+    elif kind == "objects":
+        return "object", path
+    elif kind == "traces":
+        trace_type = val.get("type", "scatter") if isinstance(val, dict) else None
+        return "object", trace_type
+    elif kind == "tracemap":
+        if not always and not _contains_array(val):
+            # Skip loading the validators of template trace types without
+            # arrays
+            return "value", None
+        return "objects", key
+    else:
+        return "value", None
+
+
+def _encode_array(val, always):
+    """
+    Convert a data array to the plotly.js typed array spec if possible
+    """
+    from _plotly_utils.basevalidators import is_homogeneous_array
+    from _plotly_utils.utils import to_typed_array_spec
+
+    if is_homogeneous_array(val):
+        return to_typed_array_spec(val, encode_dates=always)
+    elif always and isinstance(val, (list, tuple)) and val:
+        np = get_module("numpy")
+        if np is None:
+            return val
+        try:
+            arr = np.asarray(val)
+        except (ValueError, TypeError):
+            # e.g. ragged nested lists
+            return val
+        if arr.dtype.kind in "iuf":
+            return to_typed_array_spec(arr)
+    return val
+
+
+def _encode_unknown(val, encode_array=True):
+    """
+    Convert arrays in a property value that is not described by the schema,
+    based on property names only (see _plotly_utils.utils.is_skipped_key).
+    Arrays directly in lists are left as is.
+    """
+    from _plotly_utils.basevalidators import is_homogeneous_array
+    from _plotly_utils.utils import is_skipped_key, to_typed_array_spec
+
+    if isinstance(val, dict):
+        return {
+            k: v if is_skipped_key(k) else _encode_unknown(v) for k, v in val.items()
+        }
+    elif encode_array and is_homogeneous_array(val):
+        return to_typed_array_spec(val)
+    elif isinstance(val, (list, tuple)) and any(
+        isinstance(v, (dict, list, tuple)) for v in val
+    ):
+        return [_encode_unknown(v, encode_array=False) for v in val]
+    else:
+        return val
+
+
+def _encode(val, kind, path, always):
+    if kind == "array":
+        return _encode_array(val, always)
+    elif kind == "any":
+        return _encode_array(val, False)
+    elif kind is None:
+        return _encode_unknown(val)
+    elif kind in ("object", "tracemap") and isinstance(val, dict):
+        return {
+            k: _encode(v, *_child_kind(kind, path, k, v, always), always)
+            for k, v in val.items()
+        }
+    elif kind in ("objects", "traces") and isinstance(val, (list, tuple)):
+        return [
+            _encode(v, *_child_kind(kind, path, i, v, always), always)
+            for i, v in enumerate(val)
+        ]
+    else:
+        return val
+
+
+def encode_typed_arrays(fig_dict, binary="auto"):
+    """
+    Convert the arrays of a figure dict to the plotly.js typed array spec
+
+    Each property is handled according to the plotly schema, so that only
+    data arrays and array_ok properties are converted, in data, layout
+    (including templates) and frames alike. Objects that do not match the
+    schema fall back to converting arrays of any property but those listed
+    by _plotly_utils.utils.is_skipped_key.
+
+    Parameters
+    ----------
+    fig_dict: dict
+        Figure dict with 'data', 'layout' and 'frames' keys
+
+    binary: str (default "auto")
+        One of:
+          - "auto" to convert numpy arrays and pandas series of numbers,
+            including multidimensional arrays
+          - "always" to also convert lists of numbers, and datetime arrays
+            as milliseconds since the epoch
+          - "never" to not convert any array
+
+    Returns
+    -------
+    dict
+        A figure dict that shares all values but converted arrays with
+        fig_dict, which is not modified
+    """
+    if binary not in _binary_modes:
+        raise ValueError(
+            "Invalid binary mode {binary}, must be one of {modes}".format(
+                binary=repr(binary), modes=_binary_modes
+            )
         )
-        return _safe(orjson.dumps(cleaned, option=opts).decode("utf8"), _swap_orjson)
+    if binary == "never":
+        return fig_dict
+    return _encode(fig_dict, "object", "figure", binary == "always")
 
 
-def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
+def to_json(
+    fig, validate=True, pretty=False, remove_uids=True, engine=None, binary="auto"
+):
     """
     Convert a figure to a JSON string representation
 
@@ -199,6 +520,19 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
 
+    binary: str (default "auto")
+        How arrays are encoded. One of:
+          - "auto" to encode numpy arrays and pandas series of numbers
+            (including multidimensional arrays) as base64 typed arrays
+          - "always" to also encode lists of numbers, and datetime arrays as
+            numbers of milliseconds since the epoch. Axes displaying such
+            dates must then have type='date'
+          - "never" to write all arrays as JSON lists
+        Only the properties that plotly.js accepts typed arrays for (data
+        arrays and array_ok properties) are encoded, in data, layout and
+        frames alike. With "auto", the arrays of a figure dict are not
+        encoded when validate is False.
+
     Returns
     -------
     str
@@ -208,20 +542,174 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
     --------
     to_json_plotly : Convert an arbitrary plotly graph_object or Dash component to JSON
     """
-    # Validate figure
-    # ---------------
-    fig_dict = validate_coerce_fig_to_dict(fig, validate)
+    fig_dict = _fig_to_json_dict(fig, validate=validate, remove_uids=remove_uids)
+    fig_dict = encode_typed_arrays(fig_dict, _resolve_binary(fig, validate, binary))
+
+    return to_json_plotly(fig_dict, pretty=pretty, engine=engine)
+
+
+def _resolve_binary(fig, validate, binary):
+    """
+    Return the binary mode to serialize fig with. Figure dicts that are not
+    validated are written as they are, so "auto" doesn't encode their arrays.
+    """
+    from plotly.basedatatypes import BaseFigure
+
+    if binary == "auto" and not validate and not isinstance(fig, BaseFigure):
+        return "never"
+    return binary
+
+
+def _fig_to_json_dict(fig, validate=True, remove_uids=True):
+    """
+    Return the data, layout and frames of a figure as a dict to be serialized
+
+    The dict shares its property values with the figure rather than holding
+    a deep copy of them, so it must not be modified. Figures of subclasses
+    that override to_dict are converted with their to_dict method.
+    """
+    from plotly.basedatatypes import BaseFigure
+
+    if isinstance(fig, dict) and validate:
+        # This will raise an exception if fig is not a valid plotly figure
+        fig = go.Figure(fig)
+
+    if isinstance(fig, BaseFigure) and type(fig).to_dict is BaseFigure.to_dict:
+        fig_dict = {"data": fig._data, "layout": fig._layout}
+        frames = [frame._props for frame in fig._frame_objs]
+        if frames:
+            fig_dict["frames"] = frames
+    else:
+        fig_dict = validate_coerce_fig_to_dict(fig, validate)
 
     # Remove trace uid
     # ----------------
-    if remove_uids:
-        for trace in fig_dict.get("data", []):
-            trace.pop("uid", None)
+    if remove_uids and fig_dict.get("data"):
+        fig_dict = dict(
+            fig_dict,
+            data=[
+                {k: v for k, v in trace.items() if k != "uid"}
+                for trace in fig_dict["data"]
+            ],
+        )
 
-    return to_json_plotly(fig_dict, pretty=pretty, engine=engine)
+    return fig_dict
 
 
-def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=None):
+def _iter_json_chunks(obj, engine, kind="value", path=None, always=False):
+    """
+    Generate the compact JSON representation of obj as a sequence of strings
+
+    Dicts, and lists containing dicts or lists, are walked recursively and
+    every other value is serialized on its own with to_json_plotly. The
+    largest string held in memory is therefore the representation of the
+    largest single value (e.g. one data array) rather than of the whole
+    object.
+
+    Parameters
+    ----------
+    obj:
+        A JSON-compatible object
+
+    engine: str
+        The JSON encoding engine to use, "json" or "orjson"
+
+    kind, path: str
+        The kind and schema path of obj (see _prop_kind), used to convert
+        arrays to the plotly.js typed array spec as encode_typed_arrays does.
+        Nothing is converted for the default "value" kind.
+
+    always: bool (default False)
+        True to convert arrays as encode_typed_arrays does with
+        binary="always"
+
+    Returns
+    -------
+    generator of str
+    """
+    if kind == "array":
+        obj = _encode_array(obj, always)
+        kind = "value"
+    elif kind == "any":
+        obj = _encode_array(obj, False)
+        kind = "value"
+    elif kind is None:
+        obj = _encode_unknown(obj)
+        kind = "value"
+
+    if isinstance(obj, dict) and all(isinstance(k, str) for k in obj):
+        yield "{"
+        sep = ""
+        for key, val in obj.items():
+            yield sep + to_json_plotly(key, engine=engine) + ":"
+            sep = ","
+            yield from _iter_json_chunks(
+                val, engine, *_child_kind(kind, path, key, val, always), always
+            )
+        yield "}"
+    elif isinstance(obj, (list, tuple)) and any(
+        isinstance(v, (dict, list, tuple)) for v in obj
+    ):
+        yield "["
+        sep = ""
+        for i, val in enumerate(obj):
+            yield sep
+            sep = ","
+            yield from _iter_json_chunks(
+                val, engine, *_child_kind(kind, path, i, val, always), always
+            )
+        yield "]"
+    else:
+        yield to_json_plotly(obj, engine=engine)
+
+
+def _iter_fig_json_chunks(
+    fig, validate=True, remove_uids=True, engine=None, binary="auto"
+):
+    """
+    Generate the compact JSON representation of a figure as a sequence of
+    strings, without building a copy of the whole figure in memory.
+
+    The concatenated output is identical to that of to_json with
+    pretty=False.
+    """
+    # Determine json engine once for all chunks
+    if engine is None:
+        engine = config.default_engine
+
+    if engine == "auto":
+        engine = "orjson" if get_module("orjson", should_load=True) else "json"
+    elif engine not in ["orjson", "json"]:
+        raise ValueError("Invalid json engine: %s" % engine)
+
+    if binary not in _binary_modes:
+        raise ValueError(
+            "Invalid binary mode {binary}, must be one of {modes}".format(
+                binary=repr(binary), modes=_binary_modes
+            )
+        )
+
+    fig_dict = _fig_to_json_dict(fig, validate=validate, remove_uids=remove_uids)
+
+    # Arrays are converted as they are written
+    if _resolve_binary(fig, validate, binary) == "never":
+        return _iter_json_chunks(fig_dict, engine)
+    else:
+        return _iter_json_chunks(
+            fig_dict, engine, "object", "figure", always=binary == "always"
+        )
+
+
+def write_json(
+    fig,
+    file,
+    validate=True,
+    pretty=False,
+    remove_uids=True,
+    engine=None,
+    stream=False,
+    binary="auto",
+):
     """
     Convert a figure to JSON and write it to a file or writeable
     object
@@ -249,6 +737,28 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=
           - "auto" for the "orjson" engine if available, otherwise "json"
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
+
+    stream: bool (default False)
+        True if the JSON representation should be written incrementally,
+        one property value (e.g. one data array) at a time, rather than
+        being built as a single string first. This bounds memory usage for
+        figures with very large arrays. To write compressed output, pass a
+        file object opened with gzip.open(path, "wt").
+        Not supported together with pretty=True.
+
+    binary: str (default "auto")
+        How arrays are encoded. One of:
+          - "auto" to encode numpy arrays and pandas series of numbers
+            (including multidimensional arrays) as base64 typed arrays
+          - "always" to also encode lists of numbers, and datetime arrays as
+            numbers of milliseconds since the epoch. Axes displaying such
+            dates must then have type='date'
+          - "never" to write all arrays as JSON lists
+        Only the properties that plotly.js accepts typed arrays for (data
+        arrays and array_ok properties) are encoded, in data, layout and
+        frames alike. With "auto", the arrays of a figure dict are not
+        encoded when validate is False.
+
     Returns
     -------
     None
@@ -256,10 +766,27 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=
 
     # Get JSON string
     # ---------------
-    # Pass through validate argument and let to_json handle validation logic
-    json_str = to_json(
-        fig, validate=validate, pretty=pretty, remove_uids=remove_uids, engine=engine
-    )
+    if stream:
+        if pretty:
+            raise ValueError("The pretty option is not supported when stream=True")
+
+        chunks = _iter_fig_json_chunks(
+            fig,
+            validate=validate,
+            remove_uids=remove_uids,
+            engine=engine,
+            binary=binary,
+        )
+    else:
+        # Pass through validate argument and let to_json handle validation logic
+        json_str = to_json(
+            fig,
+            validate=validate,
+            pretty=pretty,
+            remove_uids=remove_uids,
+            engine=engine,
+            binary=binary,
+        )
 
     # Try to cast `file` as a pathlib object `path`.
     # ----------------------------------------------
@@ -279,11 +806,13 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=
     if path is None:
         # We previously failed to make sense of `file` as a pathlib object.
         # Attempt to write to `file` as an open file descriptor.
-        try:
-            file.write(json_str)
+        if hasattr(file, "write"):
+            if stream:
+                for chunk in chunks:
+                    file.write(chunk)
+            else:
+                file.write(json_str)
             return
-        except AttributeError:
-            pass
         raise ValueError(
             """
 The 'file' argument '{file}' is not a string, pathlib.Path object, or file descriptor.
@@ -291,6 +820,10 @@ The 'file' argument '{file}' is not a string, pathlib.Path object, or file descr
                 file=file
             )
         )
+    elif stream:
+        with path.open("w") as f:
+            for chunk in chunks:
+                f.write(chunk)
     else:
         # We previously succeeded in interpreting `file` as a pathlib object.
         # Now we can use `write_bytes()`.
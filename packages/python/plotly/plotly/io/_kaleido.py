@@ -1,8 +1,15 @@
+import functools
 import os
 import json
+import queue
+import threading
+import time
+from collections import namedtuple
 from pathlib import Path
 import plotly
 from plotly.io._utils import validate_coerce_fig_to_dict
+from plotly.io._image_cache import image_cache
+from _plotly_utils.optional_imports import get_module
 
 try:
     from kaleido.scopes.plotly import PlotlyScope
@@ -22,6 +29,49 @@ except ImportError:
     scope = None
 
 
+def _resolve_engine(engine):
+    """
+    Resolve the image export engine argument to "kaleido" or "orca", raising
+    an informative error if it is invalid or if Kaleido is not installed
+    """
+    if engine == "auto":
+        if scope is not None:
+            # Default to kaleido if available
+            engine = "kaleido"
+        else:
+            # See if orca is available
+            from ._orca import validate_executable
+
+            try:
+                validate_executable()
+                engine = "orca"
+            except:
+                # If orca not configured properly, make sure we display the error
+                # message advising the installation of kaleido
+                engine = "kaleido"
+
+    if engine == "orca":
+        return engine
+    elif engine != "kaleido":
+        raise ValueError(
+            "Invalid image export engine specified: {engine}".format(
+                engine=repr(engine)
+            )
+        )
+
+    # Raise informative error message if Kaleido is not installed
+    if scope is None:
+        raise ValueError(
+            """
+Image export using the "kaleido" engine requires the kaleido package,
+which can be installed using pip:
+    $ pip install -U kaleido
+"""
+        )
+
+    return engine
+
+
 def to_image(
     fig, format=None, width=None, height=None, scale=None, validate=True, engine="auto"
 ):
@@ -89,64 +139,83 @@ def to_image(
     -------
     bytes
         The image data
+
+    See Also
+    --------
+    plotly.io.image_cache : On-disk cache of exported images, enabled by
+        setting its `directory` property
     """
     # Handle engine
     # -------------
-    if engine == "auto":
-        if scope is not None:
-            # Default to kaleido if available
-            engine = "kaleido"
-        else:
-            # See if orca is available
-            from ._orca import validate_executable
+    engine = _resolve_engine(engine)
 
-            try:
-                validate_executable()
-                engine = "orca"
-            except:
-                # If orca not configured properly, make sure we display the error
-                # message advising the installation of kaleido
-                engine = "kaleido"
+    # Validate figure
+    # ---------------
+    fig_dict = validate_coerce_fig_to_dict(fig, validate)
+
+    # Check image cache
+    # -----------------
+    cache_key = None
+    if image_cache.directory is not None:
+        # Export with the options the key is computed from, so that the cached
+        # image doesn't depend on the engine defaults at the time of the export
+        format, width, height, scale = _resolve_image_options(
+            engine, format, width, height, scale
+        )
+        cache_key = _image_cache_key(fig_dict, engine, format, width, height, scale)
+        img_bytes = image_cache.get(cache_key)
+        if img_bytes is not None:
+            return img_bytes
 
     if engine == "orca":
         # Fall back to legacy orca image export path
         from ._orca import to_image as to_image_orca
 
-        return to_image_orca(
-            fig,
+        img_bytes = to_image_orca(
+            fig_dict,
             format=format,
             width=width,
             height=height,
             scale=scale,
-            validate=validate,
+            validate=False,
         )
-    elif engine != "kaleido":
-        raise ValueError(
-            "Invalid image export engine specified: {engine}".format(
-                engine=repr(engine)
-            )
+    else:
+        img_bytes = scope.transform(
+            fig_dict, format=format, width=width, height=height, scale=scale
         )
 
-    # Raise informative error message if Kaleido is not installed
-    if scope is None:
-        raise ValueError(
-            """
-Image export using the "kaleido" engine requires the kaleido package,
-which can be installed using pip:
-    $ pip install -U kaleido
-"""
-        )
-
-    # Validate figure
-    # ---------------
-    fig_dict = validate_coerce_fig_to_dict(fig, validate)
-    img_bytes = scope.transform(
-        fig_dict, format=format, width=width, height=height, scale=scale
-    )
+    if cache_key is not None:
+        image_cache.put(cache_key, img_bytes)
 
     return img_bytes
 
 
+def _image_cache_key(fig_dict, engine, format, width, height, scale):
+    """
+    Compute the image cache key of a figure from the export options passed to
+    the engine, see _resolve_image_options
+    """
+    if engine == "orca":
+        from ._orca import status, validate_executable
+
+        validate_executable()
+        engine_version = status.version
+    else:
+        kaleido = get_module("kaleido")
+        engine_version = getattr(kaleido, "__version__", None)
+
+    return image_cache.make_key(
+        fig_dict,
+        format=format,
+        width=width,
+        height=height,
+        scale=scale,
+        engine=engine,
+        engine_version=engine_version,
+        plotly_version=plotly.__version__,
+    )
+
+
 def write_image(
     fig,
     file,
@@ -227,6 +296,34 @@ def write_image(
     -------
     None
     """
+    path, format = _resolve_file_format(file, format)
+
+    # Request image
+    # -------------
+    # Do this first so we don't create a file if image conversion fails
+    img_data = to_image(
+        fig,
+        format=format,
+        scale=scale,
+        width=width,
+        height=height,
+        validate=validate,
+        engine=engine,
+    )
+
+    _write_image_data(file, path, img_data)
+
+
+def _resolve_file_format(file, format):
+    """
+    Interpret the `file` argument of write_image as a pathlib object, and infer
+    the image format from its extension if `format` is not specified
+
+    Returns
+    -------
+    tuple of (pathlib.Path or None, str or None)
+        The path (None if `file` is not a str or pathlib.Path) and the format
+    """
     # Try to cast `file` as a pathlib object `path`.
     # ----------------------------------------------
     if isinstance(file, str):
@@ -260,19 +357,14 @@ For example:
                 )
             )
 
-    # Request image
-    # -------------
-    # Do this first so we don't create a file if image conversion fails
-    img_data = to_image(
-        fig,
-        format=format,
-        scale=scale,
-        width=width,
-        height=height,
-        validate=validate,
-        engine=engine,
-    )
+    return path, format
 
+
+def _write_image_data(file, path, img_data):
+    """
+    Write image bytes to the `file` argument of write_image, using `path` if
+    `file` could be interpreted as a pathlib object
+    """
     # Open file
     # ---------
     if path is None:
@@ -296,6 +388,252 @@ The 'file' argument '{file}' is not a string, pathlib.Path object, or file descr
         path.write_bytes(img_data)
 
 
+ImageExportResult = namedtuple("ImageExportResult", ("file", "latency", "error"))
+
+# Default number of write_images workers. Each worker drives its own
+# Chromium renderer process, so this is kept small.
+_default_n_workers = 4
+
+# Kaleido scopes used by write_images workers in addition to the global scope.
+# Up to _default_n_workers - 1 scopes are kept between batches so that their
+# renderer processes stay warm.
+_worker_scopes = []
+_worker_scopes_lock = threading.Lock()
+
+
+def _get_worker_scopes(n_workers):
+    """
+    Return one Kaleido scope per worker, the first being the global scope.
+    Additional scopes take the plotly.js, MathJax, topojson and mapbox
+    configuration of the global scope. The export defaults of the global
+    scope are resolved by write_images before dispatching figures, so they
+    are not copied.
+
+    The scopes of the first _default_n_workers workers are kept between
+    calls, the scopes of the following workers are created for this batch
+    only and must be shut down with _shutdown_batch_scopes.
+    """
+    n_kept = min(n_workers, _default_n_workers) - 1
+    with _worker_scopes_lock:
+        while len(_worker_scopes) < n_kept:
+            _worker_scopes.append(PlotlyScope())
+        worker_scopes = [scope] + _worker_scopes[:n_kept]
+    worker_scopes += [PlotlyScope() for _ in range(n_workers - 1 - n_kept)]
+
+    for worker_scope in worker_scopes[1:]:
+        for prop in ("plotlyjs", "mathjax", "topojson", "mapbox_access_token"):
+            # Setting these restarts the renderer, so only do it on change
+            value = getattr(scope, prop)
+            if getattr(worker_scope, prop) != value:
+                setattr(worker_scope, prop, value)
+
+    return worker_scopes
+
+
+def _shutdown_batch_scopes(worker_scopes):
+    """
+    Stop the renderer processes of the scopes returned by _get_worker_scopes
+    that are not kept between calls
+    """
+    for worker_scope in worker_scopes[_default_n_workers:]:
+        worker_scope._shutdown_kaleido()
+
+
+def _resolve_image_options(engine, format, width, height, scale):
+    """
+    Resolve the image export options left unspecified to the defaults of the
+    engine (`plotly.io.kaleido.scope` or `plotly.io.orca.config`)
+
+    Returns
+    -------
+    tuple of (format, width, height, scale)
+    """
+    if engine == "orca":
+        from ._orca import config as defaults
+    else:
+        defaults = scope
+
+    return (
+        format if format is not None else defaults.default_format,
+        width if width is not None else defaults.default_width,
+        height if height is not None else defaults.default_height,
+        scale if scale is not None else defaults.default_scale,
+    )
+
+
+def write_images(
+    figs,
+    files,
+    format=None,
+    scale=None,
+    width=None,
+    height=None,
+    validate=True,
+    engine="auto",
+    n_workers=None,
+):
+    """
+    Convert a sequence of figures to static images and write them to files or
+    writeable objects
+
+    Images are rendered by `n_workers` threads, each driving its own Kaleido
+    renderer process, while the calling thread validates and encodes the
+    following figures. The renderers of up to four workers are kept alive
+    between calls, those of additional workers are stopped at the end of the
+    call. Like `to_image`, this uses `plotly.io.image_cache` when
+    it is enabled. A figure that fails to export does not interrupt the
+    batch, the error is reported in the returned results instead.
+
+    Parameters
+    ----------
+    figs: iterable
+        Figure objects or dicts representing figures
+
+    files: iterable
+        The destination of each figure: a string representing a local file
+        path or a writeable object (e.g. a pathlib.Path object or an open
+        file descriptor). Must have the same length as `figs`.
+
+    format: str or None
+        The desired image format, see `write_image`. If not specified, the
+        format of each image is inferred from its file extension.
+
+    width: int or None
+        The width of the exported images in layout pixels, see `write_image`.
+
+    height: int or None
+        The height of the exported images in layout pixels, see `write_image`.
+
+    scale: int or float or None
+        The scale factor to use when exporting the figures, see `write_image`.
+
+    validate: bool
+        True if the figures should be validated before being converted to
+        images, False otherwise.
+
+    engine: str
+        Image export engine to use:
+         - "kaleido": Use Kaleido for image export
+         - "orca": Use Orca for image export, one figure at a time
+         - "auto" (default): Use Kaleido if installed, otherwise use orca
+
+    n_workers: int or None
+        Number of figures to render in parallel. If not specified, defaults
+        to 4, or the number of CPUs if lower. Capped by the number of figures.
+
+    Returns
+    -------
+    list of ImageExportResult
+        One (file, latency, error) named tuple per figure, in input order.
+        `latency` is the time in seconds spent validating, encoding, rendering
+        and writing the figure, and `error` is the exception raised while
+        exporting it, or None on success.
+    """
+    figs = list(figs)
+    files = list(files)
+    if len(figs) != len(files):
+        raise ValueError(
+            "The figs and files arguments must have the same length.\n"
+            "    Received {n_figs} figures and {n_files} files".format(
+                n_figs=len(figs), n_files=len(files)
+            )
+        )
+
+    engine = _resolve_engine(engine)
+    if engine == "orca":
+        # Orca exports through a single server process
+        from ._orca import to_image as to_image_orca
+
+        worker_scopes = []
+        renderers = [functools.partial(to_image_orca, validate=False)]
+    else:
+        if n_workers is None:
+            n_workers = min(_default_n_workers, os.cpu_count() or 1)
+        n_workers = max(1, min(n_workers, len(figs)))
+        worker_scopes = _get_worker_scopes(n_workers)
+        renderers = [s.transform for s in worker_scopes]
+
+    results = [None] * len(figs)
+
+    # Keep enough validated figures queued that no worker waits for the next
+    # one, without holding the whole batch in memory
+    jobs = queue.Queue(maxsize=2 * len(renderers))
+
+    def work(render):
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            i, file, path, options, fig_dict, cache_key, elapsed = job
+            start = time.perf_counter()
+            try:
+                fig_format, fig_width, fig_height, fig_scale = options
+                img_data = render(
+                    fig_dict,
+                    format=fig_format,
+                    width=fig_width,
+                    height=fig_height,
+                    scale=fig_scale,
+                )
+                if cache_key is not None:
+                    image_cache.put(cache_key, img_data)
+                _write_image_data(file, path, img_data)
+                error = None
+            except Exception as e:
+                error = e
+            elapsed += time.perf_counter() - start
+            results[i] = ImageExportResult(file, elapsed, error)
+
+    workers = [threading.Thread(target=work, args=(r,), daemon=True) for r in renderers]
+    for worker in workers:
+        worker.start()
+
+    try:
+        for i, (fig, file) in enumerate(zip(figs, files)):
+            start = time.perf_counter()
+            try:
+                path, fig_format = _resolve_file_format(file, format)
+                # Resolve the defaults here rather than in each renderer, so
+                # that all workers export with the options of the global scope
+                options = _resolve_image_options(
+                    engine, fig_format, width, height, scale
+                )
+                fig_dict = validate_coerce_fig_to_dict(fig, validate)
+
+                cache_key = None
+                if image_cache.directory is not None:
+                    cache_key = _image_cache_key(fig_dict, engine, *options)
+                    img_data = image_cache.get(cache_key)
+                    if img_data is not None:
+                        _write_image_data(file, path, img_data)
+                        results[i] = ImageExportResult(
+                            file, time.perf_counter() - start, None
+                        )
+                        continue
+            except Exception as e:
+                results[i] = ImageExportResult(file, time.perf_counter() - start, e)
+                continue
+            jobs.put(
+                (
+                    i,
+                    file,
+                    path,
+                    options,
+                    fig_dict,
+                    cache_key,
+                    time.perf_counter() - start,
+                )
+            )
+    finally:
+        for _ in workers:
+            jobs.put(None)
+        for worker in workers:
+            worker.join()
+        _shutdown_batch_scopes(worker_scopes)
+
+    return results
+
+
 def full_figure_for_development(fig, warn=True, as_dict=False):
     """
     Compute default values for all attributes not specified in the input figure and
@@ -350,4 +688,10 @@ which can be installed using pip:
         return go.Figure(fig, skip_invalid=True)
 
 
-__all__ = ["to_image", "write_image", "scope", "full_figure_for_development"]
+__all__ = [
+    "to_image",
+    "write_image",
+    "write_images",
+    "scope",
+    "full_figure_for_development",
+]
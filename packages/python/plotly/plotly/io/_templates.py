@@ -50,6 +50,10 @@ class TemplatesConfig(object):
         self._validator = None
         self._default = None
 
+        # Merged templates and snapshots of the properties of the templates
+        # they were merged from, keyed on the tuple of their template names
+        self._merged_templates = {}
+
     # ### Magic methods ###
     # Make this act as a dict of templates
     def __len__(self):
@@ -63,45 +67,88 @@ class TemplatesConfig(object):
 
     def __getitem__(self, item):
         if isinstance(item, str):
-            template_names = item.split("+")
+            template_names = tuple(item.split("+"))
         else:
-            template_names = [item]
-
-        templates = []
-        for template_name in template_names:
-            template = self._templates[template_name]
-            if template is Lazy:
-                from plotly.graph_objs.layout import Template
-
-                if template_name == "none":
-                    # "none" is a special built-in named template that applied no defaults
-                    template = Template(data_scatter=[{}])
-                    self._templates[template_name] = template
-                else:
-                    # Load template from package data
-                    path = os.path.join(
-                        "package_data", "templates", template_name + ".json"
-                    )
-                    template_str = pkgutil.get_data("plotly", path).decode("utf-8")
-                    template_dict = json.loads(template_str)
-                    template = Template(template_dict, _validate=False)
+            template_names = (item,)
 
-                    self._templates[template_name] = template
-            templates.append(self._templates[template_name])
+        if len(template_names) == 1:
+            return self._get_template(template_names[0])
 
-        return self.merge_templates(*templates)
+        from plotly.graph_objs.layout import Template
+
+        # Return a copy so that modifying the result doesn't change the
+        # template returned by later lookups
+        template = Template(self._get_merged_template(template_names), _validate=False)
+        template._validate = True
+        return template
+
+    def _get_merged_template(self, template_names):
+        """
+        Return the merge of the templates named in template_names
+
+        Merging is expensive, so merged templates are computed once and
+        shared, and must not be modified by the caller. A merged template is
+        computed again when one of its templates is replaced, removed or
+        modified in place.
+        """
+        from plotly.basedatatypes import BasePlotlyType
+
+        templates = [self._get_template(name) for name in template_names]
+
+        cached = self._merged_templates.get(template_names, None)
+        if cached is not None:
+            snapshots, merged = cached
+            if all(
+                BasePlotlyType._vals_equal(template._props, snapshot)
+                for template, snapshot in zip(templates, snapshots)
+            ):
+                return merged
+
+        merged = self.merge_templates(*templates)
+        snapshots = [copy.deepcopy(template._props) for template in templates]
+        self._merged_templates[template_names] = (snapshots, merged)
+        return merged
+
+    def _get_template(self, template_name):
+        template = self._templates[template_name]
+        if template is Lazy:
+            from plotly.graph_objs.layout import Template
+
+            if template_name == "none":
+                # "none" is a special built-in named template that applied no defaults
+                template = Template(data_scatter=[{}])
+                self._templates[template_name] = template
+            else:
+                # Load template from package data
+                path = os.path.join(
+                    "package_data", "templates", template_name + ".json"
+                )
+                template_str = pkgutil.get_data("plotly", path).decode("utf-8")
+                template_dict = json.loads(template_str)
+                template = Template(template_dict, _validate=False)
+
+                self._templates[template_name] = template
+
+        return template
 
     def __setitem__(self, key, value):
         self._templates[key] = self._validate(value)
+        self._clear_merged_templates(key)
 
     def __delitem__(self, key):
         # Remove template
         del self._templates[key]
+        self._clear_merged_templates(key)
 
         # Check if we need to remove it as the default
         if self._default == key:
             self._default = None
 
+    def _clear_merged_templates(self, template_name):
+        for template_names in list(self._merged_templates):
+            if template_name in template_names:
+                del self._merged_templates[template_names]
+
     def _validate(self, value):
         if not self._validator:
             from plotly.validators.layout import TemplateValidator
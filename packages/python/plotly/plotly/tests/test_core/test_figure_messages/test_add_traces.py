@@ -1,4 +1,6 @@
 import sys
+
+import pytest
 from unittest import TestCase
 
 import plotly.graph_objs as go
@@ -133,3 +135,92 @@ def test_add_trace_no_exclude_totally_empty_subplots():
     assert fig.data[3]["xaxis"] == "x2" and fig.data[3]["yaxis"] == "y2"
     assert fig.data[4]["xaxis"] == "x3" and fig.data[4]["yaxis"] == "y3"
     assert fig.data[5]["xaxis"] == "x4" and fig.data[5]["yaxis"] == "y4"
+
+
+def test_add_traces_validate_modes_equivalent():
+    traces = [
+        dict(type="scatter", y=[1, 2], marker_color="red", name="a"),
+        go.Bar(y=[3, 1], marker={"opacity": 0.5}),
+        dict(type="pie", values=[1, 2]),
+    ]
+    expected = make_subplots(1, 2, specs=[[{}, {"type": "domain"}]])
+    expected.add_traces(traces, rows=[1, 1, 1], cols=[1, 1, 2])
+
+    for validate in [False, "schema"]:
+        fig = make_subplots(1, 2, specs=[[{}, {"type": "domain"}]])
+        fig.add_traces(traces, rows=[1, 1, 1], cols=[1, 1, 2], validate=validate)
+        assert fig.to_dict() == expected.to_dict()
+        assert fig.data[0].marker.color == "red"
+        assert fig.data[2].domain.x == (0.55, 1.0)
+
+
+def test_add_traces_without_validation_copies_input():
+    y = [1, 2, 3]
+    fig = go.Figure()
+    fig.add_traces([dict(y=y)], validate=False)
+    y.append(4)
+
+    assert fig.data[0].y == (1, 2, 3)
+
+
+def test_add_traces_schema_validation():
+    fig = go.Figure()
+    fig.add_traces([dict(y=["a", 2], marker=dict(size="big"))], validate="schema")
+    assert fig.data[0].marker.size == "big"
+
+    with pytest.raises(ValueError, match=r"'marker\.bogus', 'bogus'"):
+        fig.add_traces(
+            [dict(y=[1, 2], marker=dict(bogus=1), bogus=2)], validate="schema"
+        )
+
+    with pytest.raises(ValueError, match=r"'dimensions\[0\]\.bogus'"):
+        go.Figure().add_traces(
+            [dict(type="splom", dimensions=[dict(bogus=1)])], validate="schema"
+        )
+
+    # Names that are only special-cased by the JSON encoder are not accepted
+    traces = [dict(type="scatter", range=[1, 2], geojson=3, marker=dict(layer=1))]
+    with pytest.raises(ValueError, match=r"'range', 'geojson', 'marker\.layer'"):
+        go.Figure().add_traces(traces, validate="schema")
+    with pytest.raises(ValueError):
+        go.Figure().add_traces(traces, validate=True)
+
+
+def test_add_traces_without_validation_validates_later_updates():
+    for validate in [False, "schema"]:
+        fig = go.Figure()
+        fig.add_traces([dict(y=[1, 2])], validate=validate)
+
+        with pytest.raises(ValueError):
+            fig.data[0].update(opacity=5)
+        with pytest.raises(ValueError):
+            fig.data[0]["marker.color"] = "nope"
+        with pytest.raises(ValueError):
+            fig.update_traces(marker_color="notacolor")
+
+        fig = go.Figure.from_traces([dict(type="bar", y=[1])], validate=validate)
+        with pytest.raises(ValueError):
+            fig.data[0].opacity = 5
+
+
+def test_add_traces_invalid_validate_argument():
+    with pytest.raises(ValueError, match="validate"):
+        go.Figure().add_traces([dict(y=[1])], validate="no")
+
+
+def test_add_traces_incompatible_subplot():
+    fig = make_subplots(1, 2, specs=[[{}, {"type": "domain"}]])
+    with pytest.raises(ValueError, match="not compatible with subplot type"):
+        fig.add_traces([dict(y=[1]), dict(y=[2])], rows=1, cols=[1, 2])
+
+
+def test_from_traces():
+    traces = [dict(type="scatter", y=[i, i + 1]) for i in range(10)]
+    for validate in [True, False, "schema"]:
+        fig = go.Figure.from_traces(
+            traces, layout=dict(title_text="many"), validate=validate
+        )
+        assert isinstance(fig, go.Figure)
+        assert len(fig.data) == 10
+        assert fig.data[9].y == (9, 10)
+        assert fig.layout.title.text == "many"
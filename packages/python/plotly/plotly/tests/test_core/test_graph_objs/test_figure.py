@@ -217,3 +217,29 @@ def test_set_subplots():
     # Test that calling on a figure that already has subplots throws an error.
     with pytest.raises(ValueError, match=r"^This figure already has subplots\.$"):
         fig1.set_subplots(2, 3)
+
+
+def test_key_path_cache():
+    from plotly.basedatatypes import BaseFigure, _str_to_dict_path_full
+
+    path = BaseFigure._str_to_dict_path("marker.line_color[3]")
+    assert path == ("marker", "line", "color", 3)
+
+    hits = _str_to_dict_path_full.cache_info().hits
+    assert BaseFigure._str_to_dict_path("marker.line_color[3]") is path
+    assert _str_to_dict_path_full.cache_info().hits == hits + 1
+
+
+def test_nested_path_access():
+    fig = go.Figure(go.Scatter(marker_line_color="red"))
+
+    assert fig["data[0].marker.line.color"] == "red"
+    assert fig.data[0]["marker.line.color"] == "red"
+    assert "marker.line.color" in fig.data[0]
+    assert "marker.line.bogus" not in fig.data[0]
+
+    fig["data[0].marker.line.color"] = "blue"
+    assert fig.data[0].marker.line.color == "blue"
+
+    fig.plotly_restyle({"marker.line.color": "green"}, trace_indexes=0)
+    assert fig.data[0].marker.line.color == "green"
@@ -142,6 +142,15 @@ class TemplateTest(TestCase):
         fig.layout.template = "test_template"
         self.assertEqual(fig.layout.template, pio.templates["test_template"])
 
+    def test_template_as_name_validates_edits(self):
+        fig = go.Figure(layout_template="test_template")
+        with pytest.raises(ValueError):
+            fig.layout.template.layout = {"bogus": 1}
+
+        fig.layout.template = "test_template"
+        with pytest.raises(ValueError):
+            fig.layout.template.layout = {"bogus": 1}
+
     def test_template_default(self):
         pio.templates.default = "test_template"
         fig = go.Figure()
@@ -537,3 +546,59 @@ class TestMergeTemplates(TestCase):
             pio.templates["plotly"].to_plotly_json(),
         )
         pio.templates.default = orig_default
+
+    def test_flaglist_string_getitem_cached(self):
+        merged = pio.templates._get_merged_template(("template1", "template2"))
+        self.assertIs(
+            pio.templates._get_merged_template(("template1", "template2")), merged
+        )
+        self.assertIsNot(
+            pio.templates._get_merged_template(("template2", "template1")), merged
+        )
+
+    def test_flaglist_string_getitem_returns_copy(self):
+        result = pio.templates["template1+template2"]
+        self.assertEqual(result, self.expected1_2)
+        result.layout.font.size = 30
+
+        self.assertIsNot(pio.templates["template1+template2"], result)
+        self.assertEqual(pio.templates["template1+template2"], self.expected1_2)
+
+    def test_modify_template_in_place_clears_cached_merge(self):
+        pio.templates["template1+template2"]
+        pio.templates["template2"].layout.paper_bgcolor = "red"
+        pio.templates["template1"].data.scatter[0].line.dash = "dash"
+
+        merged = pio.templates["template1+template2"]
+        self.assertEqual(merged.layout.paper_bgcolor, "red")
+        self.assertEqual(merged.data.scatter[0].line.dash, "dash")
+
+    def test_flaglist_assignment_copies_cached_template(self):
+        fig = go.Figure(layout_template="template1+template2")
+        fig.layout.template.layout.font.size = 30
+
+        self.assertEqual(pio.templates["template1+template2"], self.expected1_2)
+
+    def test_flaglist_assignment_validates_edits(self):
+        fig = go.Figure(layout_template="template1+template2")
+        with pytest.raises(ValueError):
+            fig.layout.template.layout = {"bogus": 1}
+
+        with pytest.raises(ValueError):
+            pio.templates["template1+template2"].layout = {"bogus": 1}
+
+    def test_replace_template_clears_cached_merge(self):
+        result = pio.templates["template1+template2"]
+        pio.templates["template2"] = {"layout": {"paper_bgcolor": "red"}}
+
+        merged = pio.templates["template1+template2"]
+        self.assertIsNot(merged, result)
+        self.assertEqual(merged.layout.paper_bgcolor, "red")
+        self.assertEqual(merged.layout.font.family, "Rockwell")
+
+    def test_delete_template_clears_cached_merge(self):
+        pio.templates["template1+template2"]
+        del pio.templates["template2"]
+
+        with pytest.raises(KeyError):
+            pio.templates["template1+template2"]
@@ -1,11 +1,14 @@
-from unittest import skip
+from unittest import mock, skip
 
 import plotly.graph_objs as go
 from plotly.graph_objs import Data, Figure, Layout, Line, Scatter, scatter, XAxis
+from plotly.basedatatypes import BasePlotlyType
 from plotly.tests.utils import strip_dict_params
 
 from unittest import TestCase
 
+_set_prop = BasePlotlyType._set_prop
+
 
 class TestUpdateMethod(TestCase):
     def setUp(self):
@@ -204,3 +207,46 @@ class TestUpdateMethod(TestCase):
         # Remove all annotations
         layout.update(overwrite=True, annotations=None)
         self.assertEqual(layout.to_plotly_json(), {})
+
+    def test_update_skips_unchanged_values(self):
+        fig = go.Figure(
+            go.Scatter(y=[1, 2, 3], marker={"size": 3}),
+            layout={"xaxis": {"range": [0, 1], "title": {"text": "x"}}},
+        )
+        update = {"xaxis": {"range": (0, 1), "title": {"text": "x"}}, "width": 400}
+
+        with mock.patch.object(
+            BasePlotlyType, "_set_prop", autospec=True, side_effect=_set_prop
+        ) as set_prop:
+            fig.update_layout(update)
+            fig.update_traces(y=[1, 2, 3], marker={"size": 3})
+
+        self.assertEqual([c.args[1] for c in set_prop.call_args_list], ["width"])
+        self.assertEqual(fig.layout.width, 400)
+
+    def test_update_assigns_changed_nested_values(self):
+        fig = go.Figure(layout={"xaxis": {"range": [0, 1], "title": {"text": "x"}}})
+        fig.update_layout(xaxis={"range": [0, 1.5], "title": {"text": "x"}})
+
+        self.assertEqual(fig.layout.xaxis.range, (0, 1.5))
+        self.assertEqual(fig.layout.xaxis.title.text, "x")
+
+    def test_update_records_only_changed_paths(self):
+        fig = go.Figure(layout={"xaxis": {"range": [0, 1], "title": {"text": "x"}}})
+
+        with fig.batch_update():
+            fig.update_layout(xaxis={"range": [0, 1], "title": {"text": "y"}})
+            self.assertEqual(dict(fig._batch_layout_edits), {"xaxis.title.text": "y"})
+
+        self.assertEqual(fig.layout.xaxis.title.text, "y")
+
+    def test_update_unchanged_template_object(self):
+        template = go.layout.Template(layout={"font": {"size": 20}})
+        fig = go.Figure(layout={"template": template})
+        fig.update_layout(template=template)
+        self.assertEqual(fig.layout.template, template)
+
+        template.layout.font.size = 10
+        fig.update_layout(template=template)
+        self.assertEqual(fig.layout.font.size, None)
+        self.assertEqual(fig.layout.template.layout.font.size, 10)
@@ -1,3 +1,4 @@
+import io
 import sys
 
 import pytest
@@ -45,3 +46,35 @@ def test_html_deterministic(fig1):
     assert pio.to_html(fig1, include_plotlyjs="cdn", div_id=div_id) == pio.to_html(
         fig1, include_plotlyjs="cdn", div_id=div_id
     )
+
+
+def test_html_report_includes_plotlyjs_once(fig1):
+    buf = io.StringIO()
+    pio.write_html_report([fig1, fig1, fig1], buf, include_plotlyjs="cdn")
+    html = buf.getvalue()
+
+    assert html.count(plotly_cdn_url()) == 1
+    assert html.count('class="plotly-graph-div"') == 3
+    assert html.count("Plotly.newPlot") == 3
+    assert "PlotlyReport" not in html
+    assert html.endswith("</body>\n</html>")
+
+
+def test_html_report_lazy(fig1):
+    buf = io.StringIO()
+    pio.write_html_report([fig1, fig1], buf, include_plotlyjs="cdn", lazy=True)
+    html = buf.getvalue()
+
+    assert html.count("window.PlotlyReport = ") == 1
+    assert html.count("window.PlotlyReport.defer(") == 2
+
+
+def test_html_report_path(fig1, tmp_path):
+    path = tmp_path / "report.html"
+    with mock.patch("plotly.io._html.get_plotlyjs", return_value="plotlyjs"):
+        pio.write_html_report([fig1, fig1], str(path), include_plotlyjs="directory")
+
+    assert (tmp_path / "plotly.min.js").read_text() == "plotlyjs"
+    html = path.read_text(encoding="utf-8")
+    assert html.count('src="plotly.min.js"') == 1
+    assert html.count('class="plotly-graph-div"') == 2
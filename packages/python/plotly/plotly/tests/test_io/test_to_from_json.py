@@ -1,3 +1,5 @@
+import base64
+
 import plotly.graph_objs as go
 import plotly.io as pio
 import pytest
@@ -262,6 +264,57 @@ def test_write_json_from_file_string(fig1, pretty, remove_uids):
         assert result == expected
 
 
+@pytest.fixture
+def fig_arrays():
+    return go.Figure(
+        data=[
+            go.Scatter(x=np.arange(20), y=np.random.rand(20), text=["a", "b"] * 10),
+            go.Heatmap(z=np.random.rand(3, 4), customdata=np.arange(12).reshape(3, 4)),
+            go.Choropleth(
+                geojson={"type": "Feature", "coordinates": np.array([[1, 2], [3, 4]])},
+                locations=["a"],
+                z=np.array([1.5]),
+            ),
+        ],
+        layout={"title": "Figure title", "xaxis": {"range": np.array([0, 10])}},
+        frames=[{"data": [{"y": np.arange(3)}]}],
+    )
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+@pytest.mark.parametrize("remove_uids", [True, False])
+def test_write_json_stream_filelike(fig_arrays, engine, remove_uids):
+    filemock = MagicMock()
+    del filemock.write_text
+
+    pio.write_json(
+        fig_arrays, filemock, remove_uids=remove_uids, engine=engine, stream=True
+    )
+
+    # Contents are written in several chunks
+    assert filemock.write.call_count > 1
+    result = "".join(call.args[0] for call in filemock.write.call_args_list)
+    assert result == pio.to_json(fig_arrays, remove_uids=remove_uids, engine=engine)
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_write_json_stream_from_dict(fig1, validate):
+    dict1 = fig1.to_dict()
+    with tempfile.TemporaryDirectory() as dir_name:
+        path = os.path.join(dir_name, "fig1.json")
+        pio.write_json(dict1, path, validate=validate, stream=True)
+
+        with open(path, "r") as f:
+            result = f.read()
+
+    assert result == pio.to_json(dict1, validate=validate)
+
+
+def test_write_json_stream_pretty(fig1):
+    with pytest.raises(ValueError):
+        pio.write_json(fig1, MagicMock(), pretty=True, stream=True)
+
+
 def test_to_dict_empty_np_array_int64():
     fig = go.Figure(
         [
@@ -273,3 +326,139 @@ def test_to_dict_empty_np_array_int64():
     )
     # to_dict() should not raise an exception
     fig.to_dict()
+
+
+def test_to_json_binary_never(fig_arrays):
+    result = json.loads(pio.to_json(fig_arrays, binary="never"))
+
+    assert result["data"][0]["x"] == list(range(20))
+    assert result["data"][1]["customdata"] == np.arange(12).reshape(3, 4).tolist()
+    assert result["frames"][0]["data"][0]["y"] == [0, 1, 2]
+
+
+def test_to_json_binary_auto(fig_arrays):
+    result = json.loads(pio.to_json(fig_arrays))
+
+    assert result["data"][0]["x"]["dtype"] == "i1"
+    assert result["data"][1]["customdata"]["shape"] == "3, 4"
+    assert result["frames"][0]["data"][0]["y"]["dtype"] == "i1"
+    # Lists and properties that are not data arrays are left as is
+    assert result["data"][0]["text"] == ["a", "b"] * 10
+    assert result["data"][2]["geojson"]["coordinates"] == [[1, 2], [3, 4]]
+    assert result["layout"]["xaxis"]["range"] == [0, 10]
+
+
+def test_to_json_binary_always():
+    fig = go.Figure(
+        [
+            go.Scatter(
+                x=np.array(["2020-01-01", "NaT"], dtype="datetime64[ns]"),
+                y=[1, 2],
+                text=["a", "b"],
+            ),
+            go.Heatmap(z=[[1.5, 2.5], [3.5, 4.5]], xaxis="x2"),
+        ],
+        layout={
+            "xaxis": {"domain": [0, 0.5], "type": "date", "tickvals": [1, 2]},
+            "xaxis2": {"domain": [0.5, 1], "range": [0, 1]},
+        },
+    )
+    result = json.loads(pio.to_json(fig, binary="always"))
+
+    x = result["data"][0]["x"]
+    assert x["dtype"] == "f8"
+    decoded = np.frombuffer(base64.b64decode(x["bdata"]), dtype="f8")
+    assert decoded[0] == 1577836800000.0
+    assert np.isnan(decoded[1])
+    assert result["data"][0]["y"] == {"dtype": "i1", "bdata": "AQI="}
+    assert result["data"][0]["text"] == ["a", "b"]
+    assert result["data"][1]["z"]["shape"] == "2, 2"
+    assert result["layout"]["xaxis"]["tickvals"]["dtype"] == "i1"
+    # Info arrays are never encoded
+    assert result["layout"]["xaxis"]["domain"] == [0, 0.5]
+    assert result["layout"]["xaxis2"]["domain"] == [0.5, 1]
+    assert result["layout"]["xaxis2"]["range"] == [0, 1]
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_to_json_binary_auto_unvalidated_dict(stream):
+    fig_dict = {"data": [{"type": "scatter", "y": np.array([1.5, 2.5])}]}
+
+    # Arrays of figure dicts that are not validated are written as lists
+    filemock = MagicMock()
+    del filemock.write_text
+    pio.write_json(fig_dict, filemock, validate=False, stream=stream)
+    result = "".join(call.args[0] for call in filemock.write.call_args_list)
+    assert json.loads(result)["data"][0]["y"] == [1.5, 2.5]
+
+    result = json.loads(pio.to_json(fig_dict, validate=False, binary="always"))
+    assert result["data"][0]["y"]["dtype"] == "f8"
+    result = json.loads(pio.to_json(fig_dict))
+    assert result["data"][0]["y"]["dtype"] == "f8"
+
+
+def test_to_json_overridden_to_dict(tmp_path):
+    class MetaFigure(go.Figure):
+        def to_dict(self):
+            fig_dict = super().to_dict()
+            fig_dict["layout"]["meta"] = "exported"
+            return fig_dict
+
+    fig = MetaFigure(go.Scatter(y=np.arange(3)))
+    assert json.loads(pio.to_json(fig))["layout"]["meta"] == "exported"
+
+    path = tmp_path / "fig.json"
+    pio.write_json(fig, path)
+    assert json.loads(path.read_text())["layout"]["meta"] == "exported"
+    assert fig.layout.meta is None
+
+
+def test_to_json_binary_auto_template(monkeypatch):
+    import plotly.io._json as pio_json
+
+    prop_kind = pio_json._prop_kind
+    paths = []
+
+    def prop_kind_spy(path, key):
+        paths.append(path)
+        return prop_kind(path, key)
+
+    monkeypatch.setattr(pio_json, "_prop_kind", prop_kind_spy)
+
+    # Templates without arrays are not walked
+    fig = go.Figure(go.Scatter(y=np.arange(3)), layout_template="plotly")
+    result = json.loads(pio.to_json(fig))
+    assert result["data"][0]["y"]["dtype"] == "i1"
+    assert result["layout"]["template"] == pio.templates["plotly"].to_plotly_json()
+    assert "template" not in paths
+
+    fig.layout.template.layout.xaxis.tickvals = np.arange(3)
+    result = json.loads(pio.to_json(fig))
+    assert result["layout"]["template"]["layout"]["xaxis"]["tickvals"]["dtype"] == "i1"
+
+
+@pytest.mark.parametrize("binary", ["auto", "always", "never"])
+def test_write_json_stream_binary(fig_arrays, binary):
+    filemock = MagicMock()
+    del filemock.write_text
+
+    pio.write_json(fig_arrays, filemock, stream=True, binary=binary)
+
+    result = "".join(call.args[0] for call in filemock.write.call_args_list)
+    assert result == pio.to_json(fig_arrays, binary=binary)
+
+
+def test_to_json_binary_invalid(fig1):
+    with pytest.raises(ValueError):
+        pio.to_json(fig1, binary="yes")
+
+
+def test_to_json_downcast_large_int64():
+    x = np.arange(100000, dtype="int64") - 50000
+    result = json.loads(pio.to_json(go.Figure(go.Scatter(x=x))))
+    assert result["data"][0]["x"]["dtype"] == "i4"
+
+    # The extrema are found in every chunk of the array
+    x[-1] = 2**40
+    result = json.loads(pio.to_json(go.Figure(go.Scatter(x=x))))
+    assert result["data"][0]["x"][-1] == 2**40
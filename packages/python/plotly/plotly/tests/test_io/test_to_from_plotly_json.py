@@ -227,6 +227,43 @@ def test_object_array(engine, pretty):
     check_roundtrip(result, engine=engine, pretty=pretty)
 
 
+def test_mixed_types(engine, pretty):
+    import decimal
+
+    value = build_test_dict(
+        [
+            decimal.Decimal("1.5"),
+            np.arange(6, dtype="float64")[::2],
+            pd.Series([1, 2]),
+            pd.NaT,
+            np.ma.masked,
+            np.array([decimal.Decimal("2.5"), "a"], dtype="object"),
+        ]
+    )
+    result = pio.to_json_plotly(value, engine=engine)
+    expected = build_test_dict_string('[1.5,[0.0,2.0,4.0],[1,2],null,null,[2.5,"a"]]')
+    assert result == expected
+    check_roundtrip(result, engine=engine, pretty=pretty)
+
+
+def test_mixed_datetime64_decimal(engine, pretty):
+    import decimal
+
+    x = np.array(
+        ["2020-01-01", "2020-01-02T03:04:05.123456789", "NaT"], dtype="datetime64[ns]"
+    )
+    x_str = '["2020-01-01T00:00:00.000000000","2020-01-02T03:04:05.123456789","NaT"]'
+
+    # datetime64 arrays are formatted the same way whether or not other
+    # values need cleaning
+    for y, y_str in [([1, 2], "[1,2]"), ([decimal.Decimal("1.5"), 2], "[1.5,2]")]:
+        value = {"data": [{"type": "scatter", "x": x, "y": y}]}
+        result = pio.to_json_plotly(value, engine=engine)
+        expected = '{"data":[{"type":"scatter","x":%s,"y":%s}]}' % (x_str, y_str)
+        assert result == expected
+        check_roundtrip(result, engine=engine, pretty=pretty)
+
+
 def test_nonstring_key(engine, pretty):
     value = build_test_dict({0: 1})
     result = pio.to_json_plotly(value, engine=engine)
@@ -259,3 +296,12 @@ def test_sanitize_json(engine):
     for bad, good in replacements.items():
         assert bad not in fig_json
         assert good in fig_json
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{1, 2}, 1 + 2j, np.array([1, 2], dtype="timedelta64[s]")],
+)
+def test_unsupported_type(value, engine):
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        pio.to_json_plotly(build_test_dict(value), engine=engine)
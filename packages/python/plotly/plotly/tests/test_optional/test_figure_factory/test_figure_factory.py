@@ -625,6 +625,37 @@ class TestDistplot(NumpyTestUtilsMixin, TestCaseNoTemplate):
             }
             self.assert_fig_equal(dp["data"][1], expected_dp_data_hist_2)
 
+    def test_distplot_binned(self):
+        from scipy.stats import gaussian_kde
+
+        np.random.seed(0)
+        hist_data = [np.random.randn(5000), np.random.randn(3000) + 4]
+        rug_text = [["a%d" % i for i in range(5000)], ["b%d" % i for i in range(3000)]]
+        dp = ff.create_distplot(
+            hist_data,
+            ["a", "b"],
+            bin_size=0.25,
+            rug_text=rug_text,
+            binned=True,
+            max_rug_points=200,
+        )
+        hist, kde, rug = dp.data[0], dp.data[2], dp.data[4]
+
+        self.assertEqual(hist.type, "bar")
+        edges = np.append(np.asarray(hist.x) - 0.125, hist.x[-1] + 0.125)
+        self.assertEqual(edges[0], min(hist_data[0]))
+        self.assertTrue(edges[-2] <= max(hist_data[0]) < edges[-1])
+        self.assertAlmostEqual(np.sum(hist.y) * 0.25, 1.0)
+        self.assertEqual(hist.width, 0.25)
+
+        expected_kde = gaussian_kde(hist_data[0])(kde.x)
+        np.testing.assert_allclose(kde.y, expected_kde, atol=1e-3)
+
+        self.assertEqual(len(rug.x), 200)
+        self.assertEqual(list(rug.y), ["a"] * 200)
+        for x, text in zip(rug.x, rug.text):
+            self.assertEqual(x, hist_data[0][int(text[1:])])
+
 
 class TestStreamline(TestCaseNoTemplate):
     def test_wrong_arrow_scale(self):
@@ -935,6 +966,34 @@ class TestStreamline(TestCaseNoTemplate):
             list(strln["data"][0]["x"][0:100]), expected_strln_0_100["x"]
         )
 
+    def test_streamline_colliding_trajectories(self):
+
+        # Streamlines are cut where they run into earlier streamlines, check
+        # that the trajectories integrated together are cut the same way as
+        # trajectories integrated one at a time
+        x = np.linspace(-3, 3, 40)
+        y = np.linspace(-3, 3, 40)
+        Y, X = np.meshgrid(x, y)
+        u = (-1 - X**2 + Y).T
+        v = (1 + X - Y**2).T
+
+        strln = ff.create_streamline(x, y, u, v, density=1.5)
+        strln_x = np.array(strln.data[0].x, dtype=float)
+        strln_y = np.array(strln.data[0].y, dtype=float)
+
+        self.assertEqual(len(strln_x), 3406)
+        self.assertEqual(np.isnan(strln_x).sum(), 144)
+        self.assertAlmostEqual(np.nansum(strln_x), 26.557517350102444)
+        self.assertAlmostEqual(np.nansum(strln_y), 259.6658333417208)
+        self.assertListEqual(
+            strln_x[100:103].tolist(),
+            [-2.623324812225304, -2.670536853277057, -2.7176949338273473],
+        )
+        self.assertListEqual(
+            strln_y[100:103].tolist(),
+            [-2.683148672448438, -2.7226066146377343, -2.7621255784491043],
+        )
+
 
 class TestDendrogram(NumpyTestUtilsMixin, TestCaseNoTemplate):
     def test_default_dendrogram(self):
@@ -1265,6 +1324,41 @@ class TestDendrogram(NumpyTestUtilsMixin, TestCaseNoTemplate):
         self.assertEqual(len(dendro.layout.xaxis.ticktext), 4)
         self.assertEqual(len(dendro.layout.xaxis.tickvals), 4)
 
+    def test_dendrogram_merge_traces(self):
+        np.random.seed(0)
+        X = np.random.rand(40, 5)
+        dendro = ff.create_dendrogram(X, orientation="left")
+        merged = ff.create_dendrogram(X, orientation="left", merge_traces=True)
+
+        colors = [trace.marker.color for trace in dendro.data]
+        self.assertEqual(
+            [trace.marker.color for trace in merged.data],
+            list(dict.fromkeys(colors)),
+        )
+        for trace in merged.data:
+            links = [t for t in dendro.data if t.marker.color == trace.marker.color]
+            expected_x = np.concatenate([np.append(t.x, np.nan) for t in links])
+            expected_y = np.concatenate([np.append(t.y, np.nan) for t in links])
+            np.testing.assert_array_equal(trace.x, expected_x)
+            np.testing.assert_array_equal(trace.y, expected_y)
+        self.assertEqual(merged.layout, dendro.layout)
+
+    def test_dendrogram_precomputed_linkage(self):
+        from scipy.cluster.hierarchy import linkage
+        from scipy.spatial.distance import pdist
+
+        np.random.seed(0)
+        X = np.random.rand(20, 5)
+        dendro = ff.create_dendrogram(X)
+
+        dendro_distances = ff.create_dendrogram(None, distances=pdist(X))
+        self.assert_fig_equal(dendro_distances, dendro)
+
+        dendro_linkage = ff.create_dendrogram(
+            None, linkage=linkage(pdist(X), "complete")
+        )
+        self.assert_fig_equal(dendro_linkage, dendro)
+
 
 class TestTrisurf(NumpyTestUtilsMixin, TestCaseNoTemplate):
     def test_vmin_and_vmax(self):
@@ -1604,6 +1698,76 @@ class TestTrisurf(NumpyTestUtilsMixin, TestCaseNoTemplate):
         test_colors_plot = ff.create_trisurf(x, y, z, simplices, color_func=colors_raw)
         self.assertTrue(isinstance(test_colors_plot["data"][0]["facecolor"][0], str))
 
+    def test_trisurf_nonlinear_scale(self):
+
+        # check the face colors of a colormap with a nonlinear scale
+        u, v = np.meshgrid(np.linspace(-1, 1, 4), np.linspace(-1, 1, 4))
+        u = u.flatten()
+        v = v.flatten()
+        simplices = []
+        for i in range(3):
+            for j in range(3):
+                k = 4 * i + j
+                simplices += [[k, k + 1, k + 4], [k + 1, k + 5, k + 4]]
+        simplices = np.array(simplices)
+        colormap = ["#FFFFFF", "#E4FFFE", "#A4F6F9", "#FF99FE", "#BA52ED"]
+        scale = [0, 0.6, 0.71, 0.89, 1]
+
+        fig = ff.create_trisurf(
+            u,
+            v,
+            u * v + u,
+            simplices,
+            colormap=colormap,
+            scale=scale,
+            plot_edges=False,
+        )
+
+        expected = [
+            "rgb(237, 255, 254)",
+            "rgb(238, 255, 254)",
+            "rgb(234, 255, 254)",
+            "rgb(233, 255, 254)",
+            "rgb(232, 255, 254)",
+            "rgb(228, 255, 254)",
+            "rgb(246, 255, 255)",
+            "rgb(245, 255, 255)",
+            "rgb(236, 255, 254)",
+            "rgb(232, 255, 254)",
+            "rgb(195, 250, 251)",
+            "rgb(210, 200, 251)",
+            "rgb(255, 255, 255)",
+            "rgb(251, 255, 255)",
+            "rgb(237, 255, 254)",
+            "rgb(231, 255, 254)",
+            "rgb(210, 200, 251)",
+            "rgb(186, 82, 237)",
+        ]
+        self.assertListEqual(list(fig.data[0].facecolor), expected)
+
+    def test_trisurf_use_intensity(self):
+
+        # check that face values are sent as intensities with a colorscale
+        u, v = np.meshgrid(np.linspace(-1, 1, 3), np.linspace(-1, 1, 3))
+        u = u.flatten()
+        v = v.flatten()
+        z = u * v
+        simplices = Delaunay(np.vstack([u, v]).T).simplices
+
+        fig = ff.create_trisurf(
+            u, v, z, simplices, colormap="Viridis", use_intensity=True
+        )
+
+        self.assertEqual(len(fig.data), 2)
+        mesh = fig.data[0]
+        self.assertIsNone(mesh.facecolor)
+        self.assertEqual(mesh.intensitymode, "cell")
+        np.testing.assert_array_equal(mesh.intensity, z[simplices].mean(-1))
+        self.assertEqual(mesh.colorscale[0], (0.0, "rgb(68, 1, 84)"))
+        self.assertEqual(mesh.colorscale[-1], (1.0, "rgb(253, 231, 37)"))
+        self.assertTrue(mesh.showscale)
+        self.assertEqual(fig.data[1].mode, "lines")
+
 
 class TestScatterPlotMatrix(NumpyTestUtilsMixin, TestCaseNoTemplate):
     def test_dataframe_input(self):
@@ -4108,6 +4272,25 @@ class TestChoropleth(NumpyTestUtilsMixin, TestCaseNoTemplate):
                 scope="foo",
             )
 
+        def test_county_geometry_is_cached(self):
+            from plotly.figure_factory._county_choropleth import (
+                _get_us_counties_geometry,
+            )
+
+            fig1 = ff.create_choropleth(fips=[1001, 2013], values=[1, 2])
+            geometry = _get_us_counties_geometry()
+            fig2 = ff.create_choropleth(fips=[1001, 2013], values=[1, 2])
+
+            self.assertIs(_get_us_counties_geometry(), geometry)
+            self.assertIn((1001, 0.02), geometry._county_rings)
+            # the ring separators are nan
+            np.testing.assert_equal(
+                fig1.data[0].to_plotly_json(), fig2.data[0].to_plotly_json()
+            )
+            np.testing.assert_equal(
+                fig1.data[1].to_plotly_json(), fig2.data[1].to_plotly_json()
+            )
+
         def test_full_choropleth(self):
             fips = [1001]
             values = [1]
@@ -4166,7 +4349,7 @@ class TestChoropleth(NumpyTestUtilsMixin, TestCaseNoTemplate):
                 -85.10533699999999,
             )
 
-            self.assertEqual(fig["data"][2]["x"][:50], exp_fig_head)
+            np.testing.assert_array_equal(fig["data"][2]["x"][:50], exp_fig_head)
 
 
 class TestQuiver(TestCaseNoTemplate):
@@ -4309,6 +4492,58 @@ class TestTernarycontour(NumpyTestUtilsMixin, TestCaseNoTemplate):
             print(len(fig.data))
             assert len(fig.data) == ncontours + 2 + arg_set["showscale"]
 
+    def test_grid_is_cached(self):
+        from scipy.interpolate import griddata
+        from plotly.figure_factory import _ternary_contour
+
+        a, b = np.mgrid[0:1:20j, 0:1:20j]
+        mask = a + b <= 1.0
+        a = a[mask].ravel()
+        b = b[mask].ravel()
+        c = 1 - a - b
+        coordinates = _ternary_contour._prepare_barycentric_coord(np.stack((a, b, c)))
+        grid = _ternary_contour._get_ternary_grid(coordinates, "cartesian")
+        assert (
+            _ternary_contour._get_ternary_grid(coordinates.copy(), "cartesian") is grid
+        )
+        assert _ternary_contour._get_ternary_grid(coordinates, "ilr") is not grid
+
+        M, _ = _ternary_contour._transform_barycentric_cartesian()
+        points = np.einsum("ik, kj -> ij", M, coordinates)[:2].T
+        for z in [a * b * c, a + b**2]:
+            grid_z, gr_x, gr_y = _ternary_contour._compute_grid(
+                coordinates, z, interp_mode="cartesian"
+            )
+            expected = griddata(
+                points, z, tuple(np.meshgrid(gr_x, gr_y)), method="cubic"
+            )
+            np.testing.assert_array_equal(grid_z, expected)
+
+    def test_grid_cache_is_bounded(self):
+        from unittest import mock
+        from plotly.figure_factory import _ternary_contour
+
+        rng = np.random.default_rng(0)
+
+        def make_coordinates(n):
+            coordinates = rng.random((3, n))
+            return coordinates / coordinates.sum(axis=0)
+
+        with mock.patch.object(
+            _ternary_contour, "_ternary_grids", type(_ternary_contour._ternary_grids)()
+        ), mock.patch.object(_ternary_contour, "_max_ternary_grid_points", 100):
+            small = [make_coordinates(40) for _ in range(3)]
+            for coordinates in small:
+                _ternary_contour._get_ternary_grid(coordinates)
+            # Least recently used grids are evicted past 100 data points
+            assert len(_ternary_contour._ternary_grids) == 2
+
+            # Grids of more data points than the bound are not cached
+            large = make_coordinates(101)
+            grid = _ternary_contour._get_ternary_grid(large)
+            assert _ternary_contour._get_ternary_grid(large) is not grid
+            assert len(_ternary_contour._ternary_grids) == 2
+
 
 class TestHexbinMapbox(NumpyTestUtilsMixin, TestCaseNoTemplate):
     def compare_list_values(self, list1, list2, decimal=7):
@@ -4465,6 +4700,27 @@ class TestHexbinMapbox(NumpyTestUtilsMixin, TestCaseNoTemplate):
 
         assert fig3.data[0].z.sum() == 1000
 
+    def test_vectorized_aggregation(self):
+        from plotly.figure_factory._hexbin_mapbox import _compute_hexbin
+
+        np.random.seed(0)
+        x = np.random.randn(2000)
+        y = np.random.randn(2000)
+        color = np.random.exponential(size=2000)
+        x_range = np.array([-2, 2])
+        y_range = np.array([-2, 2])
+
+        for agg_func in [np.mean, np.sum, np.min, np.max, len]:
+            for min_count in [None, 3]:
+                expected = _compute_hexbin(
+                    x, y, x_range, y_range, color, 10, lambda v: agg_func(v), min_count
+                )
+                actual = _compute_hexbin(
+                    x, y, x_range, y_range, color, 10, agg_func, min_count
+                )
+                for e, a in zip(expected, actual):
+                    assert np.allclose(e, a)
+
     def test_build_dataframe(self):
         np.random.seed(0)
         N = 10000
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+import plotly.graph_objs as go
+
+
+@pytest.fixture
+def arrays():
+    return np.arange(10.0), np.random.rand(10), np.random.rand(10)
+
+
+def test_copy_by_default(arrays):
+    x, y, color = arrays
+    fig = go.Figure(dict(type="scatter", x=x, y=y, marker=dict(color=color)))
+
+    assert not np.shares_memory(fig.data[0].x, x)
+    assert not np.shares_memory(fig.data[0].marker.color, color)
+
+
+def test_adopt_arrays(arrays):
+    x, y, color = arrays
+    fig = go.Figure(
+        dict(type="scatter", x=x, y=y, marker=dict(color=color)), copy=False
+    )
+
+    assert np.shares_memory(fig.data[0].x, x)
+    assert np.shares_memory(fig.data[0].y, y)
+    assert np.shares_memory(fig.data[0].marker.color, color)
+
+    # Adopted arrays are read-only views, the inputs remain writeable
+    assert not fig.data[0].x.flags.writeable
+    assert x.flags.writeable
+
+
+def test_adopt_layout_arrays():
+    tickvals = np.arange(5.0)
+    fig = go.Figure(layout=dict(xaxis=dict(tickvals=tickvals)), copy=False)
+
+    assert np.shares_memory(fig.layout.xaxis.tickvals, tickvals)
+
+
+def test_adopt_arrays_of_trace_objects(arrays):
+    x, y, _ = arrays
+    trace = go.Scatter(x=x, y=y)
+    fig = go.Figure(trace, copy=False)
+
+    assert np.shares_memory(fig.data[0].x, trace.x)
+
+
+def test_adopt_arrays_equivalent_json(arrays):
+    x, y, color = arrays
+    data = dict(type="scatter", x=x, y=y, marker=dict(color=color))
+
+    assert go.Figure(data, copy=False).to_json() == go.Figure(data).to_json()
+
+
+def test_copy_restored_after_construction(arrays):
+    x, _, _ = arrays
+    go.Figure(dict(type="scatter", x=x), copy=False)
+    fig = go.Figure(dict(type="scatter", x=x))
+
+    assert not np.shares_memory(fig.data[0].x, x)
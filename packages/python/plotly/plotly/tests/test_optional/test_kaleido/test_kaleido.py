@@ -1,9 +1,12 @@
+import os
 import plotly.io as pio
 import plotly.io.kaleido
 from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+import pytest
 
 fig = {"layout": {"title": {"text": "figure title"}}}
 
@@ -163,3 +166,254 @@ def test_bytesio():
     bio_bytes = bio.read()
     to_image_bytes = pio.to_image(fig, format="jpg", engine="kaleido", validate=False)
     assert bio_bytes == to_image_bytes
+
+
+def test_kaleido_engine_write_images():
+    writeable_mocks = make_writeable_mocks()
+    with mocked_scope() as scope:
+        scope.default_format = "svg"
+        scope.default_height = 500
+        scope.default_scale = 1
+        results = pio.write_images(
+            [fig] * len(writeable_mocks),
+            writeable_mocks,
+            width=700,
+            engine="kaleido",
+            validate=False,
+            n_workers=1,
+        )
+
+    assert scope.transform.call_count == len(writeable_mocks)
+    for writeable_mock, result in zip(writeable_mocks, results):
+        scope.transform.assert_any_call(
+            fig,
+            format=writeable_mock.expected_format or "svg",
+            width=700,
+            height=500,
+            scale=1,
+        )
+        assert writeable_mock.active_write_function.call_count == 1
+        assert result.file is writeable_mock
+        assert result.error is None
+        assert result.latency >= 0
+
+
+def test_kaleido_engine_write_images_failures():
+    bad_fig = {"layout": {"title": {"text": "bad figure"}}}
+    mocks = [BytesIO(), BytesIO(), BytesIO()]
+
+    def transform(fig_dict, **kwargs):
+        if fig_dict is bad_fig:
+            raise ValueError("Transform failed")
+        return b"image"
+
+    with mocked_scope() as scope:
+        scope.transform.side_effect = transform
+        results = pio.write_images(
+            [fig, bad_fig, "not a figure"],
+            mocks,
+            format="png",
+            engine="kaleido",
+            validate=False,
+            n_workers=1,
+        )
+
+    assert mocks[0].getvalue() == b"image"
+    assert results[0].error is None
+    assert isinstance(results[1].error, ValueError)
+    assert mocks[1].getvalue() == b""
+    assert isinstance(results[2].error, ValueError)
+
+
+def test_kaleido_engine_write_images_workers(monkeypatch):
+    monkeypatch.setattr(
+        pio._kaleido,
+        "PlotlyScope",
+        lambda: Mock(**{"transform.return_value": b"image"}),
+    )
+    monkeypatch.setattr(pio._kaleido, "_worker_scopes", [])
+
+    with mocked_scope() as scope:
+        scope.transform.return_value = b"image"
+        scope.default_width = 1000
+        scope.default_height = 800
+        scope.default_scale = 2
+        results = pio.write_images(
+            [fig] * 6,
+            [BytesIO() for _ in range(6)],
+            format="png",
+            engine="kaleido",
+            validate=False,
+            n_workers=3,
+        )
+
+        worker_scopes = pio._kaleido._worker_scopes
+        assert len(worker_scopes) == 2
+        for worker_scope in worker_scopes:
+            assert worker_scope.plotlyjs == scope.plotlyjs
+
+    # Every worker exports with the defaults of the global scope
+    for s in [scope] + worker_scopes:
+        for call in s.transform.call_args_list:
+            assert call.kwargs == dict(format="png", width=1000, height=800, scale=2)
+
+    assert all(result.error is None for result in results)
+    assert scope.transform.call_count + sum(
+        worker_scope.transform.call_count for worker_scope in worker_scopes
+    ) == len(results)
+
+
+def test_kaleido_engine_write_images_batch_scopes(monkeypatch):
+    created = []
+
+    def make_scope():
+        created.append(Mock(**{"transform.return_value": b"image"}))
+        return created[-1]
+
+    monkeypatch.setattr(pio._kaleido, "PlotlyScope", make_scope)
+    monkeypatch.setattr(pio._kaleido, "_worker_scopes", [])
+    monkeypatch.setattr(pio._kaleido.os, "cpu_count", lambda: 64)
+
+    with mocked_scope() as scope:
+        scope.transform.return_value = b"image"
+        pio.write_images([fig] * 8, [BytesIO() for _ in range(8)], engine="kaleido")
+        assert len(created) == 3
+
+        results = pio.write_images(
+            [fig] * 8, [BytesIO() for _ in range(8)], engine="kaleido", n_workers=6
+        )
+
+    # The scopes of workers beyond the default number are stopped
+    assert all(result.error is None for result in results)
+    assert pio._kaleido._worker_scopes == created[:3]
+    assert len(created) == 5
+    for worker_scope in created[:3]:
+        worker_scope._shutdown_kaleido.assert_not_called()
+    for worker_scope in created[3:]:
+        worker_scope._shutdown_kaleido.assert_called_once_with()
+
+
+def test_kaleido_engine_write_images_length_mismatch():
+    with pytest.raises(ValueError, match="same length"):
+        pio.write_images([fig, fig], [BytesIO()], engine="kaleido")
+
+
+@pytest.fixture
+def image_cache(tmp_path):
+    cache = pio.image_cache
+    cache.directory = tmp_path
+    cache.reset_stats()
+    try:
+        yield cache
+    finally:
+        cache.directory = None
+        cache.max_size = 256 * 1024 * 1024
+        cache.reset_stats()
+
+
+def test_kaleido_engine_to_image_cache(image_cache):
+    with mocked_scope() as scope:
+        scope.transform.return_value = b"image"
+        kwargs = dict(format="png", width=700, height=500, scale=1)
+
+        assert pio.to_image(fig, engine="kaleido", **kwargs) == b"image"
+        assert pio.to_image(fig, engine="kaleido", **kwargs) == b"image"
+        assert scope.transform.call_count == 1
+        assert (image_cache.hits, image_cache.misses) == (1, 1)
+
+        # Different export options are cached separately
+        pio.to_image(fig, engine="kaleido", **dict(kwargs, scale=2))
+        assert scope.transform.call_count == 2
+        assert (image_cache.hits, image_cache.misses) == (1, 2)
+
+
+def test_kaleido_engine_to_image_cache_defaults(image_cache):
+    with mocked_scope() as scope:
+        scope.transform.return_value = b"image"
+        scope.default_format = "png"
+        scope.default_width = 700
+        scope.default_height = 500
+        scope.default_scale = 1
+        pio.to_image(fig, engine="kaleido", validate=False)
+        scope.transform.assert_called_with(
+            fig, format="png", width=700, height=500, scale=1
+        )
+
+        # The key is computed from the options passed to the engine, so
+        # changing the defaults doesn't return the image exported before
+        scope.default_width = 1000
+        pio.to_image(fig, engine="kaleido", validate=False)
+        scope.transform.assert_called_with(
+            fig, format="png", width=1000, height=500, scale=1
+        )
+        assert scope.transform.call_count == 2
+        assert (image_cache.hits, image_cache.misses) == (0, 2)
+
+
+def test_kaleido_engine_write_images_cache(image_cache):
+    with mocked_scope() as scope:
+        scope.transform.return_value = b"image"
+        pio.to_image(fig, format="png", engine="kaleido")
+
+        bio = BytesIO()
+        results = pio.write_images(
+            [fig], [bio], format="png", engine="kaleido", n_workers=1
+        )
+
+    assert scope.transform.call_count == 1
+    assert results[0].error is None
+    assert bio.getvalue() == b"image"
+
+
+def test_kaleido_engine_to_image_cache_write_error(image_cache):
+    def replace(src, dst):
+        raise OSError("No space left on device")
+
+    with mocked_scope() as scope, patch("os.replace", replace):
+        scope.transform.return_value = b"image"
+        assert pio.to_image(fig, format="png", engine="kaleido") == b"image"
+
+        bio = BytesIO()
+        results = pio.write_images(
+            [fig], [bio], format="png", engine="kaleido", n_workers=1
+        )
+
+    assert results[0].error is None
+    assert bio.getvalue() == b"image"
+    assert scope.transform.call_count == 2
+    assert list(image_cache.directory.iterdir()) == []
+
+
+def test_image_cache_eviction(image_cache):
+    image_cache.max_size = 25
+    for key in ["a", "b", "c"]:
+        image_cache.put(key, key.encode() * 10)
+
+    # Least recently used image is evicted
+    assert image_cache.get("a") is None
+    assert image_cache.get("b") == b"b" * 10
+    assert image_cache.get("c") == b"c" * 10
+
+    # Reading an image marks it as recently used
+    image_cache.put("d", b"d" * 10)
+    assert image_cache.get("b") is None
+    assert image_cache.get("c") == b"c" * 10
+    image_cache.put("e", b"e" * 10)
+    assert image_cache.get("d") is None
+    assert image_cache.get("c") == b"c" * 10
+
+    image_cache.clear()
+    assert image_cache.get("b") is None
+
+
+def test_image_cache_eviction_same_mtime(image_cache):
+    for key in ["c", "a", "b"]:
+        image_cache.put(key, key.encode() * 10)
+        os.utime(image_cache.directory / (key + ".img"), (0, 0))
+
+    # Images found in the cache directory with the same modification time
+    # are evicted in key order
+    cache = pio._image_cache.ImageCache()
+    cache.directory = image_cache.directory
+    cache.max_size = 15
+    assert sorted(p.stem for p in cache.directory.glob("*.img")) == ["c"]
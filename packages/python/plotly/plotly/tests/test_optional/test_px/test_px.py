@@ -1,4 +1,5 @@
 import plotly.express as px
+import plotly.graph_objects as go
 import plotly.io as pio
 import narwhals.stable.v1 as nw
 import numpy as np
@@ -310,6 +311,87 @@ def test_category_order_with_category_as_x(backend):
         assert set(trace["x"]) == {"Thur", "Fri", "Sat", "Sun"}
 
 
+def test_many_groups(constructor):
+    categories = [f"c{i}" for i in range(500)]
+    c = [c for _ in range(2) for c in categories[::-1] for _ in range(2)]
+    data = dict(
+        x=list(range(len(c) + 1)),
+        y=list(range(len(c) + 1)),
+        c=c + [None],
+        s=["a", "b"] * len(categories) * 2 + ["a"],
+    )
+    fig = px.scatter(
+        constructor(data),
+        x="x",
+        y="y",
+        color="c",
+        symbol="s",
+        category_orders=dict(c=categories, s=["b"]),
+    )
+    # groups are in category order, rows with null group keys are dropped
+    names = [f"{c}, {s}" for c in categories for s in ["b", "a"]]
+    assert [trace.name for trace in fig.data] == names
+    # rows keep their order within each group
+    for trace in fig.data:
+        assert len(trace.x) == 2 and trace.x[0] < trace.x[1]
+    # traces created by px still validate the updates made by the user
+    with pytest.raises(ValueError):
+        fig.data[0].update(marker_symbol="not-a-symbol")
+
+
+def test_animation_frames_share_data(backend):
+    gapminder = px.data.gapminder(return_type=backend)
+    fig = px.bar(
+        gapminder,
+        x="continent",
+        y="pop",
+        color="continent",
+        animation_frame="year",
+        animation_group="country",
+    )
+    frames = [frame.to_plotly_json() for frame in fig.frames]
+    # frames hold all their data unless sharing is requested
+    assert all("baseframe" not in frame for frame in frames)
+    assert all("x" in frame["data"][0] for frame in frames)
+
+    assert px.share_frame_data(fig) is fig
+    base, *shared_frames = [frame.to_plotly_json() for frame in fig.frames]
+    np.testing.assert_equal(base, frames[0])
+    for frame, full_frame in zip(shared_frames, frames[1:]):
+        assert frame["baseframe"] == base["name"]
+        for trace, base_trace, full_trace in zip(
+            frame["data"], base["data"], full_frame["data"]
+        ):
+            # only the properties which differ from the base frame are kept
+            assert trace["type"] == base_trace["type"]
+            assert "x" not in trace and "ids" not in trace
+            assert "y" in trace
+            assert full_frame["name"] in trace["hovertemplate"]
+            # merging the frame into its base frame gives the full frame back
+            merged = dict(base_trace, **trace)
+            for key, value in full_trace.items():
+                if isinstance(value, dict):
+                    continue
+                assert list(np.atleast_1d(merged[key])) == list(
+                    np.atleast_1d(value)
+                ), key
+
+
+def test_animation_frames_share_data_imshow():
+    img = np.arange(60.0).reshape((3, 4, 5))
+    fig = px.imshow(img, animation_frame=0)
+    px.share_frame_data(fig)
+    base, *shared_frames = [frame.to_plotly_json() for frame in fig.frames]
+    for frame in shared_frames:
+        assert frame["baseframe"] == base["name"]
+        assert "z" in frame["data"][0]
+        assert "layout" not in frame
+
+    # figures without frames are left unchanged
+    fig = px.imshow(img[0])
+    assert px.share_frame_data(fig).frames == ()
+
+
 def test_permissive_defaults():
     msg = "'PxDefaults' object has no attribute 'should_not_work'"
     with pytest.raises(AttributeError, match=msg):
@@ -375,3 +457,71 @@ def test_empty_df_int64(backend):
     )
     # to_dict() should not raise an exception
     fig.to_dict()
+
+
+@pytest.mark.parametrize(
+    "trace_class,patches",
+    [
+        (
+            go.Scatter,
+            [
+                dict(name="a", x=np.arange(3), marker=dict(color="red", symbol=1)),
+                {"marker.line.width": 2, "error_x": dict(array=[1, 2, 3])},
+                dict(hovertemplate="%{x}", legendgroup="a", marker_size=4),
+            ],
+        ),
+        (
+            go.Bar,
+            [
+                dict(x=["a", "b"], y=np.array([1.5, 2]), marker_pattern_shape="/"),
+                dict(orientation="h", textposition="auto", marker_color="blue"),
+            ],
+        ),
+        (
+            go.Choroplethmap,
+            [
+                dict(
+                    geojson={"type": "FeatureCollection", "features": []},
+                    locations=["a"],
+                    z=[1],
+                ),
+                dict(coloraxis="coloraxis", featureidkey="properties.id"),
+            ],
+        ),
+        (
+            go.Splom,
+            [
+                dict(dimensions=[dict(label="a", values=[1, 2])], marker_color="blue"),
+                dict(showupperhalf=False, diagonal=dict(visible=False)),
+            ],
+        ),
+        (
+            go.Scatter3d,
+            [
+                dict(x=[1], y=[2], z=[3], error_z=dict(array=[1])),
+                dict(mode="markers", marker=dict(size=3, color=None)),
+            ],
+        ),
+        (
+            go.Pie,
+            [dict(labels=["a"], values=[1], marker_colors=["red"]), dict(hole=0.3)],
+        ),
+    ],
+)
+def test_trace_builder_matches_update(trace_class, patches):
+    from plotly.express._core import _TraceBuilder, _TraceBuilderCache
+    from plotly.io.json import to_json_plotly
+
+    cache = _TraceBuilderCache()
+    # The second time, the validators and scalar values come from the cache
+    for _ in range(2):
+        builder = _TraceBuilder(trace_class, cache)
+        trace = trace_class()
+        for patch in patches:
+            builder.update(patch)
+            trace.update(patch)
+
+        built = go.Figure().add_traces([builder.build()], validate=False).data[0]
+        expected = go.Figure().add_traces([trace]).data[0]
+        # Same properties, in the same order
+        assert to_json_plotly(built) == to_json_plotly(expected)
@@ -536,6 +536,108 @@ def test_histfunc_hoverlabels_bivariate(backend):
     check_label("density of max of tip", fig)
 
 
+def test_histogram_server_binning(backend):
+    df = px.data.tips(return_type=backend)
+    x = nw.from_native(df, eager_only=True).get_column("total_bill").to_numpy()
+
+    fig = px.histogram(df, x="total_bill", color="sex", binning="server")
+    assert [t.type for t in fig.data] == ["bar", "bar"]
+    assert fig.layout.bargap == 0
+    edges = np.r_[fig.data[0].x - 1, fig.data[0].x[-1] + 1]
+    assert_array_equal(fig.data[0].x, fig.data[1].x)
+    assert_array_equal(fig.data[0].y + fig.data[1].y, np.histogram(x, bins=edges)[0])
+    assert "total_bill=%{x}<br>count=%{y}" in fig.data[0].hovertemplate
+
+    fig = px.histogram(
+        df, y="total_bill", binning="server", histnorm="percent", cumulative=True
+    )
+    assert fig.data[0].orientation == "h"
+    assert fig.data[0].x[-1] == pytest.approx(100)
+
+    fig = px.histogram(df, x="day", y="tip", histfunc="max", binning="server")
+    assert set(fig.data[0].x) == {"Thur", "Fri", "Sat", "Sun"}
+    assert max(fig.data[0].y) == 10
+
+    with pytest.raises(ValueError, match="`binning` must be one of"):
+        px.histogram(df, x="total_bill", binning="browser")
+
+
+def test_histogram_server_binning_skips_non_finite(constructor):
+    df = constructor(dict(x=[1.0, float("nan"), float("inf"), 2.0, 3.0]))
+    fig = px.histogram(df, x="x", binning="server")
+    assert fig.data[0].y.sum() == 3
+
+
+def test_density_heatmap_server_binning(backend):
+    df = px.data.tips(return_type=backend)
+
+    fig = px.density_heatmap(
+        df,
+        x="total_bill",
+        y="tip",
+        z="size",
+        marginal_x="histogram",
+        binning="server",
+    )
+    assert [t.type for t in fig.data] == ["heatmap", "bar"]
+    z = np.array(fig.data[0].z)
+    assert z.shape == (len(fig.data[0].y), len(fig.data[0].x))
+    assert z.sum() == 627
+    # the marginal histogram shares the bins of the heatmap
+    assert_array_equal(fig.data[0].x, fig.data[1].x)
+    assert fig.data[1].y.sum() == 244
+    assert fig.data[0].coloraxis == "coloraxis"
+
+
+@pytest.mark.parametrize("downsample", ["lttb", "minmax", 100])
+def test_line_downsample(constructor, downsample):
+    n = 10_000
+    y = np.sin(np.arange(n) / 100) + np.arange(n) % 7
+    df = constructor(dict(x=np.arange(n), y=y, g=["a", "b"] * (n // 2)))
+    fig = px.line(df, x="x", y="y", color="g", downsample=downsample)
+    for trace in fig.data:
+        assert 2 < len(trace.x) <= (100 if downsample == 100 else 2000)
+        rows = np.array(trace.customdata)[:, 0].astype(int)
+        assert_array_equal(trace.x, rows)
+        assert_array_equal(trace.y, y[rows])
+    if downsample == "minmax":
+        assert max(fig.data[0].y) == y[::2].max()
+
+    fig = px.scatter(df, x="x", y="y", downsample=50, custom_data=["g"])
+    assert len(fig.data[0].x) == 50
+    assert np.array(fig.data[0].customdata).shape == (50, 2)
+
+    with pytest.raises(ValueError, match="`downsample` must be one of"):
+        px.line(df, x="x", y="y", downsample="mean")
+
+
+def test_register_downsampling():
+    n = 10_000
+    fig = px.line(
+        x=np.arange(n), y=np.arange(n) % 10, downsample=100, downsample_on_zoom=True
+    )
+    assert len(fig.data[0].x) == 100
+    px.register_downsampling(fig)
+
+    fig.plotly_relayout({"xaxis.range": [1000, 1050]})
+    # the visible points and their neighbours, at full resolution
+    assert_array_equal(fig.data[0].x, np.arange(999, 1052))
+    assert_array_equal(np.array(fig.data[0].customdata)[:, 0], np.arange(999, 1052))
+
+    fig.plotly_relayout({"xaxis.autorange": True})
+    assert len(fig.data[0].x) == 100
+    assert fig.data[0].x[-1] == n - 1
+
+    with pytest.raises(ValueError, match="downsample"):
+        px.register_downsampling(px.line(x=[1, 2], y=[1, 2]))
+
+    # The full-resolution data is only kept on request
+    fig = px.line(x=np.arange(n), y=np.arange(n) % 10, downsample=100)
+    assert not hasattr(fig, "_px_downsample")
+    with pytest.raises(ValueError, match="downsample_on_zoom"):
+        px.register_downsampling(fig)
+
+
 def test_timeline(constructor):
 
     df = constructor(
@@ -337,6 +337,25 @@ def test_build_df_using_interchange_protocol_mock():
         )
 
 
+def test_build_df_from_lazy_frame():
+    import polars as pl
+
+    lazy_frame = pl.LazyFrame(
+        {"a": [1, 2, 3], "b": [4, 5, 6], "c": [7, 8, 9], "s": ["x", "y", "z"]}
+    ).with_columns(
+        # fails if the column is ever computed
+        unused=pl.col("s").cast(pl.Int64, strict=True)
+    )
+    args = dict(data_frame=lazy_frame, x="a", y="b", hover_data=["c"])
+    out = build_dataframe(args, go.Scatter)
+    assert isinstance(out["data_frame"].to_native(), pl.DataFrame)
+    assert sorted(out["data_frame"].columns) == ["a", "b", "c"]
+
+    fig = px.line(lazy_frame, y=["b", "c"])
+    assert [t.name for t in fig.data] == ["b", "c"]
+    assert list(fig.data[1].y) == [7, 8, 9]
+
+
 @pytest.mark.skipif(
     version.parse(pd.__version__) < version.parse("2.0.2")
     or sys.version_info >= (3, 12),
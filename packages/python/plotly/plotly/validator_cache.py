@@ -32,3 +32,15 @@ class ValidatorCache(object):
             ValidatorCache._cache[key] = validator
 
         return ValidatorCache._cache[key]
+
+    @staticmethod
+    def find_validator(parent_path, prop_name):
+        """
+        Return the validator of property prop_name of the objects at
+        parent_path (e.g. 'scatter.marker'), or None if the objects at
+        parent_path have no such property
+        """
+        try:
+            return ValidatorCache.get_validator(parent_path, prop_name)
+        except (ImportError, AttributeError, TypeError):
+            return None
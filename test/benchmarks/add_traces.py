@@ -0,0 +1,51 @@
+"""
+Benchmark of Figure.add_traces with many small traces placed on subplots,
+for each validate= mode.
+
+Usage:
+    python test/benchmarks/add_traces.py [--sizes 1000 5000 20000] [--repeat 3]
+"""
+import argparse
+import time
+
+from plotly.subplots import make_subplots
+
+
+def make_traces(n):
+    return [
+        dict(type="scatter", x=[0, 1, 2], y=[i, i + 1, i], mode="lines", name=str(i))
+        for i in range(n)
+    ]
+
+
+def time_add_traces(n, validate, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        traces = make_traces(n)
+        rows = [i % 2 + 1 for i in range(n)]
+        cols = [i // 2 % 2 + 1 for i in range(n)]
+        fig = make_subplots(2, 2)
+
+        start = time.perf_counter()
+        fig.add_traces(traces, rows=rows, cols=cols, validate=validate)
+        best = min(best, time.perf_counter() - start)
+
+        assert len(fig.data) == n
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    modes = [True, "schema", False]
+    print("{:>8}".format("traces") + "".join("{:>16}".format(repr(m)) for m in modes))
+    for n in args.sizes:
+        times = [time_add_traces(n, validate, args.repeat) for validate in modes]
+        print("{:>8}".format(n) + "".join("{:>15.2f}s".format(t) for t in times))
+
+
+if __name__ == "__main__":
+    main()
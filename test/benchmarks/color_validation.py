@@ -0,0 +1,59 @@
+"""
+Benchmark of ColorValidator.validate_coerce on large numpy arrays of named,
+hex and rgba() color strings.
+
+Usage:
+    python test/benchmarks/color_validation.py [--size 500000] [--repeat 3]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from _plotly_utils.basevalidators import ColorValidator
+
+
+def make_palettes():
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 256, size=(200, 3))
+    return {
+        "6 named colors": ["red", "green", "blue", "orange", "purple", "gray"],
+        "200 hex colors": ["#{:02x}{:02x}{:02x}".format(*c) for c in rgb],
+        "200 rgba() colors": ["rgba({}, {}, {}, 0.5)".format(*c) for c in rgb],
+    }
+
+
+def time_validate(validator, values, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validator.validate_coerce(values)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=500000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    validator = ColorValidator(
+        "color",
+        "scatter.marker",
+        array_ok=True,
+        colorscale_path="scatter.marker.colorscale",
+    )
+    rng = np.random.default_rng(1)
+
+    print("{:<20}{:>10}".format("palette", "time"))
+    for name, palette in make_palettes().items():
+        values = np.array(palette, dtype="object")[
+            rng.integers(0, len(palette), args.size)
+        ]
+        elapsed = time_validate(validator, values, args.repeat)
+        print("{:<20}{:>9.2f}s".format(name, elapsed))
+
+
+if __name__ == "__main__":
+    main()
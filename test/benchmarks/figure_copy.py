@@ -0,0 +1,73 @@
+"""
+Benchmark of the construction time and memory of large scatter figures with
+go.Figure(..., copy=True) and go.Figure(..., copy=False).
+
+Each case runs in a fresh process. The memory figure is the increase of the
+peak resident set size of that process while the figure is constructed,
+after the input arrays were allocated.
+
+Usage:
+    python test/benchmarks/figure_copy.py [--points 1000000 10000000 50000000]
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_case(n, copy):
+    import numpy as np
+    import plotly.graph_objects as go
+
+    x = np.arange(n, dtype="float64")
+    y = np.random.default_rng(0).standard_normal(n)
+    color = np.random.default_rng(1).random(n)
+    rss_before = peak_rss_mb()
+
+    start = time.perf_counter()
+    fig = go.Figure(
+        data=[dict(type="scatter", x=x, y=y, marker=dict(color=color))], copy=copy
+    )
+    elapsed = time.perf_counter() - start
+
+    assert len(fig.data[0].x) == n
+    return {"time": elapsed, "rss": peak_rss_mb() - rss_before}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--points", type=int, nargs="+", default=[1000000, 10000000, 50000000]
+    )
+    parser.add_argument("--case", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        n, copy = args.case
+        print(json.dumps(run_case(int(n), copy == "True")))
+        return
+
+    print("{:>10}{:>22}{:>22}".format("points", "copy=True", "copy=False"))
+    for n in args.points:
+        cells = []
+        for copy in [True, False]:
+            out = subprocess.run(
+                [sys.executable, __file__, "--case", str(n), str(copy)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(out)
+            cells.append("{time:.2f}s / +{rss:.0f}MB".format(**result))
+        print("{:>10}{:>22}{:>22}".format(n, *cells))
+
+
+if __name__ == "__main__":
+    main()
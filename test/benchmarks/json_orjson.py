@@ -0,0 +1,94 @@
+"""
+Benchmark of the orjson JSON engine on figures holding values that orjson
+can't serialize natively, comparing the cleaning pass that was used before
+(clean_to_json_compatible on the whole figure) with the default hook used by
+plotly.io.json.to_json_plotly.
+
+Usage:
+    python test/benchmarks/json_orjson.py [--points 200000] [--repeat 3]
+"""
+import argparse
+import decimal
+import time
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from _plotly_utils.optional_imports import get_module
+from plotly.io._json import clean_to_json_compatible
+from plotly.io.json import to_json_plotly
+
+
+def to_json_cleaning_pass(fig_dict):
+    """The orjson path of to_json_plotly before the default hook"""
+    opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    try:
+        return orjson.dumps(fig_dict, option=opts).decode("utf8")
+    except TypeError:
+        pass
+
+    modules = {
+        "sage_all": get_module("sage.all", should_load=False),
+        "np": np,
+        "pd": pd,
+        "image": get_module("PIL.Image", should_load=False),
+    }
+    cleaned = clean_to_json_compatible(
+        fig_dict, numpy_allowed=True, datetime_allowed=True, modules=modules
+    )
+    return orjson.dumps(cleaned, option=opts).decode("utf8")
+
+
+def make_figures(n):
+    rng = np.random.default_rng(0)
+    y = rng.standard_normal(n)
+    dates = pd.Series(pd.date_range("2020-01-01", periods=n, freq="s"))
+    mixed = {
+        "data": [
+            {"type": "scatter", "x": dates, "y": y},
+            {"type": "scatter", "y": [decimal.Decimal(i) / 100 for i in range(n)]},
+            {
+                "type": "scatter",
+                "y": y,
+                "text": np.array(["point %d" % i for i in range(n)], dtype=object),
+            },
+        ],
+        "layout": {"title": {"text": "mixed"}},
+    }
+    numeric = {
+        "data": [{"type": "scatter", "x": np.arange(n), "y": y} for _ in range(3)],
+        "layout": {"title": {"text": "numeric"}},
+    }
+    return {"mixed": mixed, "numeric": numeric}
+
+
+def best_time(fn, value, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(value)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--points", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("{:<10}{:>16}{:>16}".format("figure", "cleaning pass", "default hook"))
+    for name, fig_dict in make_figures(args.points).items():
+        assert to_json_cleaning_pass(fig_dict) == to_json_plotly(
+            fig_dict, engine="orjson"
+        )
+        old = best_time(to_json_cleaning_pass, fig_dict, args.repeat)
+        new = best_time(
+            lambda v: to_json_plotly(v, engine="orjson"), fig_dict, args.repeat
+        )
+        print("{:<10}{:>15.2f}s{:>15.2f}s".format(name, old, new))
+
+
+if __name__ == "__main__":
+    main()